@@ -2,7 +2,12 @@ import discord
 from discord.ext import commands
 import asyncio
 import logging
-from config import BOT_TOKEN, COMMAND_PREFIX, BOT_DESCRIPTION
+import re
+import signal
+import time
+import aiohttp
+from collections import deque
+from config import BOT_TOKEN, COMMAND_PREFIX, BOT_DESCRIPTION, SYNC_COMMANDS, HTTP_TIMEOUT, HTTP_LIMIT, HTTP_LIMIT_PER_HOST
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -12,11 +17,88 @@ intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True
 
+# Track Discord's rate-limit headers for member and message routes so background jobs can pace themselves
+rate_limits = {}  # ('members', guild_id) / ('messages' or 'send', channel_id) -> {'remaining', 'limit', 'reset_after', 'seen_at'}
+MEMBER_ROUTE = re.compile(r'/guilds/(\d+)/members/')
+MESSAGES_ROUTE = re.compile(r'/channels/(\d+)/messages$')
+
+async def on_discord_response(session, trace_ctx, params):
+    remaining = params.response.headers.get('X-RateLimit-Remaining')
+    if remaining is None:
+        return
+    match = MEMBER_ROUTE.search(params.url.path)
+    route = 'members'
+    if not match:
+        match = MESSAGES_ROUTE.search(params.url.path)
+        route = 'messages' if params.method == 'GET' else 'send'
+    if not match:
+        return
+    rate_limits[(route, int(match.group(1)))] = {
+        'remaining': int(remaining),
+        'limit': int(params.response.headers.get('X-RateLimit-Limit', 0)),
+        'reset_after': float(params.response.headers.get('X-RateLimit-Reset-After', 0)),
+        'seen_at': time.monotonic()
+    }
+
+rate_limit_trace = aiohttp.TraceConfig()
+rate_limit_trace.on_request_end.append(on_discord_response)
+
+# Latency of external API calls made through bot.http_session, per host
+http_latency = {}  # host -> deque of recent request durations in seconds
+
+async def on_api_request_start(session, trace_ctx, params):
+    trace_ctx.started = time.monotonic()
+
+async def on_api_request_end(session, trace_ctx, params):
+    http_latency.setdefault(params.url.host, deque(maxlen=50)).append(time.monotonic() - trace_ctx.started)
+
+api_latency_trace = aiohttp.TraceConfig()
+api_latency_trace.on_request_start.append(on_api_request_start)
+api_latency_trace.on_request_end.append(on_api_request_end)
+
 bot = commands.Bot(
     command_prefix=COMMAND_PREFIX,
     description=BOT_DESCRIPTION,
-    intents=intents
+    intents=intents,
+    http_trace=rate_limit_trace
 )
+bot.rate_limits = rate_limits
+bot.http_latency = http_latency
+bot.http_session = None  # Shared pooled client for external APIs, opened in setup_hook
+
+@bot.event
+async def setup_hook():
+    # One keep-alive connection pool for every cog's external API calls
+    bot.http_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=HTTP_LIMIT, limit_per_host=HTTP_LIMIT_PER_HOST, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT),
+        headers={'User-Agent': 'Discord Bot'},
+        trace_configs=[api_latency_trace]
+    )
+
+    # Syncing is rate limited and only needed when slash commands change (e.g. /searchgame, /lfg),
+    # so it runs on request: SYNC_COMMANDS=1 in the environment, or !sync
+    if SYNC_COMMANDS:
+        synced = await bot.tree.sync()
+        print(f'Synced {len(synced)} slash commands')
+
+@bot.command(name='sync', hidden=True)
+@commands.is_owner()
+async def sync_commands(ctx, scope: str = None):
+    """Register slash commands with Discord (Bot owner only)
+    Usage: !sync (global, can take up to an hour) or !sync here (this server, instant)"""
+    if scope == 'here':
+        bot.tree.copy_global_to(guild=ctx.guild)
+        synced = await bot.tree.sync(guild=ctx.guild)
+        await ctx.send(f"✅ Synced {len(synced)} slash commands to this server!")
+    else:
+        synced = await bot.tree.sync()
+        await ctx.send(f"✅ Synced {len(synced)} slash commands globally! They may take a while to appear.")
+
+@sync_commands.error
+async def sync_commands_error(ctx, error):
+    if isinstance(error, commands.NotOwner):
+        await ctx.send("❌ Only the bot owner can sync slash commands!")
 
 @bot.event
 async def on_ready():
@@ -46,7 +128,7 @@ async def on_command_error(ctx, error):
 
 # Load cogs
 async def load_cogs():
-    cogs = ['cogs.games', 'cogs.group_finder', 'cogs.integrations', 'cogs.economy', 'cogs.admin', 'cogs.quotes', 'cogs.welcome', 'cogs.bump_reminder', 'cogs.audit_log', 'cogs.phrase_tracker', 'cogs.role_system', 'cogs.insult_system']
+    cogs = ['cogs.message_expiry', 'cogs.message_router', 'cogs.response_throttle', 'cogs.games', 'cogs.group_finder', 'cogs.integrations', 'cogs.economy', 'cogs.admin', 'cogs.quotes', 'cogs.welcome', 'cogs.bump_reminder', 'cogs.audit_log', 'cogs.phrase_tracker', 'cogs.role_system', 'cogs.insult_system']
     for cog in cogs:
         try:
             await bot.load_extension(cog)
@@ -56,7 +138,21 @@ async def load_cogs():
 
 async def main():
     await load_cogs()
-    await bot.start(BOT_TOKEN)
+
+    # Hosts stop the bot with SIGTERM; shut down the same way as Ctrl-C
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, lambda: asyncio.create_task(bot.close()))
+    except NotImplementedError:
+        pass  # No signal handlers on Windows event loops
+
+    try:
+        await bot.start(BOT_TOKEN)
+    finally:
+        # close() unloads every cog so their cog_unload flushes buffered hits and pending saves.
+        # The HTTP session goes last, since those flushes may still use it
+        await bot.close()
+        if bot.http_session:
+            await bot.http_session.close()
 
 if __name__ == '__main__':
     asyncio.run(main())
\ No newline at end of file
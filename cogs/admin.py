@@ -412,13 +412,13 @@ class Admin(commands.Cog):
         else:
             print("ℹ️ No leaderboard panels found to restart")
     
-    async def auto_delete_message(self, message, delay):
+    def auto_delete_message(self, message, delay):
         """Auto-delete a message after a delay"""
-        await asyncio.sleep(delay)
-        try:
-            await message.delete()
-        except discord.NotFound:
-            pass  # Message already deleted
+        expiry = self.bot.get_cog('MessageExpiry')
+        if expiry:
+            expiry.schedule(message, delay)
+        else:
+            asyncio.create_task(message.delete(delay=delay))
 
     @commands.command(name='adminpanel')
     @commands.has_permissions(administrator=True)
@@ -678,7 +678,7 @@ class Admin(commands.Cog):
         # Define command categorization
         economy_commands = ['balance', 'bal', 'daily', 'gift', 'pay', 'leaderboard', 'lb', 'top', 'welcomestatus', 'ws', 'bumpstats', 'bs', 'auditstatus', 'as']
         gambling_commands = ['gamble', 'bet', 'roll', 'coinflip', 'cf', 'blackjack', 'bj', 'slots', 'slot', 'gamblingchannels', 'gc']
-        game_finder_commands = ['searchgame', 'sg', 'lfg', 'mygames', 'removegame', 'rg', 'lfginfo']
+        game_finder_commands = ['searchgame', 'sg', 'lfg', 'leavelfg', 'mygames', 'removegame', 'rg', 'lfginfo']
         admin_commands = [
             # Administrator permission commands
             'adminpanel', 'give', 'setbalance', 'economyreset',
@@ -693,7 +693,7 @@ class Admin(commands.Cog):
             'setbumpchannel', 'sbc', 'togglebumpreminder', 'tbr',
             'setbumpreward', 'sbr', 'setbumprole', 'sbro', 'manualbump', 'mb',
             'setauditchannel', 'sac', 'toggleaudit', 'ta', 'auditconfig', 'ac',
-            'cleanupeconomy', 'ce', 'economystats', 'es', 'toggleautocleanup', 'tac'
+            'cleanupeconomy', 'ce', 'economystats', 'es', 'toggleautocleanup', 'tac', 'httpstats', 'listenerstats', 'autolimit'
         ]
         
         # Get all commands from all cogs
@@ -804,7 +804,7 @@ class Admin(commands.Cog):
         confirm_msg = await ctx.send(embed=confirm_embed)
         
         # Auto-delete confirmation after 10 seconds
-        asyncio.create_task(self.auto_delete_message(confirm_msg, 10))
+        self.auto_delete_message(confirm_msg, 10)
 
     async def create_commands_embeds(self, user, include_admin=False):
         """Create multiple command embeds to avoid truncation"""
@@ -961,7 +961,7 @@ class Admin(commands.Cog):
         confirm_msg = await ctx.send(embed=confirm_embed)
         
         # Auto-delete confirmation after 10 seconds
-        asyncio.create_task(self.auto_delete_message(confirm_msg, 10))
+        self.auto_delete_message(confirm_msg, 10)
 
     @commands.command(name='updatecommandspanel')
     @commands.has_permissions(administrator=True)
@@ -1012,7 +1012,7 @@ class Admin(commands.Cog):
             confirm_msg = await ctx.send(embed=confirm_embed)
             
             # Auto-delete confirmation
-            asyncio.create_task(self.auto_delete_message(confirm_msg, 5))
+            self.auto_delete_message(confirm_msg, 5)
             
         except Exception as e:
             await ctx.send(f"❌ Error updating commands panel: {str(e)}\nUse `!setupcommandspanel` to create a new one.")
@@ -1067,7 +1067,7 @@ class Admin(commands.Cog):
         confirm_msg = await ctx.send(embed=confirm_embed)
         
         # Auto-delete confirmation after 10 seconds
-        asyncio.create_task(self.auto_delete_message(confirm_msg, 10))
+        self.auto_delete_message(confirm_msg, 10)
 
     async def create_leaderboard_embed(self, economy_cog):
         """Create the leaderboard embed"""
@@ -1378,6 +1378,62 @@ class Admin(commands.Cog):
         
         await ctx.send(embed=embed)
 
+    @commands.command(name='httpstats')
+    @commands.has_permissions(administrator=True)
+    async def http_stats(self, ctx):
+        """Show latency of external API calls per host (Admin only)"""
+        latency = getattr(self.bot, 'http_latency', {})
+        if not latency:
+            await ctx.send("📊 No external API calls made yet!")
+            return
+        
+        embed = discord.Embed(
+            title="🌐 External API Latency",
+            color=COLORS['info']
+        )
+        
+        for host, samples in sorted(latency.items()):
+            ordered = sorted(samples)
+            embed.add_field(
+                name=host,
+                value=f"**Calls:** {len(samples)} recent\n**Median:** {ordered[len(ordered) // 2] * 1000:.0f}ms\n**Slowest:** {ordered[-1] * 1000:.0f}ms\n**Last:** {samples[-1] * 1000:.0f}ms",
+                inline=True
+            )
+        
+        session = getattr(self.bot, 'http_session', None)
+        if session and not session.closed:
+            connector = session.connector
+            embed.set_footer(text=f"Connection pool: {connector.limit} max, {connector.limit_per_host} per host")
+        
+        await ctx.send(embed=embed)
+
+    @commands.command(name='listenerstats')
+    @commands.has_permissions(administrator=True)
+    async def listener_stats(self, ctx):
+        """Show time spent in each message listener (Admin only)"""
+        router = self.bot.get_cog('MessageRouter')
+        if not router or not router.listeners:
+            await ctx.send("📊 No message listeners registered!")
+            return
+        
+        embed = discord.Embed(
+            title="📨 Message Listener Timing",
+            description=f"**{router.stats['routed']}** of **{router.stats['messages']}** guild messages needed a listener",
+            color=COLORS['info']
+        )
+        
+        for name, listener in router.listeners.items():
+            stats = listener['stats']
+            average = stats['total_time'] / stats['calls'] if stats['calls'] else 0
+            guilds = "All servers" if router.global_interest & listener['bit'] else f"{sum(1 for mask in router.guild_interest.values() if mask & listener['bit'])} server(s)"
+            embed.add_field(
+                name=name,
+                value=f"**Calls:** {stats['calls']}\n**Average:** {average * 1000:.2f}ms\n**Slowest:** {stats['max_time'] * 1000:.0f}ms\n**Errors:** {stats['errors']}\n**Listening in:** {guilds}",
+                inline=True
+            )
+        
+        await ctx.send(embed=embed)
+
     @commands.command(name='toggleautocleanup', aliases=['tac'])
     @commands.has_permissions(administrator=True)
     async def toggle_auto_cleanup(self, ctx):
@@ -1419,14 +1475,6 @@ class Admin(commands.Cog):
         
         await ctx.send(embed=embed)
 
-    async def auto_delete_message(self, message, delay):
-        """Auto-delete message after delay"""
-        try:
-            await asyncio.sleep(delay)
-            await message.delete()
-        except:
-            pass
-
     @setup_commands_panel.error
     @setup_leaderboard.error
     async def panel_setup_error(self, ctx, error):
@@ -1443,6 +1491,8 @@ class Admin(commands.Cog):
     @cleanup_economy_command.error
     @economy_stats_detailed.error
     @toggle_auto_cleanup.error
+    @http_stats.error
+    @listener_stats.error
     async def admin_error(self, ctx, error):
         if isinstance(error, commands.MissingPermissions):
             await ctx.send("❌ You need administrator permissions to use this command!")
@@ -2,8 +2,14 @@ import discord
 from discord.ext import commands
 import json
 import os
+import time
+import asyncio
+from collections import deque
 from datetime import datetime
-from config import COLORS
+from config import COLORS, AUDIT_FLUSH_INTERVAL, AUDIT_QUEUE_LIMIT
+
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
 
 class AuditLog(commands.Cog):
     def __init__(self, bot):
@@ -11,6 +17,13 @@ class AuditLog(commands.Cog):
         self.data_file = 'data/audit_log.json'
         self.settings = self.load_settings()
 
+        # Outbound queues per audit channel, packed into multi-embed messages
+        self.audit_queues = {}  # channel_id -> deque of embeds
+        self.audit_flushers = {}  # channel_id -> task draining that queue
+        self.audit_full = {}  # channel_id -> event set when a full message is waiting
+        self.audit_dropped = {}  # channel_id -> events dropped since the last send
+        self.audit_stats = {'queued': 0, 'messages': 0, 'embeds': 0, 'dropped': 0}
+
     def load_settings(self):
         """Load audit log settings from JSON file"""
         if not os.path.exists('data'):
@@ -45,8 +58,32 @@ class AuditLog(commands.Cog):
             self.save_settings()
         return self.settings[guild_key]
 
+    async def cog_unload(self):
+        """Clean up when cog is unloaded, sending audit events that are still queued"""
+        flushers = list(self.audit_flushers.values())
+        for task in flushers:
+            task.cancel()
+        await asyncio.gather(*flushers, return_exceptions=True)
+        try:
+            await asyncio.wait_for(self.drain_audit_queues(), 10)
+        except asyncio.TimeoutError:
+            print("Gave up sending queued audit log events on unload")
+
+    async def drain_audit_queues(self):
+        """Send every queued audit embed straight away, without waiting for bursts to gather"""
+        for channel_id in list(self.audit_queues):
+            channel = self.bot.get_channel(channel_id)
+            while channel and (self.audit_queues[channel_id] or self.audit_dropped.get(channel_id)):
+                await self.wait_for_send_bucket(channel_id)
+                try:
+                    await channel.send(embeds=self.pack_audit_embeds(channel_id))
+                except discord.HTTPException as e:
+                    print(f"Failed to send audit log batch to channel {channel_id}: {e}")
+                    break
+            self.audit_queues.pop(channel_id, None)
+
     async def send_audit_log(self, guild, embed):
-        """Send an audit log embed to the configured channel"""
+        """Queue an audit log embed for the configured channel"""
         settings = self.get_guild_settings(guild.id)
         
         if not settings['enabled'] or not settings['audit_channel']:
@@ -56,10 +93,89 @@ class AuditLog(commands.Cog):
         if not channel:
             return
         
+        queue = self.audit_queues.setdefault(channel.id, deque())
+        if len(queue) >= AUDIT_QUEUE_LIMIT:
+            # A raid shouldn't grow memory without bound; report how many were lost instead
+            self.audit_dropped[channel.id] = self.audit_dropped.get(channel.id, 0) + 1
+            self.audit_stats['dropped'] += 1
+            return
+        
+        queue.append(embed)
+        self.audit_stats['queued'] += 1
+        
+        if channel.id not in self.audit_flushers:
+            self.audit_full[channel.id] = asyncio.Event()
+            self.audit_flushers[channel.id] = asyncio.create_task(self.flush_audit_queue(channel.id))
+        if len(queue) >= MAX_EMBEDS_PER_MESSAGE:
+            self.audit_full[channel.id].set()
+
+    def pack_audit_embeds(self, channel_id):
+        """Take as many queued embeds as fit in one message"""
+        queue = self.audit_queues[channel_id]
+        batch = []
+        size = 0
+        
+        dropped = self.audit_dropped.pop(channel_id, 0)
+        if dropped:
+            notice = discord.Embed(
+                title="⚠️ Audit Events Dropped",
+                description=f"{dropped} event(s) were dropped because too many happened at once.",
+                color=COLORS['warning']
+            )
+            batch.append(notice)
+            size += len(notice)
+        
+        while queue and len(batch) < MAX_EMBEDS_PER_MESSAGE:
+            if batch and size + len(queue[0]) > MAX_EMBED_CHARS_PER_MESSAGE:
+                break
+            embed = queue.popleft()
+            batch.append(embed)
+            size += len(embed)
+        return batch
+
+    async def wait_for_send_bucket(self, channel_id):
+        """Sleep out the channel's send rate limit bucket if it is empty"""
+        info = getattr(self.bot, 'rate_limits', {}).get(('send', channel_id))
+        if not info:
+            return
+        age = time.monotonic() - info['seen_at']
+        if info['remaining'] <= 0 and age < info['reset_after']:
+            await asyncio.sleep(info['reset_after'] - age)
+
+    async def flush_audit_queue(self, channel_id):
+        """Drain one audit channel's queue, up to 10 embeds per message"""
+        queue = self.audit_queues[channel_id]
+        full = self.audit_full[channel_id]
         try:
-            await channel.send(embed=embed)
-        except discord.Forbidden:
-            pass  # No permission to send messages
+            while queue or self.audit_dropped.get(channel_id):
+                # Give a burst a moment to gather, unless a full message is already waiting
+                if len(queue) < MAX_EMBEDS_PER_MESSAGE:
+                    full.clear()
+                    try:
+                        await asyncio.wait_for(full.wait(), AUDIT_FLUSH_INTERVAL)
+                    except asyncio.TimeoutError:
+                        pass
+                
+                channel = self.bot.get_channel(channel_id)
+                if channel is None:
+                    queue.clear()  # Audit channel was deleted
+                    break
+                
+                await self.wait_for_send_bucket(channel_id)
+                batch = self.pack_audit_embeds(channel_id)
+                try:
+                    await channel.send(embeds=batch)
+                    self.audit_stats['messages'] += 1
+                    self.audit_stats['embeds'] += len(batch)
+                except discord.Forbidden:
+                    pass  # No permission to send messages
+                except discord.HTTPException as e:
+                    print(f"Failed to send audit log batch to channel {channel_id}: {e}")
+        finally:
+            del self.audit_flushers[channel_id]
+            self.audit_full.pop(channel_id, None)
+            if not queue:
+                self.audit_queues.pop(channel_id, None)
 
     # Message Events
     @commands.Cog.listener()
@@ -772,6 +888,12 @@ class AuditLog(commands.Cog):
                 inline=True
             )
         
+        embed.add_field(
+            name="📦 Delivery",
+            value=f"**Events sent:** {self.audit_stats['embeds']} in {self.audit_stats['messages']} message(s)\n**Queued now:** {sum(len(queue) for queue in self.audit_queues.values())}\n**Dropped:** {self.audit_stats['dropped']}",
+            inline=False
+        )
+        
         embed.add_field(
             name="🔧 Management Commands",
             value=(
@@ -47,8 +47,16 @@ class BumpReminder(commands.Cog):
             self.save_settings()
         return self.settings[guild_key]
 
-    @commands.Cog.listener()
-    async def on_message(self, message):
+    async def cog_load(self):
+        """Called when the cog is loaded"""
+        # Bump confirmations come from Disboard (a bot) in any guild
+        router = self.bot.get_cog('MessageRouter')
+        if router:
+            router.register('BumpReminder', self.handle_message, bots=True, every_guild=True)
+        else:
+            print("⚠️ MessageRouter is not loaded - BumpReminder won't see any messages (load cogs.message_router before it)")
+
+    async def handle_message(self, message, context):
         """Listen for successful bump messages from Disboard"""
         if message.author.id != 302050872383242240:  # Disboard bot ID
             return
@@ -406,6 +414,9 @@ class BumpReminder(commands.Cog):
     def cog_unload(self):
         """Clean up when cog is unloaded"""
         self.bump_reminder_task.cancel()
+        router = self.bot.get_cog('MessageRouter')
+        if router:
+            router.unregister('BumpReminder')
 
 async def setup(bot):
     await bot.add_cog(BumpReminder(bot))
\ No newline at end of file
@@ -82,15 +82,13 @@ class Economy(commands.Cog):
         else:
             return f"{', '.join(channels[:-1])}, or {channels[-1]}"
     
-    async def auto_delete_message(self, message, delay):
+    def auto_delete_message(self, message, delay):
         """Auto-delete a message after a delay"""
-        await asyncio.sleep(delay)
-        try:
-            await message.delete()
-        except discord.NotFound:
-            pass  # Message already deleted
-        except discord.Forbidden:
-            pass  # No permission to delete
+        expiry = self.bot.get_cog('MessageExpiry')
+        if expiry:
+            expiry.schedule(message, delay)
+        else:
+            asyncio.create_task(message.delete(delay=delay))
     
     async def send_gambling_error(self, ctx):
         """Send a gambling restriction error and delete both messages"""
@@ -112,36 +110,10 @@ class Economy(commands.Cog):
         # Send error message with mention
         error_message = await ctx.send(f"{ctx.author.mention}", embed=embed)
         
-        # Delete both messages after 30 seconds (if we have permission)
-        asyncio.create_task(self.delete_both_messages(ctx.message, error_message, 30))
+        # Delete both messages after 30 seconds (if we have permission); same channel, so one bulk delete
+        self.auto_delete_message(ctx.message, 30)
+        self.auto_delete_message(error_message, 30)
     
-    async def delete_both_messages(self, original_message, error_message, delay):
-        """Delete both the original command and error message after a delay"""
-        await asyncio.sleep(delay)
-        
-        # Delete original command message
-        try:
-            await original_message.delete()
-        except discord.NotFound:
-            pass  # Message already deleted
-        except discord.Forbidden:
-            # Bot doesn't have permission to delete user messages
-            # This is expected if bot lacks "Manage Messages" permission
-            pass
-        except Exception as e:
-            print(f"Unexpected error deleting original message: {e}")
-        
-        # Delete error message
-        try:
-            await error_message.delete()
-        except discord.NotFound:
-            pass  # Message already deleted
-        except discord.Forbidden:
-            # Bot doesn't have permission to delete its own message (very rare)
-            pass
-        except Exception as e:
-            print(f"Unexpected error deleting error message: {e}")
-
     def get_user_data(self, user_id):
         """Get or create user data"""
         user_id = str(user_id)
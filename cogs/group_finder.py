@@ -1,11 +1,257 @@
 import discord
+from discord import app_commands
 from discord.ext import commands
 import json
 import os
+import re
+import heapq
+import random
 import aiohttp
 import asyncio
+import time
+from typing import Optional
+from collections import Counter, OrderedDict, deque
 from datetime import datetime
-from config import COLORS
+from singleflight import SingleFlight
+from config import COLORS, GAME_SEARCH_CACHE_TTL, GAME_SEARCH_NEGATIVE_TTL, GAME_SEARCH_CACHE_SIZE, GAME_SEARCH_DISK_CACHE_SIZE
+from config import MAX_GROUP_SIZE, LFG_DEFAULT_GROUP_SIZE, LFG_QUEUE_TIMEOUT, LFG_VOICE_GRACE
+
+# Built-in titles so searches still work offline before any catalog is seeded
+FALLBACK_GAMES = [
+    {'id': 1, 'name': 'Rocket League', 'rating': 4.5, 'background_image': 'https://media.rawg.io/media/games/8cc/8cce7c0e99dcc43d66c8efd42f9d03e3.jpg', 'platforms': [{'platform': {'name': 'PC'}}, {'platform': {'name': 'PlayStation'}}]},
+    {'id': 2, 'name': 'Valorant', 'rating': 4.2, 'background_image': 'https://media.rawg.io/media/games/737/737ea5662211d2e0bbd6f5989189e4f1.jpg', 'platforms': [{'platform': {'name': 'PC'}}]},
+    {'id': 3, 'name': 'Apex Legends', 'rating': 4.3, 'background_image': 'https://media.rawg.io/media/games/b72/b7233d5d5b1e75e86bb860ccc7aeca85.jpg', 'platforms': [{'platform': {'name': 'PC'}}, {'platform': {'name': 'PlayStation'}}, {'platform': {'name': 'Xbox'}}]},
+    {'id': 4, 'name': 'Counter-Strike 2', 'rating': 4.1, 'background_image': 'https://media.rawg.io/media/games/736/73619bd336c894d6941d926bfd563946.jpg', 'platforms': [{'platform': {'name': 'PC'}}]},
+    {'id': 5, 'name': 'League of Legends', 'rating': 4.0, 'background_image': 'https://media.rawg.io/media/games/78d/78dfae12fb8c5b16cd78648553071e0a.jpg', 'platforms': [{'platform': {'name': 'PC'}}]},
+    {'id': 6, 'name': 'Fortnite', 'rating': 3.8, 'background_image': 'https://media.rawg.io/media/games/1f4/1f47a270b8f241e4676b14d39ec620f7.jpg', 'platforms': [{'platform': {'name': 'PC'}}, {'platform': {'name': 'PlayStation'}}, {'platform': {'name': 'Xbox'}}, {'platform': {'name': 'Nintendo Switch'}}]},
+    {'id': 7, 'name': 'Overwatch 2', 'rating': 3.9, 'background_image': 'https://media.rawg.io/media/games/34b/34b1f1850a1c06fd971bc6ab3ac0ce0e.jpg', 'platforms': [{'platform': {'name': 'PC'}}, {'platform': {'name': 'PlayStation'}}, {'platform': {'name': 'Xbox'}}, {'platform': {'name': 'Nintendo Switch'}}]},
+    {'id': 8, 'name': 'Call of Duty: Modern Warfare', 'rating': 4.0, 'background_image': 'https://media.rawg.io/media/games/120/1201a40e4364557b124392ee50317b99.jpg', 'platforms': [{'platform': {'name': 'PC'}}, {'platform': {'name': 'PlayStation'}}, {'platform': {'name': 'Xbox'}}]},
+    {'id': 9, 'name': 'Minecraft', 'rating': 4.4, 'background_image': 'https://media.rawg.io/media/games/b4e/b4e4c73d5aa4ec66bbf75375c4847a2b.jpg', 'platforms': [{'platform': {'name': 'PC'}}, {'platform': {'name': 'PlayStation'}}, {'platform': {'name': 'Xbox'}}, {'platform': {'name': 'Nintendo Switch'}}]},
+    {'id': 10, 'name': 'Among Us', 'rating': 3.7, 'background_image': 'https://media.rawg.io/media/games/e74/e74458058b35e01c1ae3feeb39a3f724.jpg', 'platforms': [{'platform': {'name': 'PC'}}, {'platform': {'name': 'Mobile'}}]},
+    {'id': 11, 'name': 'Fall Guys', 'rating': 3.6, 'background_image': 'https://media.rawg.io/media/games/5eb/5eb49eb2fa0738fdb5bacea557b1bc57.jpg', 'platforms': [{'platform': {'name': 'PC'}}, {'platform': {'name': 'PlayStation'}}, {'platform': {'name': 'Xbox'}}, {'platform': {'name': 'Nintendo Switch'}}]},
+    {'id': 12, 'name': 'Dota 2', 'rating': 4.1, 'background_image': 'https://media.rawg.io/media/games/6fc/6fcf4cd3b17c288821388e6085bb0fc9.jpg', 'platforms': [{'platform': {'name': 'PC'}}]},
+    {'id': 13, 'name': 'World of Warcraft', 'rating': 4.2, 'background_image': 'https://media.rawg.io/media/games/c4b/c4b0cab189e73432de3a250d8cf1c84e.jpg', 'platforms': [{'platform': {'name': 'PC'}}]},
+    {'id': 14, 'name': 'Destiny 2', 'rating': 4.0, 'background_image': 'https://media.rawg.io/media/games/34b/34b1f1850a1c06fd971bc6ab3ac0ce0e.jpg', 'platforms': [{'platform': {'name': 'PC'}}, {'platform': {'name': 'PlayStation'}}, {'platform': {'name': 'Xbox'}}]},
+    {'id': 15, 'name': 'Valheim', 'rating': 4.3, 'background_image': 'https://media.rawg.io/media/games/b29/b294fdd866dcdb643e7bab370a552855.jpg', 'platforms': [{'platform': {'name': 'PC'}}]}
+]
+
+class GameTitleIndex:
+    """In-memory game catalog with prefix-trie and trigram lookups"""
+
+    def __init__(self, catalog_file):
+        self.catalog_file = catalog_file
+        self.games = {}  # game id -> game data
+        self.titles = {}  # game id -> normalized title
+        self.trie = {}  # char -> child node; node[None] = ids of titles/words ending there
+        self.trigrams = {}  # trigram -> set of game ids
+        self.trigram_counts = {}  # game id -> number of trigrams in its title
+
+    @staticmethod
+    def normalize(text):
+        return ' '.join(re.sub(r'[^a-z0-9]+', ' ', text.lower()).split())
+
+    @staticmethod
+    def make_trigrams(title):
+        padded = f"  {title} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def load(self):
+        """Load the catalog from a JSON-lines file; later lines win"""
+        if not os.path.exists(self.catalog_file):
+            return
+        with open(self.catalog_file, 'r') as f:
+            for line in f:
+                try:
+                    self.add(json.loads(line))
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+
+    def record(self, games):
+        """Add games from an API response, appending new or changed ones to the catalog file"""
+        changed = [game for game in map(self.slim, games) if self.games.get(game['id']) != game]
+        for game in changed:
+            self.add(game)
+        if changed:
+            with open(self.catalog_file, 'a') as f:
+                for game in changed:
+                    f.write(json.dumps(game) + '\n')
+
+    @staticmethod
+    def slim(game):
+        return {
+            'id': game['id'],
+            'name': game['name'],
+            'rating': game.get('rating', 0),
+            'ratings_count': game.get('ratings_count', 0),
+            'background_image': game.get('background_image', ''),
+            'platforms': [{'platform': {'name': p['platform']['name']}} for p in game.get('platforms') or []]
+        }
+
+    def add(self, game):
+        game = self.slim(game)
+        game_id = game['id']
+        if game_id in self.titles:
+            self.remove(game_id)
+
+        title = self.normalize(game['name'])
+        self.games[game_id] = game
+        self.titles[game_id] = title
+
+        # Index every word start so "legends" finds "League of Legends"
+        words = title.split()
+        for i in range(len(words)):
+            node = self.trie
+            for char in ' '.join(words[i:]):
+                node = node.setdefault(char, {})
+            node.setdefault(None, set()).add(game_id)
+
+        grams = self.make_trigrams(title)
+        self.trigram_counts[game_id] = len(grams)
+        for gram in grams:
+            self.trigrams.setdefault(gram, set()).add(game_id)
+
+    def remove(self, game_id):
+        title = self.titles.pop(game_id)
+        self.games.pop(game_id, None)
+        self.trigram_counts.pop(game_id, None)
+        words = title.split()
+        for i in range(len(words)):
+            node = self.trie
+            for char in ' '.join(words[i:]):
+                node = node.get(char)
+                if node is None:
+                    break
+            else:
+                node.get(None, set()).discard(game_id)
+        for gram in self.make_trigrams(title):
+            self.trigrams.get(gram, set()).discard(game_id)
+
+    def prefix_ids(self, prefix, limit=200):
+        """Ids of titles with a word starting with prefix, shortest completions first"""
+        node = self.trie
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return set()
+
+        found = set()
+        queue = [node]
+        while queue and len(found) < limit:
+            next_queue = []
+            for current in queue:
+                found.update(current.get(None, ()))
+                next_queue.extend(child for char, child in current.items() if char is not None)
+            queue = next_queue
+        return found
+
+    def popularity(self, game_id):
+        game = self.games[game_id]
+        return (game.get('ratings_count') or 0, game.get('rating') or 0)
+
+    def score(self, game_id, query, grams=None, shared=0):
+        title = self.titles[game_id]
+        if title == query:
+            score = 100
+        elif title.startswith(query):
+            score = 90
+        elif f" {query}" in f" {title}":
+            score = 75
+        elif query in title:
+            score = 60
+        else:
+            score = 0
+
+        if grams:
+            similarity = shared / (len(grams) + self.trigram_counts[game_id] - shared)
+            if not score and similarity < 0.3:
+                return 0
+            score += similarity * 40
+
+        rating = self.games[game_id].get('rating') or 0
+        return score + min(rating * 2, 10)
+
+    def search(self, query, limit=25):
+        """Best matching games for a query, with no network access"""
+        query = self.normalize(query)
+        if not query:
+            return [self.games[game_id] for game_id in heapq.nlargest(limit, self.games, key=self.popularity)]
+
+        grams = self.make_trigrams(query)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self.trigrams.get(gram, ()))
+
+        candidates = self.prefix_ids(query) | set(shared)
+        scored = []
+        for game_id in candidates:
+            score = self.score(game_id, query, grams, shared[game_id])
+            if score:
+                scored.append((score, game_id))
+        return [self.games[game_id] for score, game_id in heapq.nlargest(limit, scored)]
+
+    def rank_titles(self, names, query, limit=25):
+        """Rank arbitrary titles (e.g. a member's games) against a query"""
+        query = self.normalize(query)
+        if not query:
+            return names[:limit]
+        grams = self.make_trigrams(query)
+        scored = []
+        for name in names:
+            title = self.normalize(name)
+            title_grams = self.make_trigrams(title)
+            shared = len(grams & title_grams)
+            similarity = shared / (len(grams) + len(title_grams) - shared)
+            if query in title or similarity >= 0.3:
+                scored.append((title.startswith(query), similarity, name))
+        scored.sort(reverse=True)
+        return [name for _, _, name in scored[:limit]]
+
+class CircuitBreaker:
+    """Fail fast while an upstream API is down, probing it again with jittered backoff"""
+
+    def __init__(self, failure_threshold=3, base_delay=30, max_delay=600):
+        self.failure_threshold = failure_threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.state = 'closed'
+        self.consecutive_failures = 0
+        self.open_count = 0  # Consecutive times opened, drives the backoff
+        self.retry_at = 0
+        self.probe_in_flight = False
+        self.recent_calls = deque(maxlen=10)  # (outcome, seconds taken)
+        self.short_circuited = 0
+
+    def allow(self):
+        """Whether a request may go out now"""
+        if self.state == 'open' and time.monotonic() >= self.retry_at:
+            self.state = 'half_open'
+        if self.state == 'closed':
+            return True
+        if self.state == 'half_open' and not self.probe_in_flight:
+            self.probe_in_flight = True  # Only one probe at a time
+            return True
+        self.short_circuited += 1
+        return False
+
+    def record_success(self, elapsed):
+        self.recent_calls.append(('ok', elapsed))
+        self.state = 'closed'
+        self.consecutive_failures = 0
+        self.open_count = 0
+        self.probe_in_flight = False
+
+    def record_failure(self, elapsed):
+        self.recent_calls.append(('error', elapsed))
+        self.consecutive_failures += 1
+        self.probe_in_flight = False
+        if self.state == 'half_open' or self.consecutive_failures >= self.failure_threshold:
+            delay = min(self.base_delay * 2 ** self.open_count, self.max_delay)
+            self.retry_at = time.monotonic() + delay * random.uniform(0.8, 1.2)
+            self.open_count += 1
+            self.state = 'open'
+
+    def retry_in(self):
+        return max(0, self.retry_at - time.monotonic()) if self.state == 'open' else 0
 
 class GameSearchView(discord.ui.View):
     def __init__(self, games, user_id):
@@ -98,11 +344,7 @@ class LFGPanelView(discord.ui.View):
             return
 
         # Get user's game roles
-        user_game_roles = []
-        for game_name_key, game_data in self.cog.game_roles[guild_key]['games'].items():
-            role = interaction.guild.get_role(game_data['role_id'])
-            if role and role in interaction.user.roles:
-                user_game_roles.append(game_data)
+        user_game_roles = self.cog.get_user_game_roles(interaction.guild, interaction.user)
 
         if not user_game_roles:
             await interaction.response.send_message("❌ You don't have any game roles! Use the Search Games button to add some!", ephemeral=True, delete_after=15)
@@ -119,7 +361,7 @@ class LFGPanelView(discord.ui.View):
         options = []
         for game_data in user_game_roles[:25]:  # Discord limit is 25 options
             role = interaction.guild.get_role(game_data['role_id'])
-            member_count = len(role.members) if role else 0
+            member_count = self.cog.get_role_member_count(role) if role else 0
             
             options.append(discord.SelectOption(
                 label=game_data['name'],
@@ -136,14 +378,7 @@ class LFGPanelView(discord.ui.View):
 
     @discord.ui.button(label='📋 My Games', style=discord.ButtonStyle.secondary, emoji='📋', custom_id='lfg_my_games')
     async def my_games_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        guild_key = str(interaction.guild.id)
-        user_game_roles = []
-        
-        if guild_key in self.cog.game_roles and 'games' in self.cog.game_roles[guild_key]:
-            for game_name, game_data in self.cog.game_roles[guild_key]['games'].items():
-                role = interaction.guild.get_role(game_data['role_id'])
-                if role and role in interaction.user.roles:
-                    user_game_roles.append(game_data)
+        user_game_roles = self.cog.get_user_game_roles(interaction.guild, interaction.user)
 
         if not user_game_roles:
             embed = discord.Embed(
@@ -163,7 +398,7 @@ class LFGPanelView(discord.ui.View):
 
         for game_data in user_game_roles[:10]:  # Limit to 10
             role = interaction.guild.get_role(game_data['role_id'])
-            member_count = len(role.members) if role else 0
+            member_count = self.cog.get_role_member_count(role) if role else 0
             embed.add_field(
                 name=game_data['name'],
                 value=f"👥 {member_count} members",
@@ -287,6 +522,13 @@ class LFGSelectView(discord.ui.View):
                 # LFG channel was deleted, use current channel
                 target_channel = interaction.channel
 
+        # Queue the user; a full queue becomes a group straight away
+        queue, group = self.cog.join_lfg_queue(interaction.guild, selected_game, interaction.user.id, None, target_channel)
+        if group:
+            await interaction.response.send_message("✅ Group found!", ephemeral=True, delete_after=5)
+            await self.cog.form_lfg_group(interaction.guild, queue, group)
+            return
+
         # Create LFG embed
         embed = discord.Embed(
             title="🔍 Looking for Group!",
@@ -294,8 +536,9 @@ class LFGSelectView(discord.ui.View):
             color=COLORS['primary']
         )
         embed.add_field(name="Game", value=selected_game['name'], inline=True)
-        embed.add_field(name="Players with Role", value=f"{len(role.members)}", inline=True)
-        embed.add_field(name="React to Join!", value="👋 React to show interest!", inline=False)
+        embed.add_field(name="Players with Role", value=f"{self.cog.get_role_member_count(role)}", inline=True)
+        embed.add_field(name="Group Size", value=f"{queue['size']} players", inline=True)
+        embed.add_field(name="React to Join!", value="👋 React to join the queue - a voice channel opens when the group is full!", inline=False)
         
         if selected_game.get('image'):
             embed.set_thumbnail(url=selected_game['image'])
@@ -307,6 +550,7 @@ class LFGSelectView(discord.ui.View):
         message = await target_channel.send(content=content, embed=embed)
         
         # Add reaction for people to join
+        self.cog.track_lfg_message(message.id, queue)
         await message.add_reaction("👋")
         
         # Respond to the interaction
@@ -320,14 +564,51 @@ class GroupFinder(commands.Cog):
         self.bot = bot
         self.data_file = 'data/game_roles.json'
         self.game_roles = self.load_game_roles()
-        self.pending_deletions_file = 'data/pending_deletions.json'
-        self.pending_deletions = self.load_pending_deletions()
+
+        # Reverse indexes for LFG lookups, built per guild on first use
+        self.game_role_index = {}  # guild_id -> {role_id: game_data}
+        self.member_game_roles = {}  # guild_id -> {member_id: set(role_ids)}
+
+        # Game search cache: in-memory LRU in front of a JSON file that survives restarts
+        self.search_cache_file = 'data/game_search_cache.json'
+        self.search_cache = OrderedDict()  # normalized query -> {'results', 'expires_at', 'negative'}
+        self.disk_search_cache = self.load_search_cache()
+        self.search_cache_save_task = None
+        self.search_cache_stats = {'hits': 0, 'disk_hits': 0, 'negative_hits': 0, 'misses': 0}
+        self.search_flight = SingleFlight()  # Identical searches in flight share one request
+        self.rawg_breaker = CircuitBreaker()
+
+        # LFG matchmaking: per-(guild, game) queues sharing one expiry heap and sleeper
+        self.lfg_queues = {}  # (guild_id, game_key) -> {'key', 'size', 'members': OrderedDict(member_id -> expires_at), ...}
+        self.lfg_queue_messages = {}  # LFG post message_id -> (guild_id, game_key)
+        self.lfg_timers = []  # heap of (due_at, kind, id, member_id, game_key)
+        self.lfg_wakeup = asyncio.Event()
+        self.lfg_timer_task = None
+        self.voice_channels_file = 'data/lfg_voice_channels.json'
+        self.temp_voice_channels = self.load_temp_voice_channels()
+
+        # Local title index: built-in titles, then the JSON-lines catalog (seed dump + every API result)
+        self.game_index = GameTitleIndex('data/game_catalog.jsonl')
+        for game in FALLBACK_GAMES:
+            self.game_index.add(game)
+        self.game_index.load()
     
     async def cog_load(self):
         """Called when the cog is loaded"""
         # Schedule startup tasks to run after bot is ready
         asyncio.create_task(self.startup_tasks())
 
+        # One sleeper for LFG queue expiry and empty voice channel checks
+        self.lfg_timer_task = asyncio.create_task(self.lfg_timer_sleeper())
+
+    def cog_unload(self):
+        """Clean up when cog is unloaded"""
+        if self.lfg_timer_task:
+            self.lfg_timer_task.cancel()
+        if self.search_cache_save_task and not self.search_cache_save_task.done():
+            self.search_cache_save_task.cancel()
+            self.save_search_cache()
+
     def load_game_roles(self):
         """Load game roles from JSON file"""
         if not os.path.exists('data'):
@@ -346,81 +627,13 @@ class GroupFinder(commands.Cog):
         with open(self.data_file, 'w') as f:
             json.dump(self.game_roles, f, indent=2)
     
-    def load_pending_deletions(self):
-        """Load pending deletions from JSON file"""
-        if not os.path.exists('data'):
-            os.makedirs('data')
-        
-        if os.path.exists(self.pending_deletions_file):
-            try:
-                with open(self.pending_deletions_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                return {}
-        return {}
-    
-    def save_pending_deletions(self):
-        """Save pending deletions to JSON file"""
-        with open(self.pending_deletions_file, 'w') as f:
-            json.dump(self.pending_deletions, f, indent=2)
-    
     def schedule_message_deletion(self, message, delay):
-        """Schedule a message for deletion with persistence"""
-        # Check if this is an ephemeral message (no guild context)
-        if not hasattr(message, 'guild') or message.guild is None:
-            # For ephemeral messages, just use regular auto-deletion
-            # Ephemeral messages are automatically cleaned up by Discord
-            asyncio.create_task(self.auto_delete_search(message, delay))
-            return
-        
-        # For regular messages, use persistent deletion system
-        import time
-        deletion_time = time.time() + delay
-        
-        key = f"{message.guild.id}_{message.channel.id}_{message.id}"
-        self.pending_deletions[key] = {
-            'guild_id': message.guild.id,
-            'channel_id': message.channel.id,
-            'message_id': message.id,
-            'deletion_time': deletion_time
-        }
-        self.save_pending_deletions()
-        
-        # Also create the async task for immediate handling
-        asyncio.create_task(self.auto_delete_search(message, delay))
-    
-    async def cleanup_pending_deletions(self):
-        """Clean up messages that should have been deleted during bot downtime"""
-        await self.bot.wait_until_ready()
-        import time
-        
-        current_time = time.time()
-        to_delete = []
-        
-        for key, deletion_data in self.pending_deletions.items():
-            if deletion_data['deletion_time'] <= current_time:
-                # This message should have been deleted
-                try:
-                    guild = self.bot.get_guild(deletion_data['guild_id'])
-                    if guild:
-                        channel = guild.get_channel(deletion_data['channel_id'])
-                        if channel:
-                            message = await channel.fetch_message(deletion_data['message_id'])
-                            await message.delete()
-                except:
-                    pass  # Message might already be deleted or channel/guild gone
-                
-                to_delete.append(key)
-        
-        # Remove processed deletions
-        for key in to_delete:
-            del self.pending_deletions[key]
-        
-        if to_delete:
-            self.save_pending_deletions()
-        
-        # Start continuous cleanup task
-        asyncio.create_task(self.continuous_cleanup())
+        """Schedule a message for deletion through the shared expiry service"""
+        expiry = self.bot.get_cog('MessageExpiry')
+        if expiry:
+            expiry.schedule(message, delay)
+        else:
+            asyncio.create_task(message.delete(delay=delay))
 
     def save_game_role(self, guild_id, game_data, role_id):
         """Save a game role mapping"""
@@ -443,6 +656,85 @@ class GroupFinder(commands.Cog):
         }
         self.save_game_roles()
 
+        # Register the role in the reverse index, seeding holders from the role once
+        if guild_id in self.game_role_index:
+            games = self.game_roles[guild_key]['games']
+            self.game_role_index[guild_id] = {data['role_id']: data for data in games.values()}
+            guild = self.bot.get_guild(guild_id)
+            role = guild.get_role(role_id) if guild else None
+            if role:
+                for member in role.members:
+                    self.member_game_roles[guild_id].setdefault(member.id, set()).add(role_id)
+
+    def build_game_role_index(self, guild):
+        """Build role_id -> game and member -> game role_ids indexes for a guild"""
+        games = self.game_roles.get(str(guild.id), {}).get('games', {})
+        role_index = {game_data['role_id']: game_data for game_data in games.values()}
+        game_role_ids = set(role_index)
+
+        member_index = {}
+        if game_role_ids:
+            for member in guild.members:
+                held = game_role_ids.intersection(role.id for role in member.roles)
+                if held:
+                    member_index[member.id] = held
+
+        self.game_role_index[guild.id] = role_index
+        self.member_game_roles[guild.id] = member_index
+
+    def get_user_game_roles(self, guild, member):
+        """Game data for every game role a member has, via the reverse index"""
+        if guild.id not in self.game_role_index:
+            self.build_game_role_index(guild)
+
+        role_index = self.game_role_index[guild.id]
+        held = self.member_game_roles[guild.id].get(member.id, set()) & role_index.keys()
+        return sorted((role_index[role_id] for role_id in held), key=lambda game_data: game_data['name'].lower())
+
+    def update_member_game_roles(self, guild_id, member_id, role_ids):
+        role_index = self.game_role_index.get(guild_id)
+        if role_index is None:
+            return
+        held = role_index.keys() & role_ids
+        if held:
+            self.member_game_roles[guild_id][member_id] = held
+        else:
+            self.member_game_roles[guild_id].pop(member_id, None)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before, after):
+        """Keep the member -> game roles index current"""
+        if before.roles != after.roles:
+            self.update_member_game_roles(after.guild.id, after.id, {role.id for role in after.roles})
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member):
+        self.update_member_game_roles(member.guild.id, member.id, {role.id for role in member.roles})
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member):
+        self.member_game_roles.get(member.guild.id, {}).pop(member.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role):
+        """Drop a deleted game role from the indexes"""
+        role_index = self.game_role_index.get(role.guild.id)
+        if role_index is None or role.id not in role_index:
+            return
+        del role_index[role.id]
+        members = self.member_game_roles[role.guild.id]
+        for member_id in [member_id for member_id, held in members.items() if role.id in held]:
+            members[member_id].discard(role.id)
+            if not members[member_id]:
+                del members[member_id]
+
+    def get_role_member_count(self, role):
+        """Member count for a role from RoleSystem's maintained index"""
+        role_system = self.bot.get_cog('RoleSystem')
+        if role_system:
+            return role_system.get_role_member_count(role)
+        return len(role.members)
+
     def get_lfg_channel(self, guild_id):
         """Get the LFG channel for a guild"""
         guild_key = str(guild_id)
@@ -462,81 +754,182 @@ class GroupFinder(commands.Cog):
             self.game_roles[guild_key]['lfg_channel'] = channel_id
         self.save_game_roles()
 
+    def load_search_cache(self):
+        """Load unexpired game searches from JSON file"""
+        if not os.path.exists('data'):
+            os.makedirs('data')
+
+        if os.path.exists(self.search_cache_file):
+            try:
+                with open(self.search_cache_file, 'r') as f:
+                    cache = json.load(f)
+                now = time.time()
+                return {key: entry for key, entry in cache.items() if entry['expires_at'] > now}
+            except (json.JSONDecodeError, KeyError, TypeError):
+                return {}
+        return {}
+
+    def save_search_cache(self):
+        """Save the newest GAME_SEARCH_DISK_CACHE_SIZE unexpired game searches to JSON file"""
+        now = time.time()
+        # Entries are kept in insertion order, so the oldest searches are dropped first
+        fresh = [(key, entry) for key, entry in self.disk_search_cache.items() if entry['expires_at'] > now]
+        self.disk_search_cache = dict(fresh[-GAME_SEARCH_DISK_CACHE_SIZE:])
+        with open(self.search_cache_file, 'w') as f:
+            json.dump(self.disk_search_cache, f, indent=2)
+
+    def queue_search_cache_save(self):
+        """Coalesce saves so a burst of searches is a single file write"""
+        if self.search_cache_save_task and not self.search_cache_save_task.done():
+            return
+
+        async def save_later():
+            await asyncio.sleep(5)
+            self.save_search_cache()
+
+        self.search_cache_save_task = asyncio.create_task(save_later())
+
+    def normalize_query(self, query):
+        return ' '.join(query.lower().split())
+
+    def get_cached_search(self, key):
+        """Look a search up in memory, then on disk. Returns None on a miss"""
+        now = time.time()
+        entry = self.search_cache.get(key)
+        if entry and entry['expires_at'] > now:
+            self.search_cache.move_to_end(key)
+            self.search_cache_stats['hits'] += 1
+        else:
+            entry = self.disk_search_cache.get(key)
+            if not entry or entry['expires_at'] <= now:
+                self.search_cache_stats['misses'] += 1
+                return None
+            self.remember_search(key, entry)
+            self.search_cache_stats['disk_hits'] += 1
+
+        if entry['negative']:
+            self.search_cache_stats['negative_hits'] += 1
+        return entry['results']
+
+    def get_stale_search(self, key):
+        """An expired, non-empty result still held in memory, if any"""
+        entry = self.search_cache.get(key)
+        if entry and not entry['negative']:
+            return entry['results']
+        return None
+
+    def remember_search(self, key, entry):
+        self.search_cache[key] = entry
+        self.search_cache.move_to_end(key)
+        while len(self.search_cache) > GAME_SEARCH_CACHE_SIZE:
+            self.search_cache.popitem(last=False)
+
+    def cache_search(self, key, results, negative):
+        """Store a search in both tiers; empty or failed lookups expire sooner"""
+        ttl = GAME_SEARCH_NEGATIVE_TTL if negative else GAME_SEARCH_CACHE_TTL
+        entry = {'results': results, 'expires_at': time.time() + ttl, 'negative': negative}
+        self.remember_search(key, entry)
+        self.disk_search_cache.pop(key, None)
+        self.disk_search_cache[key] = entry
+        self.queue_search_cache_save()
+
+    def get_search_cache_metrics(self):
+        stats = self.search_cache_stats
+        hits = stats['hits'] + stats['disk_hits']
+        lookups = hits + stats['misses']
+        return {
+            **stats,
+            'hit_ratio': hits / lookups if lookups else 0.0,
+            'memory_entries': len(self.search_cache),
+            'disk_entries': len(self.disk_search_cache)
+        }
+
     async def search_games(self, query):
-        """Search for games using RAWG API"""
+        """Search for games, serving repeat queries from the cache"""
+        key = self.normalize_query(query)
+        cached = self.get_cached_search(key)
+        if cached is not None:
+            return cached
+
+        return await self.search_flight.do(key, self.fetch_and_cache_games, key, query)
+
+    async def fetch_and_cache_games(self, key, query):
+        if not self.rawg_breaker.allow():
+            # RAWG is down: answer from stale cache or the local index without waiting on it
+            stale = self.get_stale_search(key)
+            return stale if stale is not None else self.get_mock_games(query)
+
+        started = time.monotonic()
         try:
-            async with aiohttp.ClientSession() as session:
-                url = "https://api.rawg.io/api/games"
-                from config import RAWG_API_KEY
-                
-                params = {
-                    'search': f'"{query}"',  # Use quotes for exact phrase matching
-                    'search_precise': 'true',
-                    'page_size': 15,  # Get more results to filter better
-                    'ordering': '-rating'
-                }
-                
-                # Add API key if available
-                if RAWG_API_KEY:
-                    params['key'] = RAWG_API_KEY
-                
-                # Add timeout and proper headers
-                headers = {
-                    'User-Agent': 'Discord Bot Game Search'
-                }
-                
-                timeout = aiohttp.ClientTimeout(total=10)
-                async with session.get(url, params=params, headers=headers, timeout=timeout) as response:
-                    print(f"API Response Status: {response.status}")  # Debug
-                    if response.status == 200:
-                        data = await response.json()
-                        results = data.get('results', [])
-                        print(f"Found {len(results)} games from API")  # Debug
-                        
-                        # Filter and rank results for better matching
-                        filtered_results = self.filter_and_rank_results(results, query)
-                        return filtered_results[:10]  # Return top 10 matches
-                    elif response.status == 401:
-                        print("API Key required or invalid - using fallback")  # Debug
-                        return self.get_mock_games(query)
-                    else:
-                        print(f"API Error: {response.status}")  # Debug
-                        return self.get_mock_games(query)
+            results = await self.fetch_games(query)
+        except asyncio.CancelledError:
+            self.rawg_breaker.probe_in_flight = False
+            raise
+        elapsed = time.monotonic() - started
+        if results is None:
+            self.rawg_breaker.record_failure(elapsed)
+            # Failed lookup: serve fallback data, but retry the API soon
+            results = self.get_mock_games(query)
+            self.cache_search(key, results, negative=True)
+        else:
+            self.rawg_breaker.record_success(elapsed)
+            self.cache_search(key, results, negative=not results)
+        return results
+
+    async def fetch_games(self, query):
+        """Search for games using RAWG API. Returns None if the API couldn't answer"""
+        try:
+            from config import RAWG_API_KEY, RAWG_API_URL
+            url = f"{RAWG_API_URL}/games"
+            
+            params = {
+                'search': f'"{query}"',  # Use quotes for exact phrase matching
+                'search_precise': 'true',
+                'page_size': 15,  # Get more results to filter better
+                'ordering': '-rating'
+            }
+            
+            # Add API key if available
+            if RAWG_API_KEY:
+                params['key'] = RAWG_API_KEY
+            
+            # Add timeout and proper headers
+            headers = {
+                'User-Agent': 'Discord Bot Game Search'
+            }
+            
+            timeout = aiohttp.ClientTimeout(total=10)
+            async with self.bot.http_session.get(url, params=params, headers=headers, timeout=timeout) as response:
+                print(f"API Response Status: {response.status}")  # Debug
+                if response.status == 200:
+                    data = await response.json()
+                    results = data.get('results', [])
+                    print(f"Found {len(results)} games from API")  # Debug
+                    self.game_index.record(results)
+                    
+                    # Filter and rank results for better matching
+                    filtered_results = self.filter_and_rank_results(results, query)
+                    return filtered_results[:10]  # Return top 10 matches
+                elif response.status == 401:
+                    print("API Key required or invalid - using fallback")  # Debug
+                    return None
+                else:
+                    print(f"API Error: {response.status}")  # Debug
+                    return None
         except Exception as e:
             print(f"Search error: {e}")  # Debug
-            # Fallback to mock data
-            return self.get_mock_games(query)
+            # Caller falls back to mock data
+            return None
 
     def get_mock_games(self, query):
-        """Fallback mock games for testing when API fails"""
-        mock_games = [
-            {'id': 1, 'name': 'Rocket League', 'rating': 4.5, 'background_image': 'https://media.rawg.io/media/games/8cc/8cce7c0e99dcc43d66c8efd42f9d03e3.jpg', 'platforms': [{'platform': {'name': 'PC'}}, {'platform': {'name': 'PlayStation'}}]},
-            {'id': 2, 'name': 'Valorant', 'rating': 4.2, 'background_image': 'https://media.rawg.io/media/games/737/737ea5662211d2e0bbd6f5989189e4f1.jpg', 'platforms': [{'platform': {'name': 'PC'}}]},
-            {'id': 3, 'name': 'Apex Legends', 'rating': 4.3, 'background_image': 'https://media.rawg.io/media/games/b72/b7233d5d5b1e75e86bb860ccc7aeca85.jpg', 'platforms': [{'platform': {'name': 'PC'}}, {'platform': {'name': 'PlayStation'}}, {'platform': {'name': 'Xbox'}}]},
-            {'id': 4, 'name': 'Counter-Strike 2', 'rating': 4.1, 'background_image': 'https://media.rawg.io/media/games/736/73619bd336c894d6941d926bfd563946.jpg', 'platforms': [{'platform': {'name': 'PC'}}]},
-            {'id': 5, 'name': 'League of Legends', 'rating': 4.0, 'background_image': 'https://media.rawg.io/media/games/78d/78dfae12fb8c5b16cd78648553071e0a.jpg', 'platforms': [{'platform': {'name': 'PC'}}]},
-            {'id': 6, 'name': 'Fortnite', 'rating': 3.8, 'background_image': 'https://media.rawg.io/media/games/1f4/1f47a270b8f241e4676b14d39ec620f7.jpg', 'platforms': [{'platform': {'name': 'PC'}}, {'platform': {'name': 'PlayStation'}}, {'platform': {'name': 'Xbox'}}, {'platform': {'name': 'Nintendo Switch'}}]},
-            {'id': 7, 'name': 'Overwatch 2', 'rating': 3.9, 'background_image': 'https://media.rawg.io/media/games/34b/34b1f1850a1c06fd971bc6ab3ac0ce0e.jpg', 'platforms': [{'platform': {'name': 'PC'}}, {'platform': {'name': 'PlayStation'}}, {'platform': {'name': 'Xbox'}}, {'platform': {'name': 'Nintendo Switch'}}]},
-            {'id': 8, 'name': 'Call of Duty: Modern Warfare', 'rating': 4.0, 'background_image': 'https://media.rawg.io/media/games/120/1201a40e4364557b124392ee50317b99.jpg', 'platforms': [{'platform': {'name': 'PC'}}, {'platform': {'name': 'PlayStation'}}, {'platform': {'name': 'Xbox'}}]},
-            {'id': 9, 'name': 'Minecraft', 'rating': 4.4, 'background_image': 'https://media.rawg.io/media/games/b4e/b4e4c73d5aa4ec66bbf75375c4847a2b.jpg', 'platforms': [{'platform': {'name': 'PC'}}, {'platform': {'name': 'PlayStation'}}, {'platform': {'name': 'Xbox'}}, {'platform': {'name': 'Nintendo Switch'}}]},
-            {'id': 10, 'name': 'Among Us', 'rating': 3.7, 'background_image': 'https://media.rawg.io/media/games/e74/e74458058b35e01c1ae3feeb39a3f724.jpg', 'platforms': [{'platform': {'name': 'PC'}}, {'platform': {'name': 'Mobile'}}]},
-            {'id': 11, 'name': 'Fall Guys', 'rating': 3.6, 'background_image': 'https://media.rawg.io/media/games/5eb/5eb49eb2fa0738fdb5bacea557b1bc57.jpg', 'platforms': [{'platform': {'name': 'PC'}}, {'platform': {'name': 'PlayStation'}}, {'platform': {'name': 'Xbox'}}, {'platform': {'name': 'Nintendo Switch'}}]},
-            {'id': 12, 'name': 'Dota 2', 'rating': 4.1, 'background_image': 'https://media.rawg.io/media/games/6fc/6fcf4cd3b17c288821388e6085bb0fc9.jpg', 'platforms': [{'platform': {'name': 'PC'}}]},
-            {'id': 13, 'name': 'World of Warcraft', 'rating': 4.2, 'background_image': 'https://media.rawg.io/media/games/c4b/c4b0cab189e73432de3a250d8cf1c84e.jpg', 'platforms': [{'platform': {'name': 'PC'}}]},
-            {'id': 14, 'name': 'Destiny 2', 'rating': 4.0, 'background_image': 'https://media.rawg.io/media/games/34b/34b1f1850a1c06fd971bc6ab3ac0ce0e.jpg', 'platforms': [{'platform': {'name': 'PC'}}, {'platform': {'name': 'PlayStation'}}, {'platform': {'name': 'Xbox'}}]},
-            {'id': 15, 'name': 'Valheim', 'rating': 4.3, 'background_image': 'https://media.rawg.io/media/games/b29/b294fdd866dcdb643e7bab370a552855.jpg', 'platforms': [{'platform': {'name': 'PC'}}]}
-        ]
-        
-        # Use the same filtering logic for mock games
-        filtered_results = self.filter_and_rank_results(mock_games, query)
+        """Fallback to the local game index when the API fails"""
+        results = self.game_index.search(query, 10)
         
-        # If no good matches, return top rated mock games
-        if not filtered_results:
-            # Sort by rating and return top games
-            sorted_games = sorted(mock_games, key=lambda x: x.get('rating', 0), reverse=True)
-            return sorted_games[:10]
+        # If no good matches, return top rated games
+        if not results:
+            return self.game_index.search('', 10)
         
-        return filtered_results[:10]
+        return results
 
     def filter_and_rank_results(self, results, query):
         """Filter and rank search results for better matching"""
@@ -597,7 +990,26 @@ class GroupFinder(commands.Cog):
             return False
         return any(word in text for word in query_words)
 
-    @commands.command(name='searchgame', aliases=['sg'])
+    async def game_title_autocomplete(self, interaction: discord.Interaction, current: str):
+        """Suggest titles from the local index; no network call so it answers instantly"""
+        return [
+            app_commands.Choice(name=game['name'][:100], value=game['name'][:100])
+            for game in self.game_index.search(current, 25)
+        ]
+
+    async def member_game_autocomplete(self, interaction: discord.Interaction, current: str):
+        """Suggest the member's own game roles that match what they've typed"""
+        if interaction.guild is None:
+            return []
+        names = [game_data['name'] for game_data in self.get_user_game_roles(interaction.guild, interaction.user)]
+        return [
+            app_commands.Choice(name=name[:100], value=name[:100])
+            for name in self.game_index.rank_titles(names, current)
+        ]
+
+    @commands.hybrid_command(name='searchgame', aliases=['sg'])
+    @commands.guild_only()
+    @app_commands.autocomplete(query=game_title_autocomplete)
     async def search_game(self, ctx, *, query: str):
         """Search for games and add their roles! Usage: !searchgame <game name>"""
         if len(query) < 2:
@@ -670,21 +1082,26 @@ class GroupFinder(commands.Cog):
         # Schedule auto-deletion with persistence
         self.schedule_message_deletion(response_msg, 60)
 
-    @commands.command(name='lfg')
-    async def looking_for_group(self, ctx, *, game_name: str = None):
-        """Look for group! Usage: !lfg [game name] or just !lfg to select from dropdown"""
+    @commands.hybrid_command(name='lfg')
+    @commands.guild_only()
+    @app_commands.autocomplete(game_name=member_game_autocomplete)
+    async def looking_for_group(self, ctx, *, game_name: str = None, size: Optional[int] = None):
+        """Look for group! Usage: !lfg [game name] [group size] or just !lfg for a dropdown"""
         guild_key = str(ctx.guild.id)
+
+        # /lfg has its own size option; typed !lfg may end in one: !lfg valorant 5
+        if game_name and size is None and ctx.interaction is None:
+            game_name, size = self.split_group_size(guild_key, game_name)
+        if size is not None and not 2 <= size <= MAX_GROUP_SIZE:
+            await ctx.send(f"❌ Group size must be between 2 and {MAX_GROUP_SIZE}!")
+            return
         
         if guild_key not in self.game_roles or 'games' not in self.game_roles[guild_key]:
             await ctx.send("❌ No game roles found! Use `!searchgame <game>` to create some first!")
             return
 
         # Get user's game roles
-        user_game_roles = []
-        for game_name_key, game_data in self.game_roles[guild_key]['games'].items():
-            role = ctx.guild.get_role(game_data['role_id'])
-            if role and role in ctx.author.roles:
-                user_game_roles.append(game_data)
+        user_game_roles = self.get_user_game_roles(ctx.guild, ctx.author)
 
         if not user_game_roles:
             embed = discord.Embed(
@@ -709,7 +1126,7 @@ class GroupFinder(commands.Cog):
             options = []
             for game_data in user_game_roles[:25]:  # Discord limit is 25 options
                 role = ctx.guild.get_role(game_data['role_id'])
-                member_count = len(role.members) if role else 0
+                member_count = self.get_role_member_count(role) if role else 0
                 
                 options.append(discord.SelectOption(
                     label=game_data['name'],
@@ -784,6 +1201,22 @@ class GroupFinder(commands.Cog):
             await ctx.send(embed=embed)
             return
 
+        # Determine where to send the message
+        target_channel = ctx.channel
+        if lfg_channel_id:
+            lfg_channel = ctx.guild.get_channel(lfg_channel_id)
+            if lfg_channel:
+                target_channel = lfg_channel
+
+        # Queue the user; a full queue becomes a group straight away
+        queue, group = self.join_lfg_queue(ctx.guild, game_data, ctx.author.id, size, target_channel)
+        if size and size != queue['size']:
+            # The size is fixed by whoever opened the queue
+            await ctx.send(f"ℹ️ A **{queue['size']}-player** {game_data['name']} queue is already open, so you joined that one instead of a {size}-player group.", delete_after=15)
+        if group:
+            await self.form_lfg_group(ctx.guild, queue, group)
+            return
+
         # Create LFG embed
         embed = discord.Embed(
             title="🔍 Looking for Group!",
@@ -791,45 +1224,271 @@ class GroupFinder(commands.Cog):
             color=COLORS['primary']
         )
         embed.add_field(name="Game", value=game_data['name'], inline=True)
-        embed.add_field(name="Players with Role", value=f"{len(role.members)}", inline=True)
-        embed.add_field(name="React to Join!", value="👋 React to show interest!", inline=False)
+        embed.add_field(name="Players with Role", value=f"{self.get_role_member_count(role)}", inline=True)
+        embed.add_field(name="Group Size", value=f"{queue['size']} players", inline=True)
+        embed.add_field(name="React to Join!", value="👋 React to join the queue - a voice channel opens when the group is full!", inline=False)
         
         if game_data.get('image'):
             embed.set_thumbnail(url=game_data['image'])
         
         embed.set_footer(text=f"LFG by {ctx.author.display_name}")
 
-        # Determine where to send the message
-        target_channel = ctx.channel
-        if lfg_channel_id:
-            lfg_channel = ctx.guild.get_channel(lfg_channel_id)
-            if lfg_channel:
-                target_channel = lfg_channel
-
         # Send the LFG message with role ping
         content = f"🎮 **LFG Alert!** {role.mention}"
         message = await target_channel.send(content=content, embed=embed)
         
         # Add reaction for people to join
+        self.track_lfg_message(message.id, queue)
         await message.add_reaction("👋")
         
         # If we sent to a different channel, let the user know
         if target_channel != ctx.channel:
             await ctx.send(f"✅ LFG posted in {target_channel.mention}!")
 
+    def load_temp_voice_channels(self):
+        """Load temporary LFG voice channels from JSON file"""
+        if not os.path.exists('data'):
+            os.makedirs('data')
+
+        if os.path.exists(self.voice_channels_file):
+            try:
+                with open(self.voice_channels_file, 'r') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError):
+                return {}
+        return {}
+
+    def save_temp_voice_channels(self):
+        """Save temporary LFG voice channels to JSON file"""
+        with open(self.voice_channels_file, 'w') as f:
+            json.dump(self.temp_voice_channels, f, indent=2)
+
+    def add_lfg_timer(self, due_at, kind, target_id, member_id=0, game_key=''):
+        heapq.heappush(self.lfg_timers, (due_at, kind, target_id, member_id, game_key))
+        if self.lfg_timers[0][0] == due_at:
+            self.lfg_wakeup.set()
+
+    def split_group_size(self, guild_key, game_name):
+        """Split a trailing group size off a typed game name. Returns (game name, size or None)
+
+        The number stays part of the name when the whole name is a game role
+        ("Overwatch 2"), or when it can't be a size and the rest isn't a game
+        role either ("Battlefield 2042").
+        """
+        games = self.game_roles.get(guild_key, {}).get('games', {})
+        parts = game_name.rsplit(' ', 1)
+        if len(parts) < 2 or not parts[1].isdigit() or ' '.join(game_name.lower().split()) in games:
+            return game_name, None
+        size = int(parts[1])
+        if 2 <= size <= MAX_GROUP_SIZE or ' '.join(parts[0].lower().split()) in games:
+            return parts[0], size
+        return game_name, None
+
+    def join_lfg_queue(self, guild, game_data, member_id, size, channel):
+        """Queue a member for a game. Returns (queue, member ids) - ids only once the group is full"""
+        game_key = game_data['name'].lower()
+        queue_key = (guild.id, game_key)
+        queue = self.lfg_queues.get(queue_key)
+        if queue is None:
+            # Whoever opens the queue picks the group size
+            queue = self.lfg_queues[queue_key] = {
+                'key': queue_key,
+                'game': game_data['name'],
+                'image': game_data.get('image', ''),
+                'size': size or LFG_DEFAULT_GROUP_SIZE,
+                'members': OrderedDict(),
+                'channel_id': channel.id,
+                'message_ids': set()
+            }
+
+        # Re-queueing refreshes the expiry; the old timer entry goes stale
+        expires_at = time.time() + LFG_QUEUE_TIMEOUT
+        queue['members'][member_id] = expires_at
+        queue['members'].move_to_end(member_id)
+        self.add_lfg_timer(expires_at, 'queue', guild.id, member_id, game_key)
+
+        if len(queue['members']) < queue['size']:
+            return queue, None
+
+        group = [queue['members'].popitem(last=False)[0] for _ in range(queue['size'])]
+        if not queue['members']:
+            self.drop_lfg_queue(queue)
+        return queue, group
+
+    def leave_lfg_queue(self, queue_key, member_id):
+        queue = self.lfg_queues.get(queue_key)
+        if queue is None or queue['members'].pop(member_id, None) is None:
+            return False
+        if not queue['members']:
+            self.drop_lfg_queue(queue)
+        return True
+
+    def track_lfg_message(self, message_id, queue):
+        """Let 👋 reactions on an LFG post join its queue"""
+        queue['message_ids'].add(message_id)
+        self.lfg_queue_messages[message_id] = queue['key']
+
+    def drop_lfg_queue(self, queue):
+        if self.lfg_queues.get(queue['key']) is queue:
+            del self.lfg_queues[queue['key']]
+        for message_id in queue['message_ids']:
+            self.lfg_queue_messages.pop(message_id, None)
+
+    async def form_lfg_group(self, guild, queue, member_ids):
+        """Announce a full group and open a temporary voice channel for it"""
+        game_name = queue['game']
+        channel = guild.get_channel(queue['channel_id'])
+
+        voice_channel = None
+        try:
+            voice_channel = await guild.create_voice_channel(
+                f"🎮 {game_name}",
+                category=channel.category if channel else None,
+                user_limit=len(member_ids),
+                reason=f"LFG group for {game_name}"
+            )
+            self.temp_voice_channels[str(voice_channel.id)] = {
+                'guild_id': guild.id,
+                'game': game_name,
+                'created_at': datetime.now().isoformat()
+            }
+            self.save_temp_voice_channels()
+            # Reap it if nobody ever joins
+            self.add_lfg_timer(time.time() + LFG_VOICE_GRACE, 'voice', voice_channel.id)
+        except discord.Forbidden:
+            print(f"Missing permission to create LFG voice channel in {guild.name}")
+        except discord.HTTPException as e:
+            # Still announce the group; they can pick a voice channel themselves
+            print(f"Error creating LFG voice channel in {guild.name}: {e}")
+
+        embed = discord.Embed(
+            title="🎉 Group Found!",
+            description=f"Your **{game_name}** group is ready!",
+            color=COLORS['success']
+        )
+        embed.add_field(name="👥 Players", value="\n".join([f"<@{member_id}>" for member_id in member_ids]), inline=True)
+        if voice_channel:
+            embed.add_field(name="🔊 Voice Channel", value=voice_channel.mention, inline=True)
+            embed.set_footer(text="The voice channel is removed once everyone leaves")
+        if queue['image']:
+            embed.set_thumbnail(url=queue['image'])
+
+        if channel:
+            await channel.send(content=" ".join([f"<@{member_id}>" for member_id in member_ids]), embed=embed)
+
+    async def reap_voice_channel(self, channel):
+        """Delete a temporary LFG voice channel once it's empty"""
+        if str(channel.id) not in self.temp_voice_channels or channel.members:
+            return
+        del self.temp_voice_channels[str(channel.id)]
+        self.save_temp_voice_channels()
+        try:
+            await channel.delete(reason="LFG group voice channel empty")
+        except discord.NotFound:
+            pass
+        except discord.Forbidden:
+            print(f"Missing permission to delete LFG voice channel {channel.name}")
+
+    async def lfg_timer_sleeper(self):
+        """Single task that expires queued players and checks idle group voice channels"""
+        await self.bot.wait_until_ready()
+
+        while True:
+            try:
+                self.lfg_wakeup.clear()
+                now = time.time()
+                while self.lfg_timers and self.lfg_timers[0][0] <= now:
+                    due_at, kind, target_id, member_id, game_key = heapq.heappop(self.lfg_timers)
+                    if kind == 'queue':
+                        queue = self.lfg_queues.get((target_id, game_key))
+                        # Skip stale timers for players who left or re-queued
+                        if queue and queue['members'].get(member_id) == due_at:
+                            self.leave_lfg_queue((target_id, game_key), member_id)
+                    elif kind == 'voice':
+                        channel = self.bot.get_channel(target_id)
+                        if channel:
+                            await self.reap_voice_channel(channel)
+
+                timeout = self.lfg_timers[0][0] - time.time() if self.lfg_timers else None
+                try:
+                    await asyncio.wait_for(self.lfg_wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error in LFG timer sleeper: {e}")
+                await asyncio.sleep(60)
+
+    @commands.Cog.listener()
+    async def on_voice_state_update(self, member, before, after):
+        """Reap temporary LFG voice channels as soon as the last player leaves"""
+        if before.channel and before.channel != after.channel:
+            await self.reap_voice_channel(before.channel)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        if self.temp_voice_channels.pop(str(channel.id), None):
+            self.save_temp_voice_channels()
+
+    @commands.Cog.listener()
+    async def on_raw_reaction_add(self, payload):
+        """👋 on an LFG post joins its queue"""
+        queue_key = self.lfg_queue_messages.get(payload.message_id)
+        if not queue_key or str(payload.emoji) != "👋" or not payload.member or payload.member.bot:
+            return
+
+        queue = self.lfg_queues[queue_key]
+        guild = payload.member.guild
+
+        # Same rule as !lfg: only players with the game role can join
+        game_data = self.game_roles.get(str(guild.id), {}).get('games', {}).get(queue_key[1])
+        role = guild.get_role(game_data['role_id']) if game_data else None
+        if role is None or role not in payload.member.roles:
+            channel = guild.get_channel(payload.channel_id)
+            if channel:
+                try:
+                    message = channel.get_partial_message(payload.message_id)
+                    await message.remove_reaction(payload.emoji, payload.member)
+                    await channel.send(f"❌ {payload.member.mention}, you need the **{queue['game']}** role to join this group!", delete_after=10)
+                except discord.HTTPException:
+                    pass
+            return
+
+        queue, group = self.join_lfg_queue(guild, game_data, payload.member.id, None, guild.get_channel(queue['channel_id']))
+        if group:
+            await self.form_lfg_group(guild, queue, group)
+
+    @commands.Cog.listener()
+    async def on_raw_reaction_remove(self, payload):
+        """Removing 👋 leaves the queue"""
+        queue_key = self.lfg_queue_messages.get(payload.message_id)
+        if queue_key and str(payload.emoji) == "👋":
+            self.leave_lfg_queue(queue_key, payload.user_id)
+
     async def startup_tasks(self):
         """Run startup tasks after bot is ready"""
         await self.bot.wait_until_ready()
         
         # Add a small delay to ensure Discord is fully ready
         await asyncio.sleep(2)
-        
-        # Start cleanup task for pending deletions
-        asyncio.create_task(self.cleanup_pending_deletions())
+
+        # Build LFG reverse indexes from the member cache once
+        for guild in self.bot.guilds:
+            self.build_game_role_index(guild)
         
         # Re-register persistent views for LFG panels
         await self.restore_lfg_panels()
 
+        # Clean up group voice channels that emptied while we were offline
+        for channel_id in list(self.temp_voice_channels):
+            channel = self.bot.get_channel(int(channel_id))
+            if channel:
+                await self.reap_voice_channel(channel)
+            else:
+                del self.temp_voice_channels[channel_id]
+                self.save_temp_voice_channels()
+
     async def restore_lfg_panels(self):
         """Restore LFG panel views after bot restart"""
         
@@ -876,73 +1535,10 @@ class GroupFinder(commands.Cog):
                 except Exception as e:
                     print(f"Error restoring LFG panel for guild {guild_key}: {e}")
 
-    async def continuous_cleanup(self):
-        """Continuously check for messages to delete"""
-        import time
-        
-        while True:
-            try:
-                await asyncio.sleep(30)  # Check every 30 seconds
-                current_time = time.time()
-                to_delete = []
-                
-                for key, deletion_data in self.pending_deletions.items():
-                    if deletion_data['deletion_time'] <= current_time:
-                        try:
-                            guild = self.bot.get_guild(deletion_data['guild_id'])
-                            if guild:
-                                channel = guild.get_channel(deletion_data['channel_id'])
-                                if channel:
-                                    message = await channel.fetch_message(deletion_data['message_id'])
-                                    await message.delete()
-                        except:
-                            pass  # Message might already be deleted
-                        
-                        to_delete.append(key)
-                
-                # Also clean up very old entries (older than 1 hour) that might be stuck
-                one_hour_ago = current_time - 3600
-                for key, deletion_data in self.pending_deletions.items():
-                    if deletion_data['deletion_time'] < one_hour_ago:
-                        to_delete.append(key)
-                
-                # Remove processed deletions
-                for key in to_delete:
-                    if key in self.pending_deletions:
-                        del self.pending_deletions[key]
-                
-                if to_delete:
-                    self.save_pending_deletions()
-                    
-            except Exception as e:
-                print(f"Error in continuous cleanup: {e}")
-                await asyncio.sleep(60)  # Wait longer on error
-    
-    async def auto_delete_search(self, message, delay):
-        """Auto-delete search message after delay"""
-        try:
-            await asyncio.sleep(delay)
-            await message.delete()
-            
-            # Remove from pending deletions if successful
-            key = f"{message.guild.id}_{message.channel.id}_{message.id}"
-            if key in self.pending_deletions:
-                del self.pending_deletions[key]
-                self.save_pending_deletions()
-        except:
-            pass  # Message might already be deleted
-
     @commands.command(name='mygames')
     async def my_games(self, ctx):
         """Show all your game roles"""
-        user_game_roles = []
-        guild_key = str(ctx.guild.id)
-        
-        if guild_key in self.game_roles and 'games' in self.game_roles[guild_key]:
-            for game_name, game_data in self.game_roles[guild_key]['games'].items():
-                role = ctx.guild.get_role(game_data['role_id'])
-                if role and role in ctx.author.roles:
-                    user_game_roles.append(game_data)
+        user_game_roles = self.get_user_game_roles(ctx.guild, ctx.author)
 
         if not user_game_roles:
             embed = discord.Embed(
@@ -961,7 +1557,7 @@ class GroupFinder(commands.Cog):
 
         for game_data in user_game_roles[:10]:  # Limit to 10
             role = ctx.guild.get_role(game_data['role_id'])
-            member_count = len(role.members) if role else 0
+            member_count = self.get_role_member_count(role) if role else 0
             embed.add_field(
                 name=game_data['name'],
                 value=f"👥 {member_count} members\n🔔 `!lfg {game_data['name']}`",
@@ -971,6 +1567,29 @@ class GroupFinder(commands.Cog):
         embed.set_footer(text="Use !lfg <game> to find other players!")
         await ctx.send(embed=embed)
 
+    @commands.command(name='leavelfg')
+    async def leave_lfg(self, ctx, *, game_name: str = None):
+        """Leave LFG queues! Usage: !leavelfg [game name] (all queues if no game given)"""
+        left = []
+        for queue in list(self.lfg_queues.values()):
+            if queue['key'][0] != ctx.guild.id:
+                continue
+            if game_name and game_name.lower() not in queue['key'][1]:
+                continue
+            if self.leave_lfg_queue(queue['key'], ctx.author.id):
+                left.append(queue['game'])
+
+        if not left:
+            await ctx.send("❌ You're not in any matching LFG queue!")
+            return
+
+        embed = discord.Embed(
+            title="👋 Left LFG Queue",
+            description="\n".join([f"• {game}" for game in left]),
+            color=COLORS['success']
+        )
+        await ctx.send(embed=embed)
+
     @commands.command(name='removegame', aliases=['rg'])
     async def remove_game(self, ctx, *, game_name: str):
         """Remove a game role from yourself"""
@@ -1096,11 +1715,60 @@ class GroupFinder(commands.Cog):
             value=f"{game_count} games",
             inline=True
         )
+
+        # Most popular games by players with the role
+        if game_count:
+            popular = []
+            for game_data in self.game_roles[guild_key]['games'].values():
+                role = ctx.guild.get_role(game_data['role_id'])
+                if role:
+                    popular.append((self.get_role_member_count(role), game_data['name']))
+            popular.sort(reverse=True)
+            if popular:
+                embed.add_field(
+                    name="🏆 Top Games",
+                    value="\n".join([f"• {name} ({count} players)" for count, name in popular[:5]]),
+                    inline=False
+                )
+        
+        # Matchmaking queues
+        queues = [queue for queue in self.lfg_queues.values() if queue['key'][0] == ctx.guild.id]
+        if queues:
+            embed.add_field(
+                name="⏳ Open Queues",
+                value="\n".join([f"• {queue['game']}: {len(queue['members'])}/{queue['size']} players" for queue in queues[:10]]),
+                inline=False
+            )
+
+        # Game search cache
+        cache = self.get_search_cache_metrics()
+        embed.add_field(
+            name="🔎 Search Cache",
+            value=f"{cache['hit_ratio']:.0%} hit ratio ({cache['hits']} memory, {cache['disk_hits']} disk, {cache['misses']} misses)\n"
+                  f"{cache['negative_hits']} negative hits • {cache['memory_entries']} in memory • {cache['disk_entries']} on disk\n"
+                  f"{self.search_flight.stats['deduplicated']} duplicate requests coalesced",
+            inline=False
+        )
+
+        # RAWG circuit breaker
+        breaker = self.rawg_breaker
+        state_names = {'closed': "🟢 Closed", 'half_open': "🟡 Half-open (probing)", 'open': "🔴 Open"}
+        breaker_info = f"{state_names[breaker.state]} • {breaker.consecutive_failures} consecutive failures • {breaker.short_circuited} requests skipped"
+        if breaker.state == 'open':
+            breaker_info += f"\nRetrying RAWG in {breaker.retry_in():.0f}s"
+        if breaker.recent_calls:
+            calls = " ".join([f"{'✅' if outcome == 'ok' else '❌'}{elapsed * 1000:.0f}ms" for outcome, elapsed in breaker.recent_calls])
+            breaker_info += f"\nRecent calls: {calls}"
+        embed.add_field(
+            name="🔌 RAWG API",
+            value=breaker_info,
+            inline=False
+        )
         
         # Commands info
         embed.add_field(
             name="📋 Commands",
-            value="• `!searchgame <name>` - Find & add games\n• `!lfg <game>` - Look for group\n• `!mygames` - View your games\n• `!removegame <name>` - Remove game role",
+            value="• `!searchgame <name>` - Find & add games\n• `!lfg <game> [size]` - Queue for a group\n• `!leavelfg [game]` - Leave LFG queues\n• `!mygames` - View your games\n• `!removegame <name>` - Remove game role",
             inline=False
         )
         
@@ -3,9 +3,14 @@ from discord.ext import commands
 import json
 import os
 import random
+import asyncio
 import aiohttp
+from collections import Counter, deque
 from datetime import datetime
-from config import COLORS
+from singleflight import SingleFlight
+from trigger_matcher import TriggerMatcher
+from hit_history import HitHistory, RESOLUTIONS, text_sparkline, render_sparkline
+from config import COLORS, HIT_FLUSH_INTERVAL, INSULT_API_BUFFER
 
 class InsultSystem(commands.Cog):
     def __init__(self, bot):
@@ -17,6 +22,27 @@ class InsultSystem(commands.Cog):
         # Default insult lists by tier
         self.default_insults = self.load_default_insults()
 
+        # Concurrent API lookups for the same tier share one request
+        self.api_flight = SingleFlight()
+
+        # Compiled insult pools per (guild, tier) and per-channel shuffle bags over them
+        self.insult_pools = {}
+        self.shuffle_bags = {}  # (channel_id, guild_key, tier) -> pool indexes not yet used
+        self.last_drawn = {}
+        self.api_insults = {}  # tier -> prefetched API insults
+        self.api_refill = asyncio.Event()
+        self.prefill_task = None
+
+        # Compiled trigger matchers per guild, rebuilt when its triggers change
+        self.trigger_matchers = {}
+
+        # Trigger hits not yet written to disk: (guild_key, trigger) -> count
+        self.pending_hits = Counter()
+        self.hit_flush_task = None
+
+        # Hourly/daily/weekly/monthly hit counts per trigger
+        self.trigger_history = HitHistory('data/trigger_history.json')
+
     def load_tracked_triggers(self):
         """Load tracked triggers from JSON file"""
         if not os.path.exists('data'):
@@ -67,6 +93,8 @@ class InsultSystem(commands.Cog):
         default_file = 'data/default_insults.json'
         with open(default_file, 'w') as f:
             json.dump(self.default_insults, f, indent=2)
+        self.invalidate_insult_pools()
+        self.api_refill.set()  # A tier may have become API-backed
 
     def save_data(self):
         """Save all data to JSON file"""
@@ -86,6 +114,85 @@ class InsultSystem(commands.Cog):
             self.tracked_triggers[guild_key] = {}
         return self.tracked_triggers[guild_key]
 
+    async def cog_load(self):
+        """Called when the cog is loaded"""
+        router = self.bot.get_cog('MessageRouter')
+        if router:
+            router.register('InsultSystem', self.handle_message)
+            for guild_key in self.tracked_triggers:
+                self.update_message_interest(guild_key)
+        else:
+            print("⚠️ MessageRouter is not loaded - InsultSystem won't see any messages (load cogs.message_router before it)")
+        self.hit_flush_task = asyncio.create_task(self.hit_flush_loop())
+        self.prefill_task = asyncio.create_task(self.insult_prefill_loop())
+
+    def cog_unload(self):
+        """Clean up when cog is unloaded"""
+        router = self.bot.get_cog('MessageRouter')
+        if router:
+            router.unregister('InsultSystem')
+        if self.hit_flush_task:
+            self.hit_flush_task.cancel()
+        if self.prefill_task:
+            self.prefill_task.cancel()
+        self.flush_hits()
+
+    def get_trigger_count(self, guild_key, trigger):
+        """Saved trigger count plus hits still waiting in the buffer"""
+        return self.tracked_triggers[guild_key][trigger]['trigger_count'] + self.pending_hits[(guild_key, trigger)]
+
+    def flush_hits(self):
+        """Fold buffered trigger hits into the saved counts with one write"""
+        if not self.pending_hits:
+            return
+        for (guild_key, trigger), hits in self.pending_hits.items():
+            data = self.tracked_triggers.get(guild_key, {}).get(trigger)
+            if data:  # Trigger may have been removed since
+                data['trigger_count'] += hits
+        self.pending_hits.clear()
+        self.save_data()
+        self.trigger_history.save()
+
+    async def hit_flush_loop(self):
+        """Write buffered hit counts every HIT_FLUSH_INTERVAL seconds"""
+        while True:
+            await asyncio.sleep(HIT_FLUSH_INTERVAL)
+            try:
+                self.flush_hits()
+            except Exception as e:
+                print(f"Error flushing insult trigger hits: {e}")
+
+    def update_message_interest(self, guild_key):
+        """Only receive a guild's messages while it has triggers set up"""
+        router = self.bot.get_cog('MessageRouter')
+        if router and 'InsultSystem' in router.listeners:
+            router.set_interest('InsultSystem', guild_key, bool(self.tracked_triggers.get(guild_key)))
+
+    def get_trigger_matcher(self, guild_key):
+        """Get the compiled matchers for a guild's triggers, building them if needed.
+
+        Custom emoji triggers (<:name:id>) are matched case-sensitively against
+        the raw message; everything else against the lowercased message.
+        """
+        matcher = self.trigger_matchers.get(guild_key)
+        if matcher is None:
+            triggers = list(self.tracked_triggers.get(guild_key, {}))
+            emoji = [trigger for trigger in triggers if trigger.startswith('<:') or trigger.startswith('<a:')]
+            text = [trigger for trigger in triggers if not (trigger.startswith('<:') or trigger.startswith('<a:'))]
+            # Trigger order decides which one fires when several match
+            order = {trigger: position for position, trigger in enumerate(triggers)}
+            matcher = (TriggerMatcher(text), TriggerMatcher(emoji), order)
+            self.trigger_matchers[guild_key] = matcher
+        return matcher
+
+    def match_triggers(self, guild_key, context):
+        """Return the guild's triggers found in a message, in trigger order"""
+        text_matcher, emoji_matcher, order = self.get_trigger_matcher(guild_key)
+        matched = [text_matcher.patterns[i] for i in text_matcher.find(context.lower)]
+        if emoji_matcher.patterns and context.custom_emoji_ids:
+            matched += [emoji_matcher.patterns[i] for i in emoji_matcher.find(context.content)]
+        return sorted(matched, key=order.get)
+
     def get_guild_insults(self, guild_id):
         """Get custom insults for a specific guild"""
         guild_key = str(guild_id)
@@ -99,56 +206,104 @@ class InsultSystem(commands.Cog):
 
     async def get_insult_from_api(self, tier):
         """Get an insult from the Evil Insult Generator API"""
+        return await self.api_flight.do(tier, self.fetch_insult_from_api, tier)
+
+    async def fetch_insult_from_api(self, tier):
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"https://evilinsult.com/generate_insult.php?lang=en&type={tier}"
-                async with session.get(url, timeout=5) as response:
-                    if response.status == 200:
-                        insult = await response.text()
-                        # Clean up the insult (remove HTML tags if any)
-                        insult = insult.replace('<br>', ' ').replace('<br/>', ' ').strip()
-                        return insult
+            url = f"https://evilinsult.com/generate_insult.php?lang=en&type={tier}"
+            async with self.bot.http_session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+                if response.status == 200:
+                    insult = await response.text()
+                    # Clean up the insult (remove HTML tags if any)
+                    insult = insult.replace('<br>', ' ').replace('<br/>', ' ').strip()
+                    return insult
         except:
             pass
         return None
 
-    def generate_insult(self, user_mention, tier, guild_id=None):
+    def compile_insult(self, text):
+        """Pre-split an insult on its {user} tags so rendering is a single join"""
+        return tuple(text.split('{user}'))
+
+    def get_insult_pool(self, guild_key, tier):
+        """Compiled insults for a guild and tier: the guild's custom insults, else the defaults"""
+        key = (guild_key, tier)
+        if key not in self.insult_pools:
+            custom = self.custom_insults.get(guild_key, {}).get(tier) if guild_key else None
+            texts = custom or self.default_insults.get(tier) or []
+            self.insult_pools[key] = [self.compile_insult(text) for text in texts]
+        return self.insult_pools[key]
+
+    def invalidate_insult_pools(self, guild_key=None):
+        """Drop compiled pools (and their shuffle bags) after insults are added or removed"""
+        if guild_key is None:
+            self.insult_pools.clear()
+            self.shuffle_bags.clear()
+            return
+        for key in [key for key in self.insult_pools if key[0] == guild_key]:
+            del self.insult_pools[key]
+        for key in [key for key in self.shuffle_bags if key[1] == guild_key]:
+            del self.shuffle_bags[key]
+
+    def draw_from_bag(self, bag_key, pool_size):
+        """Next pool index for a channel; nothing repeats until the whole pool has been used"""
+        bag = self.shuffle_bags.get(bag_key)
+        if not bag:
+            bag = list(range(pool_size))
+            random.shuffle(bag)
+            # Don't let a fresh bag start with the insult the old one just ended on
+            if pool_size > 1 and bag[-1] == self.last_drawn.get(bag_key):
+                bag[0], bag[-1] = bag[-1], bag[0]
+            self.shuffle_bags[bag_key] = bag
+        index = bag.pop()
+        self.last_drawn[bag_key] = index
+        return index
+
+    def generate_insult(self, user_mention, tier, guild_id=None, channel_id=None):
         """Generate an insult for a user"""
-        # Try custom insults first (only if they actually exist and have content)
-        if guild_id:
-            guild_insults = self.get_guild_insults(guild_id)
-            if guild_insults[tier] and len(guild_insults[tier]) > 0:
-                insult = random.choice(guild_insults[tier])
-                print(f"DEBUG: Using CUSTOM insult from {len(guild_insults[tier])} options")
-                # Check if insult has {user} tag, if so format it, otherwise return as-is
-                if '{user}' in insult:
-                    return insult.format(user=user_mention)
-                else:
-                    return insult
-        
-        # Always fall back to default insults if available
-        if tier in self.default_insults and self.default_insults[tier]:
-            # Ensure we have multiple insults to choose from
-            available_insults = self.default_insults[tier]
-            if len(available_insults) > 1:
-                # Use random.choice for variety
-                insult = random.choice(available_insults)
-                print(f"DEBUG: Using DEFAULT insult from {len(available_insults)} options: {insult[:50]}...")
-            else:
-                # If only one insult, use it
-                insult = available_insults[0]
-                print(f"DEBUG: Only one DEFAULT insult available for {tier} tier: {insult[:50]}...")
-            
-            # Check if insult has {user} tag, if so format it, otherwise return as-is
-            if '{user}' in insult:
-                return insult.format(user=user_mention)
-            else:
-                return insult
+        guild_key = str(guild_id) if guild_id else None
+        pool = self.get_insult_pool(guild_key, tier)
+        if pool:
+            parts = pool[self.draw_from_bag((channel_id, guild_key, tier), len(pool))]
+            return user_mention.join(parts)
+        
+        # No local insults for this tier: use one prefetched from the API
+        buffer = self.api_insults.setdefault(tier, deque())
+        self.api_refill.set()
+        if buffer:
+            return f"{user_mention} {buffer.popleft()}"
         
         # Final fallback
-        print(f"DEBUG: Using FALLBACK insult for {tier} tier")
         return f"Hey {user_mention}, you're not very bright, are you?"
 
+    def api_backed_tiers(self):
+        """Tiers with no default insults, which fall back to the API"""
+        return [tier for tier in ('mild', 'strong', 'cruel') if not self.default_insults.get(tier)]
+
+    async def insult_prefill_loop(self):
+        """Keep INSULT_API_BUFFER API insults ready for every API-backed tier"""
+        await self.bot.wait_until_ready()
+
+        while True:
+            try:
+                self.api_refill.clear()
+                for tier in self.api_backed_tiers():
+                    buffer = self.api_insults.setdefault(tier, deque())
+                    while len(buffer) < INSULT_API_BUFFER:
+                        insult = await self.get_insult_from_api(tier)
+                        if not insult:
+                            break  # API is down; try again on the next wake-up
+                        buffer.append(insult)
+                try:
+                    await asyncio.wait_for(self.api_refill.wait(), 300)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error prefilling API insults: {e}")
+                await asyncio.sleep(60)
+
     @commands.command(name='insulton')
     @commands.has_permissions(manage_messages=True)
     async def insult_on(self, ctx, trigger: str, tier: str, user: discord.Member = None):
@@ -158,8 +313,6 @@ class InsultSystem(commands.Cog):
             await ctx.send("❌ Invalid tier! Use: mild, strong, or cruel")
             return
         
-        print(f"DEBUG: Parameters - trigger: {trigger}, tier: {tier}, user: {user}")
-        
         guild_key = str(ctx.guild.id)
         if guild_key not in self.tracked_triggers:
             self.tracked_triggers[guild_key] = {}
@@ -172,6 +325,10 @@ class InsultSystem(commands.Cog):
             'added_at': datetime.now().isoformat(),
             'trigger_count': 0
         }
+        self.pending_hits.pop((guild_key, trigger.lower()), None)
+        self.trigger_history.drop((guild_key, trigger.lower()))
+        self.trigger_matchers.pop(guild_key, None)
+        self.update_message_interest(guild_key)
         
         self.save_data()
         
@@ -205,6 +362,10 @@ class InsultSystem(commands.Cog):
         guild_key = str(ctx.guild.id)
         if guild_key in self.tracked_triggers and trigger.lower() in self.tracked_triggers[guild_key]:
             removed_trigger = self.tracked_triggers[guild_key].pop(trigger.lower())
+            self.pending_hits.pop((guild_key, trigger.lower()), None)
+            self.trigger_history.drop((guild_key, trigger.lower()))
+            self.trigger_matchers.pop(guild_key, None)
+            self.update_message_interest(guild_key)
             self.save_data()
             
             embed = discord.Embed(
@@ -219,6 +380,37 @@ class InsultSystem(commands.Cog):
         else:
             await ctx.send(f"❌ No tracking found for **{trigger}**", delete_after=10)
 
+    @commands.command(name='triggertrend')
+    async def trigger_trend(self, ctx, trigger: str, resolution: str = 'day'):
+        """Show how often a trigger fired over time. Usage: !triggertrend "trigger" [hour|day|week|month]"""
+        resolution = resolution.lower()
+        if resolution not in RESOLUTIONS:
+            await ctx.send("❌ Invalid period! Use: hour, day, week, or month", delete_after=10)
+            return
+        
+        guild_key = str(ctx.guild.id)
+        trigger = trigger.lower()
+        if trigger not in self.tracked_triggers.get(guild_key, {}):
+            await ctx.send(f"❌ No tracking found for **{trigger}**", delete_after=10)
+            return
+        
+        series = self.trigger_history.get((guild_key, trigger))
+        counts = series.recent(resolution) if series else [0] * RESOLUTIONS[resolution]
+        
+        embed = discord.Embed(
+            title=f"📈 Trigger Trend: {trigger}",
+            description=f"Last {len(counts)} {resolution}s, oldest first\n`{text_sparkline(counts)}`",
+            color=COLORS['info']
+        )
+        embed.add_field(name="In Period", value=str(sum(counts)), inline=True)
+        embed.add_field(name=f"Busiest {resolution.title()}", value=str(max(counts)), inline=True)
+        embed.add_field(name="All Time", value=str(self.get_trigger_count(guild_key, trigger)), inline=True)
+        
+        # Drawing the chart is CPU work, so keep it off the event loop
+        chart = await asyncio.to_thread(render_sparkline, counts)
+        embed.set_image(url="attachment://trend.png")
+        await ctx.send(embed=embed, file=discord.File(chart, filename="trend.png"), delete_after=60)
+
     @commands.command(name='listinsults')
     @commands.has_permissions(manage_messages=True)
     async def list_insults(self, ctx):
@@ -250,7 +442,7 @@ class InsultSystem(commands.Cog):
                 
                 embed.add_field(
                     name=f"🎯 {trigger}",
-                    value=f"Target: {target_info}\nTier: {data['tier'].title()}\nTriggers: {data['trigger_count']}",
+                    value=f"Target: {target_info}\nTier: {data['tier'].title()}\nTriggers: {self.get_trigger_count(guild_key, trigger)}",
                     inline=True
                 )
         
@@ -270,6 +462,7 @@ class InsultSystem(commands.Cog):
         
         # Add the insult
         guild_insults[tier.lower()].append(insult_text)
+        self.invalidate_insult_pools(guild_key)
         self.save_data()
         
         embed = discord.Embed(
@@ -297,6 +490,7 @@ class InsultSystem(commands.Cog):
             index = int(index) - 1  # Convert to 0-based index
             if 0 <= index < len(guild_insults[tier.lower()]):
                 removed_insult = guild_insults[tier.lower()].pop(index)
+                self.invalidate_insult_pools(guild_key)
                 self.save_data()
                 
                 embed = discord.Embed(
@@ -357,7 +551,7 @@ class InsultSystem(commands.Cog):
             return
         
         target_user = user or ctx.author
-        insult = self.generate_insult(target_user.mention, tier.lower(), ctx.guild.id)
+        insult = self.generate_insult(target_user.mention, tier.lower(), ctx.guild.id, ctx.channel.id)
         
         embed = discord.Embed(
             title="🧪 Insult Test",
@@ -643,6 +837,12 @@ class InsultSystem(commands.Cog):
             inline=False
         )
         
+        embed.add_field(
+            name="🌐 API Lookups",
+            value=f"{self.api_flight.stats['calls']} calls | {self.api_flight.stats['deduplicated']} coalesced | {sum(len(buffer) for buffer in self.api_insults.values())} prefetched",
+            inline=False
+        )
+        
         embed.add_field(
             name="📁 File Sources",
             value=f"**Default insults loaded:** {len(self.default_insults.get('mild', [])) + len(self.default_insults.get('strong', [])) + len(self.default_insults.get('cruel', []))} total\n**Custom insults loaded:** {len(self.custom_insults.get(str(ctx.guild.id), {}).get('mild', [])) + len(self.custom_insults.get(str(ctx.guild.id), {}).get('strong', [])) + len(self.custom_insults.get(str(ctx.guild.id), {}).get('cruel', []))} total",
@@ -651,60 +851,51 @@ class InsultSystem(commands.Cog):
         
         await ctx.send(embed=embed, delete_after=60)
 
-    @commands.Cog.listener()
-    async def on_message(self, message):
-        """Check messages for tracked triggers and respond with insults"""
-        # Ignore bot messages and commands
-        if message.author.bot or message.content.startswith('!'):
+    async def handle_message(self, message, context):
+        """Check routed messages for tracked triggers and respond with insults"""
+        # Ignore commands
+        if message.content.startswith('!'):
             return
         
         guild_key = str(message.guild.id)
         if guild_key not in self.tracked_triggers:
             return
         
-        # Check each trigger
-        for trigger, data in self.tracked_triggers[guild_key].items():
-            # Enhanced trigger detection for emojis and text
-            should_trigger = False
+        # One scan of the message finds every trigger in it
+        for trigger in self.match_triggers(guild_key, context):
+            data = self.tracked_triggers[guild_key][trigger]
+            # Check if this trigger applies to this user
+            user_should_trigger = False
             
-            # Check for exact emoji match (custom server emojis)
-            if trigger.startswith('<:') or trigger.startswith('<a:'):
-                # Custom emoji format: <:name:id> or <a:name:id>
-                if trigger in message.content:
-                    should_trigger = True
-            else:
-                # Regular text or unicode emoji
-                if trigger.lower() in message.content.lower():
-                    should_trigger = True
+            if data['user_id'] is None:
+                # Trigger for everyone
+                user_should_trigger = True
+            elif message.author.id == data['user_id']:
+                # Trigger for specific user
+                user_should_trigger = True
             
-            if should_trigger:
-                # Check if this trigger applies to this user
-                user_should_trigger = False
+            if user_should_trigger:
+                # Count the hit in memory; hit_flush_loop writes it out
+                self.pending_hits[(guild_key, trigger)] += 1
+                self.trigger_history.record((guild_key, trigger))
                 
-                if data['user_id'] is None:
-                    # Trigger for everyone
-                    user_should_trigger = True
-                elif message.author.id == data['user_id']:
-                    # Trigger for specific user
-                    user_should_trigger = True
-                
-                if user_should_trigger:
-                    # Increment trigger count
-                    data['trigger_count'] += 1
-                    self.save_data()
-                    
-                    # Generate and send insult
-                    insult = self.generate_insult(message.author.mention, data['tier'], message.guild.id)
-                    
-                    # Send the insult as plain text
-                    try:
-                        await message.channel.send(insult)
-                    except discord.Forbidden:
-                        # Bot doesn't have permission to send messages
-                        pass
-                    
-                    # Only trigger once per message
+                # Busy channels get a periodic "+N more" summary instead of one insult per hit
+                throttle = self.bot.get_cog('ResponseThrottle')
+                if throttle and not throttle.allow(message, 'triggers'):
                     break
+                
+                # Generate and send insult
+                insult = self.generate_insult(message.author.mention, data['tier'], message.guild.id, message.channel.id)
+                
+                # Send the insult as plain text
+                try:
+                    await message.channel.send(insult)
+                except discord.Forbidden:
+                    # Bot doesn't have permission to send messages
+                    pass
+                
+                # Only trigger once per message
+                break
 
     @commands.command(name='testinsulton')
     async def test_insulton(self, ctx, trigger: str, tier: str, user: discord.Member = None):
@@ -1,32 +1,173 @@
 import discord
 from discord.ext import commands
 import random
-import aiohttp
-from config import COLORS
+import asyncio
+import json
+import os
+import time
+import heapq
+import re
+from collections import deque
+from singleflight import SingleFlight
+from config import COLORS, MEME_API_URL, MEME_BUFFER_SIZE, MEME_BUFFER_LOW_WATER, POLL_DEFAULT_DURATION, POLL_EDIT_INTERVAL
+
+POLL_EMOJIS = ['1️⃣', '2️⃣', '3️⃣', '4️⃣', '5️⃣', '6️⃣', '7️⃣', '8️⃣', '9️⃣', '🔟']
+
+class PollButton(discord.ui.Button):
+    def __init__(self, poll_id: str, index: int, label: str):
+        super().__init__(
+            label=label[:80],
+            emoji=POLL_EMOJIS[index],
+            style=discord.ButtonStyle.secondary,
+            custom_id=f"poll_{poll_id}_{index}"
+        )
+        self.poll_id = poll_id
+        self.index = index
+
+    async def callback(self, interaction: discord.Interaction):
+        cog = interaction.client.get_cog('Integrations')
+        poll = cog.polls.get(self.poll_id)
+        if not poll or poll['closed']:
+            await interaction.response.send_message("❌ This poll has closed!", ephemeral=True, delete_after=10)
+            return
+
+        # Tally updates instantly; the results message is refreshed on a debounce
+        vote = cog.record_vote(self.poll_id, interaction.user.id, self.index)
+        if vote is None:
+            message = "🗳️ Your vote was withdrawn."
+        else:
+            message = f"🗳️ You voted for **{poll['options'][vote]}**. Click another option to change your vote."
+        await interaction.response.send_message(message, ephemeral=True, delete_after=10)
+
+class PollView(discord.ui.View):
+    def __init__(self, cog, poll_id: str, poll: dict):
+        super().__init__(timeout=None)  # Persistent view
+        self.cog = cog
+        self.poll_id = poll_id
+        for index, option in enumerate(poll['options']):
+            self.add_item(PollButton(poll_id, index, option))
 
 class Integrations(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.meme_flight = SingleFlight()  # Background and on-demand refills share one request
+
+        # Prefetched memes so !meme answers without waiting on the API
+        self.meme_buffer = deque(maxlen=MEME_BUFFER_SIZE)
+        self.seen_meme_urls = deque(maxlen=MEME_BUFFER_SIZE * 20)  # Recent post URLs, oldest first
+        self.seen_meme_url_set = set()
+        self.meme_stats = {'instant': 0, 'waited': 0, 'duplicates_skipped': 0}
+
+        # Reminders: persisted store plus one heap and sleeper for every pending reminder
+        self.reminders_file = 'data/reminders.json'
+        self.reminder_data = self.load_reminders()
+        self.reminders = self.reminder_data['reminders']  # id -> reminder
+        self.user_reminders = {}  # user_id -> set of reminder ids
+        for reminder_id, reminder in self.reminders.items():
+            self.user_reminders.setdefault(reminder['user_id'], set()).add(reminder_id)
+        self.reminder_heap = [(reminder['due_at'], reminder_id) for reminder_id, reminder in self.reminders.items()]
+        heapq.heapify(self.reminder_heap)
+        self.reminder_wakeup = asyncio.Event()
+        self.reminder_task = None
+        self.reminder_save_task = None
+
+        # Polls: tallies live in memory, result edits are debounced per poll
+        self.polls_file = 'data/polls.json'
+        self.poll_data = self.load_polls()
+        self.polls = self.poll_data['polls']  # id -> poll
+        self.poll_edit_tasks = {}  # poll id -> pending debounced edit
+        self.poll_close_tasks = {}  # poll id -> deadline task
+        self.poll_save_task = None
+
+    async def cog_load(self):
+        """Called when the cog is loaded"""
+        asyncio.create_task(self.prefill_memes())
+
+        # One sleeper for every pending reminder
+        self.reminder_task = asyncio.create_task(self.reminder_sleeper())
+
+        # Reattach buttons and deadlines for polls that are still open
+        for poll_id, poll in self.polls.items():
+            if not poll['closed'] and poll['message_id']:
+                self.bot.add_view(PollView(self, poll_id, poll), message_id=poll['message_id'])
+                self.poll_close_tasks[poll_id] = asyncio.create_task(self.close_poll_later(poll_id))
+            elif poll['closed']:
+                # Closed, but the final results never made it into the message
+                self.poll_close_tasks[poll_id] = asyncio.create_task(self.close_poll_later(poll_id))
+
+    def cog_unload(self):
+        """Clean up when cog is unloaded"""
+        if self.reminder_task:
+            self.reminder_task.cancel()
+        for task in self.poll_close_tasks.values():
+            task.cancel()
+        self.save_reminders()
+        self.save_polls()
+
+    async def prefill_memes(self):
+        await self.bot.wait_until_ready()
+        self.request_meme_refill()
+
+    async def fetch_memes(self, count):
+        """Fetch a batch of memes from the meme API"""
+        async with self.bot.http_session.get(f"{MEME_API_URL}/gimme/{count}") as response:
+            if response.status == 200:
+                data = await response.json()
+                return data.get('memes', [])
+        return []
+
+    async def refill_memes(self):
+        """Top the buffer up, skipping posts we've shown recently"""
+        missing = MEME_BUFFER_SIZE - len(self.meme_buffer)
+        if missing <= 0:
+            return
+        for meme in await self.fetch_memes(missing):
+            post_url = meme.get('postLink') or meme.get('url')
+            if not post_url or not meme.get('url'):
+                continue  # Malformed entry: nothing to dedupe on or no image to show
+            if post_url in self.seen_meme_url_set:
+                self.meme_stats['duplicates_skipped'] += 1
+                continue
+            if len(self.seen_meme_urls) == self.seen_meme_urls.maxlen:
+                self.seen_meme_url_set.discard(self.seen_meme_urls[0])
+            self.seen_meme_urls.append(post_url)
+            self.seen_meme_url_set.add(post_url)
+            self.meme_buffer.append(meme)
+
+    def request_meme_refill(self):
+        """Refill in the background once the buffer drops below the low-water mark"""
+        if len(self.meme_buffer) < MEME_BUFFER_LOW_WATER and 'refill' not in self.meme_flight.inflight:
+            task = asyncio.create_task(self.meme_flight.do('refill', self.refill_memes))
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())  # Failures just mean a later retry
+
+    async def next_meme(self):
+        """Pop a prefetched meme, only waiting on the API if the buffer ran dry"""
+        if self.meme_buffer:
+            self.meme_stats['instant'] += 1
+        else:
+            self.meme_stats['waited'] += 1
+            await self.meme_flight.do('refill', self.refill_memes)
+
+        meme = self.meme_buffer.popleft() if self.meme_buffer else None
+        self.request_meme_refill()
+        return meme
 
     @commands.command(name='meme')
     async def random_meme(self, ctx):
         """Get a random meme from Reddit!"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get('https://meme-api.com/gimme') as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        embed = discord.Embed(
-                            title=data['title'],
-                            color=COLORS['primary']
-                        )
-                        embed.set_image(url=data['url'])
-                        embed.set_footer(text=f"👍 {data['ups']} | r/{data['subreddit']}")
-                        
-                        await ctx.send(embed=embed)
-                    else:
-                        await ctx.send("❌ Couldn't fetch a meme right now!")
+            data = await self.next_meme()
+            if data:
+                embed = discord.Embed(
+                    title=data['title'],
+                    color=COLORS['primary']
+                )
+                embed.set_image(url=data['url'])
+                embed.set_footer(text=f"👍 {data['ups']} | r/{data['subreddit']}")
+                
+                await ctx.send(embed=embed)
+            else:
+                await ctx.send("❌ Couldn't fetch a meme right now!")
         except:
             await ctx.send("❌ Meme service is unavailable!")
 
@@ -81,9 +222,160 @@ class Integrations(commands.Cog):
         
         await ctx.send(embed=embed)
 
+    def load_polls(self):
+        """Load polls from JSON file"""
+        if not os.path.exists('data'):
+            os.makedirs('data')
+
+        if os.path.exists(self.polls_file):
+            try:
+                with open(self.polls_file, 'r') as f:
+                    data = json.load(f)
+                # JSON object keys are strings; votes are keyed by user id
+                for poll in data['polls'].values():
+                    poll['votes'] = {int(user_id): index for user_id, index in poll.get('votes', {}).items()}
+                return data
+            except (json.JSONDecodeError, FileNotFoundError, KeyError):
+                pass
+        return {'next_id': 1, 'polls': {}}
+
+    def save_polls(self):
+        """Save polls to JSON file"""
+        with open(self.polls_file, 'w') as f:
+            json.dump(self.poll_data, f)
+
+    def queue_polls_save(self):
+        """Coalesce saves so a burst of votes is a single file write"""
+        if self.poll_save_task and not self.poll_save_task.done():
+            return
+
+        async def save_later():
+            await asyncio.sleep(5)
+            self.save_polls()
+
+        self.poll_save_task = asyncio.create_task(save_later())
+
+    def parse_poll_duration(self, text):
+        """Parse '30m', '2h' or '1d' into seconds, None if it isn't a duration"""
+        match = re.fullmatch(r'(\d+)([mhd])', text.lower())
+        if not match:
+            return None
+        return int(match.group(1)) * {'m': 60, 'h': 3600, 'd': 86400}[match.group(2)]
+
+    def record_vote(self, poll_id, user_id, index):
+        """Update a poll's tally in O(1). Returns the user's vote afterwards (None if withdrawn)"""
+        poll = self.polls[poll_id]
+        previous = poll['votes'].get(user_id)
+        if previous is not None:
+            poll['counts'][previous] -= 1
+
+        if previous == index:
+            # Clicking your current choice again withdraws the vote
+            del poll['votes'][user_id]
+            vote = None
+        else:
+            poll['votes'][user_id] = index
+            poll['counts'][index] += 1
+            vote = index
+
+        self.queue_poll_edit(poll_id)
+        self.queue_polls_save()
+        return vote
+
+    def build_poll_embed(self, poll):
+        total = sum(poll['counts'])
+        lines = []
+        for i, option in enumerate(poll['options']):
+            count = poll['counts'][i]
+            share = count / total if total else 0
+            bar = '█' * round(share * 10) + '░' * (10 - round(share * 10))
+            lines.append(f"{POLL_EMOJIS[i]} **{option}**\n{bar} {count} vote(s) ({share:.0%})")
+
+        embed = discord.Embed(
+            title=f"📊 {poll['question']}" + (" (Closed)" if poll['closed'] else ""),
+            description="\n".join(lines),
+            color=COLORS['info'] if poll['closed'] else COLORS['primary']
+        )
+        if poll['closed']:
+            embed.set_footer(text=f"Poll by {poll['author']} • Final results from {total} voter(s)")
+        else:
+            embed.set_footer(text=f"Poll by {poll['author']} • {total} voter(s) • Click a button to vote")
+            embed.add_field(name="⏰ Closes", value=f"<t:{int(poll['ends_at'])}:R>", inline=False)
+        return embed
+
+    def queue_poll_edit(self, poll_id):
+        """Debounce result edits: at most one message edit per poll every POLL_EDIT_INTERVAL"""
+        if poll_id in self.poll_edit_tasks:
+            return
+
+        async def edit_later():
+            try:
+                await asyncio.sleep(POLL_EDIT_INTERVAL)
+            finally:
+                self.poll_edit_tasks.pop(poll_id, None)
+            await self.refresh_poll_message(poll_id)
+
+        self.poll_edit_tasks[poll_id] = asyncio.create_task(edit_later())
+
+    async def refresh_poll_message(self, poll_id, view=None):
+        """Edit the poll message. Returns False only if the edit failed and is worth retrying"""
+        poll = self.polls.get(poll_id)
+        if poll is None:
+            return True
+        channel = self.bot.get_channel(poll['channel_id'])
+        if channel is None or not poll['message_id']:
+            return True  # Nothing left to edit
+        try:
+            kwargs = {'embed': self.build_poll_embed(poll)}
+            if view is not None:
+                kwargs['view'] = view
+            await channel.get_partial_message(poll['message_id']).edit(**kwargs)
+        except (discord.NotFound, discord.Forbidden):
+            pass  # Message deleted or channel closed to us
+        except discord.HTTPException as e:
+            print(f"Failed to update poll {poll_id}: {e}")
+            return False
+        return True
+
+    async def close_poll_later(self, poll_id):
+        """Close a poll at its deadline"""
+        await self.bot.wait_until_ready()
+        await asyncio.sleep(max(0, self.polls[poll_id]['ends_at'] - time.time()))
+        await self.close_poll(poll_id)
+
+    async def close_poll(self, poll_id):
+        """Freeze the tally and show final results, then forget the poll"""
+        poll = self.polls.get(poll_id)
+        if poll is None:
+            return
+        if not poll['closed']:
+            poll['closed'] = True
+            # Final results keep the counts; per-user votes are no longer needed
+            poll['votes'] = {}
+
+            pending_edit = self.poll_edit_tasks.pop(poll_id, None)
+            if pending_edit:
+                pending_edit.cancel()
+        self.poll_close_tasks.pop(poll_id, None)
+
+        view = PollView(self, poll_id, poll)
+        for item in view.children:
+            item.disabled = True
+        view.stop()
+        if await self.refresh_poll_message(poll_id, view=view):
+            # The message holds the final results now; a failed edit is retried on the next load
+            self.polls.pop(poll_id, None)
+        self.save_polls()
+
     @commands.command(name='poll')
     async def create_poll(self, ctx, question: str, *options):
-        """Create a poll! Usage: !poll "Question?" "Option 1" "Option 2" ..."""
+        """Create a poll! Usage: !poll "Question?" [30m|2h|1d] "Option 1" "Option 2" ..."""
+        # Optional duration before the options
+        duration = POLL_DEFAULT_DURATION
+        if options and self.parse_poll_duration(options[0]):
+            duration = self.parse_poll_duration(options[0])
+            options = options[1:]
+
         if len(options) < 2:
             await ctx.send("❌ You need at least 2 options for a poll!")
             return
@@ -92,25 +384,27 @@ class Integrations(commands.Cog):
             await ctx.send("❌ Maximum 10 options allowed!")
             return
         
-        reactions = ['1️⃣', '2️⃣', '3️⃣', '4️⃣', '5️⃣', '6️⃣', '7️⃣', '8️⃣', '9️⃣', '🔟']
-        
-        description = ""
-        for i, option in enumerate(options):
-            description += f"{reactions[i]} {option}\n"
-        
-        embed = discord.Embed(
-            title=f"📊 {question}",
-            description=description,
-            color=COLORS['primary']
-        )
-        embed.set_footer(text=f"Poll by {ctx.author.display_name}")
+        poll_id = str(self.poll_data['next_id'])
+        self.poll_data['next_id'] += 1
+        poll = {
+            'question': question,
+            'options': [option[:80] for option in options],
+            'counts': [0] * len(options),
+            'votes': {},  # user_id -> option index
+            'author': ctx.author.display_name,
+            'channel_id': ctx.channel.id,
+            'message_id': None,
+            'ends_at': time.time() + duration,
+            'closed': False
+        }
+        self.polls[poll_id] = poll
         
-        message = await ctx.send(embed=embed)
+        view = PollView(self, poll_id, poll)
+        message = await ctx.send(embed=self.build_poll_embed(poll), view=view)
+        poll['message_id'] = message.id
+        self.save_polls()
         
-        for i in range(len(options)):
-            await message.add_reaction(reactions[i])
-
-
+        self.poll_close_tasks[poll_id] = asyncio.create_task(self.close_poll_later(poll_id))
 
     @commands.command(name='choose')
     async def random_choice(self, ctx, *choices):
@@ -130,6 +424,161 @@ class Integrations(commands.Cog):
         
         await ctx.send(embed=embed)
 
+    def load_reminders(self):
+        """Load pending reminders from JSON file"""
+        if not os.path.exists('data'):
+            os.makedirs('data')
+
+        if os.path.exists(self.reminders_file):
+            try:
+                with open(self.reminders_file, 'r') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError):
+                pass
+        return {'next_id': 1, 'reminders': {}}
+
+    def save_reminders(self):
+        """Save pending reminders to JSON file"""
+        with open(self.reminders_file, 'w') as f:
+            json.dump(self.reminder_data, f)
+
+    def queue_reminders_save(self):
+        """Coalesce saves so a burst of reminders is a single file write"""
+        if self.reminder_save_task and not self.reminder_save_task.done():
+            return
+
+        async def save_later():
+            await asyncio.sleep(5)
+            self.save_reminders()
+
+        self.reminder_save_task = asyncio.create_task(save_later())
+
+    def add_reminder(self, ctx, delay, message, interval=None):
+        """Store a reminder and put it on the timer heap"""
+        reminder_id = str(self.reminder_data['next_id'])
+        self.reminder_data['next_id'] += 1
+        reminder = {
+            'user_id': ctx.author.id,
+            'channel_id': ctx.channel.id,
+            'message': message,
+            'due_at': time.time() + delay,
+            'interval': interval
+        }
+        self.reminders[reminder_id] = reminder
+        self.user_reminders.setdefault(ctx.author.id, set()).add(reminder_id)
+        heapq.heappush(self.reminder_heap, (reminder['due_at'], reminder_id))
+        self.queue_reminders_save()
+
+        # Only wake the sleeper if this is now the soonest reminder
+        if self.reminder_heap[0][1] == reminder_id:
+            self.reminder_wakeup.set()
+        return reminder_id
+
+    def remove_reminder(self, reminder_id):
+        """Forget a reminder (its heap entry becomes stale)"""
+        reminder = self.reminders.pop(reminder_id, None)
+        if reminder:
+            self.user_reminders.get(reminder['user_id'], set()).discard(reminder_id)
+            self.queue_reminders_save()
+        return reminder
+
+    def pop_due_reminders(self, now):
+        """Pop every reminder that is due, skipping stale heap entries"""
+        due = []
+        while self.reminder_heap and self.reminder_heap[0][0] <= now:
+            due_at, reminder_id = heapq.heappop(self.reminder_heap)
+            reminder = self.reminders.get(reminder_id)
+            if reminder and reminder['due_at'] == due_at:
+                due.append((reminder_id, reminder))
+
+        # Rebuild if cancelled entries have piled up
+        if len(self.reminder_heap) > 2 * len(self.reminders) + 1000:
+            self.reminder_heap = [(reminder['due_at'], reminder_id) for reminder_id, reminder in self.reminders.items()]
+            heapq.heapify(self.reminder_heap)
+
+        return due
+
+    async def fire_reminders(self, due, now):
+        """Deliver a batch of reminders, one message per channel for up to 10 at a time"""
+        by_channel = {}
+        for reminder_id, reminder in due:
+            by_channel.setdefault(reminder['channel_id'], []).append((reminder_id, reminder))
+
+            if reminder['interval']:
+                # Recurring: schedule the next run, skipping any missed while offline
+                while reminder['due_at'] <= now:
+                    reminder['due_at'] += reminder['interval']
+                heapq.heappush(self.reminder_heap, (reminder['due_at'], reminder_id))
+
+        try:
+            for channel_id, entries in by_channel.items():
+                channel = self.bot.get_channel(channel_id)
+                for i in range(0, len(entries), 10):
+                    batch = [reminder for reminder_id, reminder in entries[i:i + 10]]
+                    embeds = []
+                    for reminder in batch:
+                        embeds.append(discord.Embed(
+                            title="🔔 Reminder",
+                            description=f"<@{reminder['user_id']}>, you asked me to remind you: {reminder['message']}",
+                            color=COLORS['warning']
+                        ))
+                        if reminder['interval']:
+                            embeds[-1].set_footer(text=f"Repeats every {reminder['interval'] // 60} minute(s)")
+                    sent = False
+                    if channel:
+                        try:
+                            await channel.send(" ".join(sorted({f"<@{reminder['user_id']}>" for reminder in batch})), embeds=embeds)
+                            sent = True
+                        except discord.HTTPException as e:
+                            print(f"Error sending reminders to channel {channel_id}: {e}")
+                    if not sent:
+                        # Channel is gone, closed to us or failing: fall back to DMs
+                        await self.dm_reminders(batch, embeds)
+
+                    # One-off reminders are only forgotten once their batch went out
+                    for reminder_id, reminder in entries[i:i + 10]:
+                        if not reminder['interval']:
+                            self.remove_reminder(reminder_id)
+        finally:
+            self.queue_reminders_save()
+
+    async def dm_reminders(self, reminders, embeds):
+        for reminder, embed in zip(reminders, embeds):
+            try:
+                user = self.bot.get_user(reminder['user_id']) or await self.bot.fetch_user(reminder['user_id'])
+                await user.send(embed=embed)
+            except discord.HTTPException:
+                pass
+
+    async def reminder_sleeper(self):
+        """Single task that sleeps until the next reminder and fires whatever is due.
+
+        The first pass after startup delivers everything that came due
+        while the bot was offline.
+        """
+        await self.bot.wait_until_ready()
+
+        while True:
+            try:
+                self.reminder_wakeup.clear()
+                now = time.time()
+                due = self.pop_due_reminders(now)
+
+                if due:
+                    await self.fire_reminders(due, now)
+                    continue
+
+                timeout = self.reminder_heap[0][0] - time.time() if self.reminder_heap else None
+                try:
+                    await asyncio.wait_for(self.reminder_wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error in reminder sleeper: {e}")
+                await asyncio.sleep(60)
+
     @commands.command(name='remind')
     async def remind_me(self, ctx, time: int, *, message: str):
         """Set a reminder! Usage: !remind <minutes> <message>"""
@@ -137,25 +586,81 @@ class Integrations(commands.Cog):
             await ctx.send("❌ Reminder time must be between 1 and 1440 minutes (24 hours)!")
             return
         
+        reminder_id = self.add_reminder(ctx, time * 60, message)
+        
         embed = discord.Embed(
             title="⏰ Reminder Set",
             description=f"I'll remind you in {time} minute(s): {message}",
             color=COLORS['success']
         )
+        embed.set_footer(text=f"Reminder #{reminder_id} • !cancelreminder {reminder_id} to cancel")
         
         await ctx.send(embed=embed)
+
+    @commands.command(name='remindevery')
+    async def remind_every(self, ctx, minutes: int, *, message: str):
+        """Set a recurring reminder! Usage: !remindevery <minutes> <message>"""
+        if minutes < 5 or minutes > 10080:  # Max 1 week
+            await ctx.send("❌ Recurring reminders must repeat every 5 to 10080 minutes (1 week)!")
+            return
+        
+        reminder_id = self.add_reminder(ctx, minutes * 60, message, interval=minutes * 60)
         
-        # Wait and send reminder
-        import asyncio
-        await asyncio.sleep(time * 60)
+        embed = discord.Embed(
+            title="🔁 Recurring Reminder Set",
+            description=f"I'll remind you every {minutes} minute(s): {message}",
+            color=COLORS['success']
+        )
+        embed.set_footer(text=f"Reminder #{reminder_id} • !cancelreminder {reminder_id} to stop")
         
-        reminder_embed = discord.Embed(
-            title="🔔 Reminder",
-            description=f"{ctx.author.mention}, you asked me to remind you: {message}",
-            color=COLORS['warning']
+        await ctx.send(embed=embed)
+
+    @commands.command(name='reminders')
+    async def list_reminders(self, ctx):
+        """List your pending reminders"""
+        reminder_ids = sorted(self.user_reminders.get(ctx.author.id, set()), key=lambda reminder_id: self.reminders[reminder_id]['due_at'])
+        
+        if not reminder_ids:
+            await ctx.send("📭 You don't have any pending reminders!")
+            return
+        
+        embed = discord.Embed(
+            title=f"⏰ Reminders for {ctx.author.display_name}",
+            color=COLORS['info']
         )
         
-        await ctx.send(embed=reminder_embed)
+        for reminder_id in reminder_ids[:25]:
+            reminder = self.reminders[reminder_id]
+            repeat = f" • 🔁 every {reminder['interval'] // 60} min" if reminder['interval'] else ""
+            embed.add_field(
+                name=f"#{reminder_id} • <t:{int(reminder['due_at'])}:R>{repeat}",
+                value=reminder['message'][:1024],
+                inline=False
+            )
+        
+        if len(reminder_ids) > 25:
+            embed.set_footer(text=f"Showing the next 25 of {len(reminder_ids)} reminders")
+        
+        await ctx.send(embed=embed)
+
+    @commands.command(name='cancelreminder')
+    async def cancel_reminder(self, ctx, reminder_id: str):
+        """Cancel one of your reminders! Usage: !cancelreminder <id>"""
+        reminder_id = reminder_id.lstrip('#')
+        reminder = self.reminders.get(reminder_id)
+        
+        if not reminder or reminder['user_id'] != ctx.author.id:
+            await ctx.send(f"❌ You don't have a reminder #{reminder_id}!")
+            return
+        
+        self.remove_reminder(reminder_id)
+        
+        embed = discord.Embed(
+            title="🗑️ Reminder Cancelled",
+            description=f"Cancelled reminder #{reminder_id}: {reminder['message']}",
+            color=COLORS['success']
+        )
+        await ctx.send(embed=embed)
 
 async def setup(bot):
     await bot.add_cog(Integrations(bot))
\ No newline at end of file
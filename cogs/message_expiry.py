@@ -0,0 +1,177 @@
+import discord
+from discord.ext import commands
+import json
+import os
+import time
+import heapq
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+class MessageExpiry(commands.Cog):
+    """Deletes temporary bot messages on schedule, for every cog"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.data_file = 'data/expiring_messages.json'
+        self.heap = self.load_expiring_messages()  # [delete_at, channel_id, message_id]
+        heapq.heapify(self.heap)
+        self.wakeup = asyncio.Event()
+        self.sleeper_task = None
+        self.save_task = None
+        self.stats = {'scheduled': 0, 'deleted': 0, 'bulk_calls': 0, 'single_calls': 0}
+
+    async def cog_load(self):
+        """Called when the cog is loaded"""
+        # One sleeper for every pending deletion
+        self.sleeper_task = asyncio.create_task(self.expiry_sleeper())
+
+    def cog_unload(self):
+        """Clean up when cog is unloaded"""
+        if self.sleeper_task:
+            self.sleeper_task.cancel()
+        self.save_expiring_messages()
+
+    def load_expiring_messages(self):
+        """Load pending deletions from JSON file"""
+        if not os.path.exists('data'):
+            os.makedirs('data')
+
+        heap = []
+        if os.path.exists(self.data_file):
+            try:
+                with open(self.data_file, 'r') as f:
+                    heap = json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError):
+                heap = []
+
+        # Carry over deletions GroupFinder persisted before this service existed
+        legacy_file = 'data/pending_deletions.json'
+        if os.path.exists(legacy_file):
+            try:
+                with open(legacy_file, 'r') as f:
+                    for entry in json.load(f).values():
+                        heap.append([entry['deletion_time'], entry['channel_id'], entry['message_id']])
+                os.remove(legacy_file)
+            except (json.JSONDecodeError, KeyError, OSError):
+                pass
+
+        return heap
+
+    def save_expiring_messages(self):
+        """Save pending deletions to JSON file"""
+        with open(self.data_file, 'w') as f:
+            json.dump(self.heap, f)
+
+    def queue_save(self):
+        """Coalesce saves so a burst of scheduled messages is a single file write"""
+        if self.save_task and not self.save_task.done():
+            return
+
+        async def save_later():
+            await asyncio.sleep(5)
+            self.save_expiring_messages()
+
+        self.save_task = asyncio.create_task(save_later())
+
+    def schedule(self, message, delay):
+        """Delete a message `delay` seconds from now, surviving restarts"""
+        if message.flags.ephemeral:
+            # Ephemeral messages can only be deleted through their interaction token,
+            # which expires long before a restart would matter
+            asyncio.create_task(self.delete_ephemeral(message, delay))
+            return
+
+        delete_at = time.time() + delay
+        heapq.heappush(self.heap, [delete_at, message.channel.id, message.id])
+        self.stats['scheduled'] += 1
+        self.queue_save()
+
+        # Only wake the sleeper if this is now the soonest deletion
+        if self.heap[0][2] == message.id:
+            self.wakeup.set()
+
+    async def delete_ephemeral(self, message, delay):
+        try:
+            await message.delete(delay=delay)
+        except discord.HTTPException:
+            pass
+
+    def pop_due(self, now):
+        """Pop every deletion that is due, grouped by channel"""
+        due = {}
+        while self.heap and self.heap[0][0] <= now:
+            delete_at, channel_id, message_id = heapq.heappop(self.heap)
+            due.setdefault(channel_id, []).append(message_id)
+        return due
+
+    async def delete_channel_messages(self, channel_id, message_ids):
+        """Delete messages by ID, in one bulk call where Discord allows it"""
+        channel = self.bot.get_channel(channel_id)
+        if channel is None:
+            return  # Channel is gone (or we left the guild); nothing to delete
+
+        # Bulk delete needs Manage Messages and only takes messages under 14 days old
+        can_bulk = (
+            hasattr(channel, 'delete_messages')
+            and hasattr(channel, 'guild')
+            and channel.permissions_for(channel.guild.me).manage_messages
+        )
+        cutoff = datetime.now(timezone.utc) - timedelta(days=14)
+        messages = [channel.get_partial_message(message_id) for message_id in message_ids]
+        bulk = [message for message in messages if can_bulk and message.created_at > cutoff]
+        singles = [message for message in messages if message not in bulk]
+
+        for i in range(0, len(bulk), 100):
+            chunk = bulk[i:i + 100]
+            if len(chunk) == 1:
+                singles.extend(chunk)
+                continue
+            try:
+                await channel.delete_messages(chunk)
+                self.stats['bulk_calls'] += 1
+                self.stats['deleted'] += len(chunk)
+            except discord.HTTPException:
+                singles.extend(chunk)  # Fall back to deleting one by one
+
+        for message in singles:
+            try:
+                await message.delete()
+                self.stats['single_calls'] += 1
+                self.stats['deleted'] += 1
+            except (discord.NotFound, discord.Forbidden):
+                pass  # Already deleted, or no permission to delete it
+            except discord.HTTPException as e:
+                print(f"Failed to delete message {message.id} in channel {channel_id}: {e}")
+
+    async def expiry_sleeper(self):
+        """Single task that sleeps until the next deletion and deletes whatever is due.
+
+        The first pass after startup catches up on everything that expired
+        while the bot was offline.
+        """
+        await self.bot.wait_until_ready()
+
+        while True:
+            try:
+                self.wakeup.clear()
+                due = self.pop_due(time.time())
+
+                if due:
+                    for channel_id, message_ids in due.items():
+                        await self.delete_channel_messages(channel_id, message_ids)
+                    self.queue_save()
+                    continue
+
+                timeout = self.heap[0][0] - time.time() if self.heap else None
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error in message expiry sleeper: {e}")
+                await asyncio.sleep(60)
+
+async def setup(bot):
+    await bot.add_cog(MessageExpiry(bot))
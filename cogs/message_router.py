@@ -0,0 +1,128 @@
+from discord.ext import commands
+import re
+import time
+import asyncio
+from functools import cached_property
+
+CUSTOM_EMOJI = re.compile(r'<a?:\w+:(\d+)>')
+WORD = re.compile(r'\w+')
+
+class MessageContext:
+    """A message plus the derived views listeners share, each computed at most once"""
+
+    def __init__(self, message):
+        self.message = message
+        self.content = message.content
+
+    @cached_property
+    def lower(self):
+        return self.content.lower()
+
+    @cached_property
+    def tokens(self):
+        return WORD.findall(self.lower)
+
+    @cached_property
+    def custom_emoji_ids(self):
+        return {int(emoji_id) for emoji_id in CUSTOM_EMOJI.findall(self.content)}
+
+    @cached_property
+    def mentions(self):
+        return {user.id for user in self.message.mentions}
+
+class MessageRouter(commands.Cog):
+    """Single on_message listener that hands each guild message to the subsystems interested in it"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.listeners = {}  # name -> {'handler', 'bit', 'bots', 'stats'}
+        self.guild_interest = {}  # guild_id -> bitmap of listeners registered for that guild
+        self.global_interest = 0  # listeners that want every guild
+        self.bot_interest = 0  # listeners that also want messages from bots
+        self.stats = {'messages': 0, 'routed': 0}
+
+    def register(self, name, handler, bots=False, every_guild=False):
+        """Register `handler(message, context)` under `name`. Returns its interest bit"""
+        if name in self.listeners:
+            bit = self.listeners[name]['bit']
+        else:
+            used = 0
+            for listener in self.listeners.values():
+                used |= listener['bit']
+            bit = 1
+            while used & bit:
+                bit <<= 1
+
+        self.listeners[name] = {
+            'handler': handler,
+            'bit': bit,
+            'bots': bots,
+            'stats': {'calls': 0, 'total_time': 0.0, 'max_time': 0.0, 'errors': 0}
+        }
+        self.bot_interest = self.bot_interest | bit if bots else self.bot_interest & ~bit
+        self.global_interest = self.global_interest | bit if every_guild else self.global_interest & ~bit
+        return bit
+
+    def unregister(self, name):
+        """Remove a listener and every guild's interest in it"""
+        listener = self.listeners.pop(name, None)
+        if listener is None:
+            return
+        bit = listener['bit']
+        self.bot_interest &= ~bit
+        self.global_interest &= ~bit
+        for guild_id in list(self.guild_interest):
+            self.guild_interest[guild_id] &= ~bit
+            if not self.guild_interest[guild_id]:
+                del self.guild_interest[guild_id]
+
+    def set_interest(self, name, guild_id, interested):
+        """Turn a listener on or off for one guild"""
+        bit = self.listeners[name]['bit']
+        guild_id = int(guild_id)
+        mask = self.guild_interest.get(guild_id, 0)
+        mask = mask | bit if interested else mask & ~bit
+        if mask:
+            self.guild_interest[guild_id] = mask
+        else:
+            self.guild_interest.pop(guild_id, None)
+
+    async def run_listener(self, name, listener, message, context):
+        started = time.perf_counter()
+        try:
+            await listener['handler'](message, context)
+        except Exception as e:
+            listener['stats']['errors'] += 1
+            print(f"Error in {name} message listener: {e}")
+        finally:
+            elapsed = time.perf_counter() - started
+            stats = listener['stats']
+            stats['calls'] += 1
+            stats['total_time'] += elapsed
+            stats['max_time'] = max(stats['max_time'], elapsed)
+
+    @commands.Cog.listener()
+    async def on_message(self, message):
+        """Route a guild message to interested listeners, sharing one context"""
+        if not message.guild:
+            return
+        self.stats['messages'] += 1
+
+        mask = self.guild_interest.get(message.guild.id, 0) | self.global_interest
+        if message.author.bot:
+            mask &= self.bot_interest
+        if not mask:
+            return
+
+        context = MessageContext(message)
+        runs = [
+            self.run_listener(name, listener, message, context)
+            for name, listener in list(self.listeners.items())
+            if listener['bit'] & mask
+        ]
+        self.stats['routed'] += 1
+        # Listeners run side by side so one slow reply doesn't hold up the others
+        await asyncio.gather(*runs)
+
+async def setup(bot):
+    await bot.add_cog(MessageRouter(bot))
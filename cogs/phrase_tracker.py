@@ -2,13 +2,36 @@ import discord
 from discord.ext import commands
 import json
 import os
-from config import COLORS
+import re
+import time
+import asyncio
+from collections import Counter
+from datetime import datetime, timezone
+from config import COLORS, HIT_FLUSH_INTERVAL, BACKFILL_DEFAULT_DAYS, BACKFILL_MAX_DAYS, BACKFILL_CONCURRENCY, BACKFILL_BATCH_SIZE, BACKFILL_RETRIES
+from hit_history import HitHistory, RESOLUTIONS, text_sparkline, render_sparkline
+
+PHRASE_MILESTONES = {
+    1: ("🎉 Milestone", "First time saying this phrase!"),
+    10: ("🔥 Milestone", "10th time! Getting consistent!"),
+    50: ("⭐ Milestone", "50 times! This is becoming a habit!"),
+    100: ("🏆 Milestone", "100 times! Legendary status achieved!")
+}
 
 class PhraseTracker(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.data_file = 'data/phrase_tracker.json'
         self.tracked_phrases = self.load_tracked_phrases()
+        self.phrase_matchers = {}  # (guild_id, user_id) -> [(phrase, compiled regex)]
+        self.pending_hits = Counter()  # (guild_id, user_id, phrase) -> hits not yet saved
+        self.hit_flush_task = None
+        self.phrase_history = HitHistory('data/phrase_history.json')  # hourly/daily/weekly/monthly hits
+
+        # History backfills, checkpointed so they resume after a restart
+        self.backfill_file = 'data/phrase_backfills.json'
+        self.backfills = self.load_backfills()  # "guild:user:phrase" -> job
+        self.backfill_tasks = {}
+        self.backfill_resume_task = None
 
     def load_tracked_phrases(self):
         """Load tracked phrases from JSON file"""
@@ -28,11 +51,346 @@ class PhraseTracker(commands.Cog):
         with open(self.data_file, 'w') as f:
             json.dump(self.tracked_phrases, f, indent=2)
 
+    def load_backfills(self):
+        """Load backfill checkpoints from JSON file"""
+        if os.path.exists(self.backfill_file):
+            try:
+                with open(self.backfill_file, 'r') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError):
+                pass
+        return {}
+
+    def save_backfills(self):
+        """Save backfill checkpoints to JSON file"""
+        with open(self.backfill_file, 'w') as f:
+            json.dump(self.backfills, f)
+
+    async def cog_load(self):
+        """Called when the cog is loaded"""
+        router = self.bot.get_cog('MessageRouter')
+        if router:
+            router.register('PhraseTracker', self.handle_message)
+            for guild_id in self.tracked_phrases:
+                self.update_message_interest(guild_id)
+        else:
+            print("⚠️ MessageRouter is not loaded - PhraseTracker won't see any messages (load cogs.message_router before it)")
+        self.hit_flush_task = asyncio.create_task(self.hit_flush_loop())
+        if self.backfills:
+            self.backfill_resume_task = asyncio.create_task(self.resume_backfills())
+
+    def cog_unload(self):
+        """Clean up when cog is unloaded"""
+        router = self.bot.get_cog('MessageRouter')
+        if router:
+            router.unregister('PhraseTracker')
+        if self.hit_flush_task:
+            self.hit_flush_task.cancel()
+        if self.backfill_resume_task:
+            self.backfill_resume_task.cancel()
+        for task in self.backfill_tasks.values():
+            task.cancel()
+        self.flush_hits()
+        self.save_backfills()
+
+    def get_phrase_count(self, guild_id, user_id, phrase_lower):
+        """Saved phrase count plus hits still waiting in the buffer"""
+        saved = self.tracked_phrases[guild_id][user_id]['phrases'][phrase_lower]['count']
+        return saved + self.pending_hits[(guild_id, user_id, phrase_lower)]
+
+    def drop_pending_hits(self, guild_id, user_id, phrase_lower):
+        """Forget a phrase's unsaved hits, its history and any backfill still counting it"""
+        self.pending_hits.pop((guild_id, user_id, phrase_lower), None)
+        self.phrase_history.drop((guild_id, user_id, phrase_lower))
+
+        key = f"{guild_id}:{user_id}:{phrase_lower}"
+        task = self.backfill_tasks.pop(key, None)
+        if task:
+            task.cancel()
+        if self.backfills.pop(key, None):
+            self.save_backfills()
+
+    def flush_hits(self):
+        """Fold buffered phrase hits into the saved counts with one write"""
+        if not self.pending_hits:
+            return
+        for (guild_id, user_id, phrase_lower), hits in self.pending_hits.items():
+            phrase_data = self.tracked_phrases.get(guild_id, {}).get(user_id, {}).get('phrases', {}).get(phrase_lower)
+            if phrase_data:  # Phrase may have been untracked since
+                phrase_data['count'] += hits
+        self.pending_hits.clear()
+        self.save_tracked_phrases()
+        self.phrase_history.save()
+
+    async def hit_flush_loop(self):
+        """Write buffered hit counts every HIT_FLUSH_INTERVAL seconds"""
+        while True:
+            await asyncio.sleep(HIT_FLUSH_INTERVAL)
+            try:
+                self.flush_hits()
+            except Exception as e:
+                print(f"Error flushing phrase hits: {e}")
+
+    def update_message_interest(self, guild_id):
+        """Only receive a guild's messages while it has phrases tracked"""
+        router = self.bot.get_cog('MessageRouter')
+        if router and 'PhraseTracker' in router.listeners:
+            router.set_interest('PhraseTracker', guild_id, bool(self.tracked_phrases.get(guild_id)))
+
+    def get_phrase_matcher(self, guild_id, user_id):
+        """Compile each of a user's phrases once, cached until their phrases change"""
+        key = (guild_id, user_id)
+        if key not in self.phrase_matchers:
+            phrases = self.tracked_phrases[guild_id][user_id]['phrases']
+            matchers = []
+            for phrase_lower, phrase_data in phrases.items():
+                pattern = re.escape(phrase_lower)
+                # Phrases saved before modes existed have no 'mode' and keep substring matching
+                if phrase_data.get('mode', 'substring') == 'word':
+                    # Lookarounds instead of \b so phrases may start or end with emoji/punctuation
+                    pattern = rf'(?<!\w){pattern}(?!\w)'
+                matchers.append((phrase_lower, re.compile(pattern)))
+            self.phrase_matchers[key] = matchers
+        return self.phrase_matchers[key]
+
+    def find_phrases(self, guild_id, user_id, message_content):
+        """Count a user's tracked phrases in a lowercased message.
+
+        Every phrase is scanned on its own, so nested phrases ("gg" inside
+        "gg wp") are each counted.
+        """
+        phrases = self.tracked_phrases[guild_id][user_id]['phrases']
+        hits = {}
+        for phrase_lower, pattern in self.get_phrase_matcher(guild_id, user_id):
+            if phrases[phrase_lower].get('count_all'):
+                occurrences = sum(1 for _ in pattern.finditer(message_content))
+            else:
+                occurrences = 1 if pattern.search(message_content) else 0
+            if occurrences:
+                hits[phrase_lower] = occurrences
+        return hits
+
+    def describe_mode(self, phrase_data):
+        mode = "Whole word" if phrase_data.get('mode', 'substring') == 'word' else "Substring"
+        if phrase_data.get('count_all'):
+            mode += ", every occurrence"
+        return mode
+
+    def start_backfill(self, guild_id, user_id, phrase_lower, days, progress_message):
+        """Create a checkpointed job that counts the phrase in the last `days` of history"""
+        guild = self.bot.get_guild(int(guild_id))
+        channels = [
+            channel for channel in guild.text_channels
+            if channel.permissions_for(guild.me).read_message_history
+            and channel.permissions_for(guild.me).view_channel
+        ]
+        now = time.time()
+        key = f"{guild_id}:{user_id}:{phrase_lower}"
+        self.backfills[key] = {
+            'guild_id': guild_id,
+            'user_id': user_id,
+            'phrase': phrase_lower,
+            'started_at': now,  # Live tracking counts everything newer than this
+            'after': now - days * 86400,
+            'progress': [progress_message.channel.id, progress_message.id],
+            'scanned': 0,
+            'found': 0,
+            # channel id -> oldest message id counted so far (None until the first batch), or True when finished
+            'channels': {str(channel.id): None for channel in channels}
+        }
+        self.save_backfills()
+        self.backfill_tasks[key] = asyncio.create_task(self.run_backfill(key))
+
+    async def resume_backfills(self):
+        """Pick up backfills that were interrupted by a restart"""
+        await self.bot.wait_until_ready()
+        for key in list(self.backfills):
+            if key not in self.backfill_tasks:
+                self.backfill_tasks[key] = asyncio.create_task(self.run_backfill(key))
+
+    async def wait_for_history_bucket(self, channel_id):
+        """Sleep out the channel's message-history rate limit bucket if it is empty"""
+        info = getattr(self.bot, 'rate_limits', {}).get(('messages', channel_id))
+        if not info:
+            return
+        age = time.monotonic() - info['seen_at']
+        if info['remaining'] <= 0 and age < info['reset_after']:
+            await asyncio.sleep(info['reset_after'] - age)
+
+    async def stream_history(self, channel, job):
+        """Yield the channel's messages newest first, from its checkpoint back to the job's cutoff"""
+        checkpoint = job['channels'][str(channel.id)]
+        before = discord.Object(id=checkpoint) if checkpoint else datetime.fromtimestamp(job['started_at'], timezone.utc)
+        after = datetime.fromtimestamp(job['after'], timezone.utc)
+
+        scanned = 0
+        async for message in channel.history(limit=None, before=before, after=after, oldest_first=False):
+            yield message
+            scanned += 1
+            if scanned % 100 == 0:
+                # History is fetched 100 at a time; check the bucket before the next page
+                await self.wait_for_history_bucket(channel.id)
+
+    async def count_batches(self, messages, job):
+        """Group a message stream into batches of (scanned, hit timestamps, oldest message id)"""
+        guild_id, user_id, phrase_lower = job['guild_id'], job['user_id'], job['phrase']
+        scanned = 0
+        hits = []
+        oldest_id = None
+        async for message in messages:
+            scanned += 1
+            oldest_id = message.id
+            if str(message.author.id) == user_id and message.content:
+                occurrences = self.find_phrases(guild_id, user_id, message.content.lower()).get(phrase_lower, 0)
+                if occurrences:
+                    hits.append((message.created_at.timestamp(), occurrences))
+            if scanned == BACKFILL_BATCH_SIZE:
+                yield scanned, hits, oldest_id
+                scanned = 0
+                hits = []
+        if scanned:
+            yield scanned, hits, oldest_id
+
+    async def backfill_channel(self, channel, job, run):
+        """Count one channel, saving each batch's counts and then its checkpoint"""
+        key = (job['guild_id'], job['user_id'], job['phrase'])
+        for attempt in range(BACKFILL_RETRIES + 1):
+            try:
+                async for scanned, hits, oldest_id in self.count_batches(self.stream_history(channel, job), job):
+                    for timestamp, occurrences in hits:
+                        self.pending_hits[key] += occurrences
+                        self.phrase_history.record(key, occurrences, timestamp)
+                    job['channels'][str(channel.id)] = oldest_id
+                    job['scanned'] += scanned
+                    job['found'] += sum(occurrences for _, occurrences in hits)
+                    run['scanned'] += scanned
+                    # Counts hit the disk before the checkpoint that says they were counted
+                    self.flush_hits()
+                    self.save_backfills()
+                break
+            except discord.Forbidden:
+                break  # Lost access mid-scan; nothing more to read here
+            except discord.HTTPException as e:
+                if attempt == BACKFILL_RETRIES:
+                    # The checkpoint is saved, so the next start picks up from here
+                    print(f"Phrase backfill stopped in channel {channel.id}: {e}")
+                    run['failed'].append(channel.id)
+                    return
+                # Resume from the last checkpoint after a growing pause
+                await asyncio.sleep(5 * 2 ** attempt)
+        job['channels'][str(channel.id)] = True
+        self.save_backfills()
+
+    def build_backfill_embed(self, job, run, finished=False):
+        elapsed = max(time.monotonic() - run['started'], 0.001)
+        done = sum(1 for checkpoint in job['channels'].values() if checkpoint is True)
+        embed = discord.Embed(
+            title="✅ Phrase Backfill Complete" if finished else "🔄 Backfilling Phrase History",
+            description=f'Counting "{job["phrase"]}" for <@{job["user_id"]}>',
+            color=COLORS['success'] if finished else COLORS['info']
+        )
+        embed.add_field(name="📨 Scanned", value=f"{job['scanned']:,} messages", inline=True)
+        embed.add_field(name="⚡ Speed", value=f"{run['scanned'] / elapsed:,.0f} msg/s", inline=True)
+        embed.add_field(name="🎯 Found", value=str(job['found']), inline=True)
+        embed.add_field(name="📁 Channels", value=f"{done}/{len(job['channels'])}", inline=True)
+        if run['failed']:
+            embed.add_field(
+                name="⚠️ Stopped",
+                value=" ".join(f"<#{channel_id}>" for channel_id in run['failed']) + "\nThese resume from their checkpoint on the next restart.",
+                inline=False
+            )
+        return embed
+
+    async def run_backfill(self, key):
+        """Scan every unfinished channel of a job, a few at a time, with a live progress message"""
+        job = self.backfills[key]
+        guild = self.bot.get_guild(int(job['guild_id']))
+        if job['phrase'] not in self.tracked_phrases.get(job['guild_id'], {}).get(job['user_id'], {}).get('phrases', {}):
+            del self.backfills[key]  # Phrase was untracked while the bot was offline
+            self.save_backfills()
+            return
+        run = {'started': time.monotonic(), 'scanned': 0, 'failed': []}
+        progress_channel = self.bot.get_channel(job['progress'][0])
+        progress = progress_channel.get_partial_message(job['progress'][1]) if progress_channel else None
+
+        async def report():
+            while True:
+                await asyncio.sleep(5)
+                try:
+                    await progress.edit(embed=self.build_backfill_embed(job, run))
+                except discord.HTTPException:
+                    pass
+
+        semaphore = asyncio.Semaphore(BACKFILL_CONCURRENCY)
+
+        async def worker(channel_id):
+            channel = guild.get_channel(int(channel_id)) if guild else None
+            if channel is None:
+                job['channels'][channel_id] = True  # Channel was deleted
+                return
+            async with semaphore:
+                await self.backfill_channel(channel, job, run)
+
+        reporter = asyncio.create_task(report()) if progress else None
+        try:
+            pending = [channel_id for channel_id, checkpoint in job['channels'].items() if checkpoint is not True]
+            await asyncio.gather(*(worker(channel_id) for channel_id in pending))
+        finally:
+            if reporter:
+                reporter.cancel()
+            if self.backfill_tasks.get(key) is asyncio.current_task():
+                del self.backfill_tasks[key]
+
+        if any(checkpoint is not True for checkpoint in job['channels'].values()):
+            # Some channels kept failing; they resume from their checkpoints next start
+            self.save_backfills()
+            if progress:
+                try:
+                    await progress.edit(embed=self.build_backfill_embed(job, run))
+                except discord.HTTPException:
+                    pass
+            return
+
+        del self.backfills[key]
+        self.save_backfills()
+        self.flush_hits()
+        if progress:
+            try:
+                await progress.edit(embed=self.build_backfill_embed(job, run, finished=True))
+            except discord.HTTPException:
+                pass
+
     @commands.command(name='trackphrase')
     @commands.has_permissions(manage_messages=True)
     async def track_phrase(self, ctx, user: discord.Member, *, phrase: str):
         """Track how many times a user says a specific phrase (Admin only)
-        Usage: !trackphrase @user hello i am jeff"""
+        Usage: !trackphrase @user [--substring] [--all] hello i am jeff [--backfill [days]]
+        --substring also counts the phrase inside other words
+        --all counts every time it appears in a message, not just once
+        --backfill also counts the phrase in past messages (default 30 days)"""
+        
+        # Leading flags choose how the phrase is matched
+        mode = 'word'
+        count_all = False
+        words = phrase.split()
+        while words and words[0] in ('--substring', '--all'):
+            if words.pop(0) == '--substring':
+                mode = 'substring'
+            else:
+                count_all = True
+        
+        # Trailing --backfill [days] counts past messages too
+        backfill_days = None
+        if len(words) >= 2 and words[-2] == '--backfill' and words[-1].isdigit():
+            backfill_days = min(max(int(words[-1]), 1), BACKFILL_MAX_DAYS)
+            words = words[:-2]
+        elif words and words[-1] == '--backfill':
+            backfill_days = BACKFILL_DEFAULT_DAYS
+            words = words[:-1]
+        phrase = ' '.join(words)
+        if not phrase:
+            await ctx.send("❌ Please give a phrase to track!")
+            return
         
         guild_id = str(ctx.guild.id)
         user_id = str(user.id)
@@ -55,8 +413,13 @@ class PhraseTracker(commands.Cog):
             'original_phrase': phrase,
             'count': 0,
             'added_by': str(ctx.author),
-            'added_by_id': ctx.author.id
+            'added_by_id': ctx.author.id,
+            'mode': mode,
+            'count_all': count_all
         }
+        self.drop_pending_hits(guild_id, user_id, phrase_lower)
+        self.phrase_matchers.pop((guild_id, user_id), None)
+        self.update_message_interest(guild_id)
         
         self.save_tracked_phrases()
         
@@ -81,9 +444,28 @@ class PhraseTracker(commands.Cog):
             value="0",
             inline=True
         )
+        embed.add_field(
+            name="🔍 Matching",
+            value=self.describe_mode(self.tracked_phrases[guild_id][user_id]['phrases'][phrase_lower]),
+            inline=True
+        )
+        if backfill_days:
+            embed.add_field(
+                name="⏪ Backfill",
+                value=f"Counting the last {backfill_days} day(s) of messages...",
+                inline=False
+            )
         embed.set_footer(text=f"Added by {ctx.author.display_name}")
         
         await ctx.send(embed=embed)
+        
+        if backfill_days:
+            progress = await ctx.send(embed=discord.Embed(
+                title="🔄 Backfilling Phrase History",
+                description="Starting...",
+                color=COLORS['info']
+            ))
+            self.start_backfill(guild_id, user_id, phrase_lower, backfill_days, progress)
 
     @commands.command(name='untrackphrase')
     @commands.has_permissions(manage_messages=True)
@@ -103,10 +485,12 @@ class PhraseTracker(commands.Cog):
             return
         
         # Get the count before removing
-        count = self.tracked_phrases[guild_id][user_id]['phrases'][phrase_lower]['count']
+        count = self.get_phrase_count(guild_id, user_id, phrase_lower)
         
         # Remove the phrase
         del self.tracked_phrases[guild_id][user_id]['phrases'][phrase_lower]
+        self.drop_pending_hits(guild_id, user_id, phrase_lower)
+        self.phrase_matchers.pop((guild_id, user_id), None)
         
         # Clean up empty user data
         if not self.tracked_phrases[guild_id][user_id]['phrases']:
@@ -115,6 +499,7 @@ class PhraseTracker(commands.Cog):
         # Clean up empty guild data
         if not self.tracked_phrases[guild_id]:
             del self.tracked_phrases[guild_id]
+        self.update_message_interest(guild_id)
         
         self.save_tracked_phrases()
         
@@ -172,7 +557,7 @@ class PhraseTracker(commands.Cog):
             else:
                 phrase_list = []
                 for phrase_lower, data in user_data['phrases'].items():
-                    phrase_list.append(f'"{data["original_phrase"]}" - **{data["count"]}** times')
+                    phrase_list.append(f'"{data["original_phrase"]}" - **{self.get_phrase_count(guild_id, user_id, phrase_lower)}** times')
                 
                 embed.description = "\n".join(phrase_list)
             
@@ -194,7 +579,7 @@ class PhraseTracker(commands.Cog):
                 username = user_obj.display_name if user_obj else user_data['display_name']
                 
                 phrase_count = len(user_data['phrases'])
-                total_phrase_uses = sum(data['count'] for data in user_data['phrases'].values())
+                total_phrase_uses = sum(self.get_phrase_count(guild_id, user_id, phrase_lower) for phrase_lower in user_data['phrases'])
                 
                 if phrase_count > 0:
                     user_summaries.append(f"**{username}**: {phrase_count} phrases, {total_phrase_uses} total uses")
@@ -213,6 +598,41 @@ class PhraseTracker(commands.Cog):
         
         await ctx.send(embed=embed)
 
+    @commands.command(name='phrasetrend')
+    async def phrase_trend(self, ctx, user: discord.Member, *, phrase: str):
+        """Show how often a user said a tracked phrase over time
+        Usage: !phrasetrend @user [--hour|--day|--week|--month] hello i am jeff"""
+        
+        resolution = 'day'
+        words = phrase.split()
+        if words and words[0].startswith('--') and words[0][2:] in RESOLUTIONS:
+            resolution = words.pop(0)[2:]
+        phrase_lower = ' '.join(words).lower()
+        
+        guild_id = str(ctx.guild.id)
+        user_id = str(user.id)
+        if phrase_lower not in self.tracked_phrases.get(guild_id, {}).get(user_id, {}).get('phrases', {}):
+            await ctx.send("❌ That phrase is not being tracked for this user!")
+            return
+        
+        phrase_data = self.tracked_phrases[guild_id][user_id]['phrases'][phrase_lower]
+        series = self.phrase_history.get((guild_id, user_id, phrase_lower))
+        counts = series.recent(resolution) if series else [0] * RESOLUTIONS[resolution]
+        
+        embed = discord.Embed(
+            title=f"📈 Phrase Trend for {user.display_name}",
+            description=f'"{phrase_data["original_phrase"]}" over the last {len(counts)} {resolution}s, oldest first\n`{text_sparkline(counts)}`',
+            color=COLORS['info']
+        )
+        embed.add_field(name="📊 In Period", value=str(sum(counts)), inline=True)
+        embed.add_field(name=f"🔥 Busiest {resolution.title()}", value=str(max(counts)), inline=True)
+        embed.add_field(name="🏆 All Time", value=str(self.get_phrase_count(guild_id, user_id, phrase_lower)), inline=True)
+        
+        # Drawing the chart is CPU work, so keep it off the event loop
+        chart = await asyncio.to_thread(render_sparkline, counts)
+        embed.set_image(url="attachment://trend.png")
+        await ctx.send(embed=embed, file=discord.File(chart, filename="trend.png"))
+
     @commands.command(name='listphrases')
     async def list_phrases(self, ctx, user: discord.Member = None):
         """List all tracked phrases with detailed information
@@ -244,7 +664,7 @@ class PhraseTracker(commands.Cog):
                 for phrase_lower, data in user_data['phrases'].items():
                     embed.add_field(
                         name=f'"{data["original_phrase"]}"',
-                        value=f"**Count:** {data['count']}\n**Added by:** {data['added_by']}",
+                        value=f"**Count:** {self.get_phrase_count(guild_id, user_id, phrase_lower)}\n**Matching:** {self.describe_mode(data)}\n**Added by:** {data['added_by']}",
                         inline=False
                     )
             
@@ -264,7 +684,7 @@ class PhraseTracker(commands.Cog):
                 
                 for phrase_lower, data in user_data['phrases'].items():
                     phrase_entries.append(
-                        f"**{username}**: \"{data['original_phrase']}\" ({data['count']} times)"
+                        f"**{username}**: \"{data['original_phrase']}\" ({self.get_phrase_count(guild_id, user_id, phrase_lower)} times)"
                     )
             
             if phrase_entries:
@@ -279,13 +699,8 @@ class PhraseTracker(commands.Cog):
         
         await ctx.send(embed=embed)
 
-    @commands.Cog.listener()
-    async def on_message(self, message):
-        """Listen for messages and check for tracked phrases"""
-        # Ignore bot messages and DMs
-        if message.author.bot or not message.guild:
-            return
-        
+    async def handle_message(self, message, context):
+        """Check routed messages for tracked phrases"""
         guild_id = str(message.guild.id)
         user_id = str(message.author.id)
         
@@ -297,79 +712,68 @@ class PhraseTracker(commands.Cog):
         if user_id not in self.tracked_phrases[guild_id]:
             return
         
-        message_content = message.content.lower()
+        message_content = context.lower
         user_data = self.tracked_phrases[guild_id][user_id]
+        if not user_data['phrases']:
+            return
         
-        # Check each tracked phrase for this user
-        for phrase_lower, phrase_data in user_data['phrases'].items():
-            if phrase_lower in message_content:
-                # Increment the count
-                phrase_data['count'] += 1
-                self.save_tracked_phrases()
-                
-                # Create and send the tracking embed
-                embed = discord.Embed(
-                    title="🎯 Phrase Detected!",
-                    color=COLORS['primary']
-                )
-                
-                embed.add_field(
-                    name="👤 User",
-                    value=message.author.mention,
-                    inline=True
-                )
-                embed.add_field(
-                    name="💬 Phrase",
-                    value=f'"{phrase_data["original_phrase"]}"',
-                    inline=True
-                )
-                embed.add_field(
-                    name="📊 Count",
-                    value=f"**{phrase_data['count']}** times",
-                    inline=True
-                )
-                
-                embed.set_footer(
-                    text=f"Phrase tracking by {phrase_data['added_by']}",
-                    icon_url=message.author.avatar.url if message.author.avatar else message.author.default_avatar.url
-                )
-                
-                # Add some fun reactions based on count milestones
-                if phrase_data['count'] == 1:
-                    embed.add_field(
-                        name="🎉 Milestone",
-                        value="First time saying this phrase!",
-                        inline=False
-                    )
-                elif phrase_data['count'] == 10:
-                    embed.add_field(
-                        name="🔥 Milestone",
-                        value="10th time! Getting consistent!",
-                        inline=False
-                    )
-                elif phrase_data['count'] == 50:
-                    embed.add_field(
-                        name="⭐ Milestone",
-                        value="50 times! This is becoming a habit!",
-                        inline=False
-                    )
-                elif phrase_data['count'] == 100:
-                    embed.add_field(
-                        name="🏆 Milestone",
-                        value="100 times! Legendary status achieved!",
-                        inline=False
-                    )
-                elif phrase_data['count'] % 25 == 0 and phrase_data['count'] > 100:
-                    embed.add_field(
-                        name="💎 Milestone",
-                        value=f"{phrase_data['count']} times! Still going strong!",
-                        inline=False
-                    )
-                
-                await message.channel.send(embed=embed, delete_after=30)
-                
-                # Only trigger once per message even if multiple phrases match
-                break
+        hits = self.find_phrases(guild_id, user_id, message_content)
+        if not hits:
+            return
+        
+        milestones = []
+        counts = {}
+        for phrase_lower, occurrences in hits.items():
+            previous = self.get_phrase_count(guild_id, user_id, phrase_lower)
+            # Count the hits in memory; hit_flush_loop writes them out
+            self.pending_hits[(guild_id, user_id, phrase_lower)] += occurrences
+            self.phrase_history.record((guild_id, user_id, phrase_lower), occurrences)
+            counts[phrase_lower] = previous + occurrences
+            
+            # Add some fun reactions based on count milestones (a multi-hit message can pass several)
+            for count in range(previous + 1, counts[phrase_lower] + 1):
+                if count in PHRASE_MILESTONES:
+                    milestones.append(PHRASE_MILESTONES[count])
+                elif count % 25 == 0 and count > 100:
+                    milestones.append(("💎 Milestone", f"{count} times! Still going strong!"))
+        
+        # Busy channels get a periodic "+N more" summary instead of one embed per hit
+        throttle = self.bot.get_cog('ResponseThrottle')
+        if throttle and not throttle.allow(message, 'phrase detections'):
+            return
+        
+        # Create and send one tracking embed for the whole message
+        first = user_data['phrases'][next(iter(hits))]
+        embed = discord.Embed(
+            title="🎯 Phrase Detected!" if len(hits) == 1 else "🎯 Phrases Detected!",
+            color=COLORS['primary']
+        )
+        
+        embed.add_field(
+            name="👤 User",
+            value=message.author.mention,
+            inline=True
+        )
+        embed.add_field(
+            name="💬 Phrase" if len(hits) == 1 else "💬 Phrases",
+            value="\n".join(f'"{user_data["phrases"][phrase_lower]["original_phrase"]}"' for phrase_lower in hits),
+            inline=True
+        )
+        embed.add_field(
+            name="📊 Count",
+            value="\n".join(f"**{counts[phrase_lower]}** times" for phrase_lower in hits),
+            inline=True
+        )
+        
+        embed.set_footer(
+            text=f"Phrase tracking by {first['added_by']}",
+            icon_url=message.author.avatar.url if message.author.avatar else message.author.default_avatar.url
+        )
+        
+        for name, value in milestones[:3]:
+            embed.add_field(name=name, value=value, inline=False)
+        
+        await message.channel.send(embed=embed, delete_after=30)
 
     @track_phrase.error
     @untrack_phrase.error
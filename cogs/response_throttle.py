@@ -0,0 +1,167 @@
+import discord
+from discord.ext import commands
+import json
+import os
+import time
+import asyncio
+from config import COLORS, AUTO_RESPONSE_CHANNEL_RATE, AUTO_RESPONSE_USER_RATE, AUTO_RESPONSE_SUMMARY_INTERVAL
+
+class TokenBucket:
+    """Allows `rate` sends per minute with bursts up to `rate`, refilled lazily on use"""
+
+    __slots__ = ('tokens', 'updated')
+
+    def __init__(self, rate):
+        self.tokens = float(rate)
+        self.updated = time.monotonic()
+
+    def refill(self, rate, now):
+        self.tokens = min(float(rate), self.tokens + (now - self.updated) * rate / 60)
+        self.updated = now
+
+class ResponseThrottle(commands.Cog):
+    """Rate limits automatic responses per channel and per user, summarising what was held back"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.data_file = 'data/response_throttle.json'
+        self.settings = self.load_settings()
+        self.buckets = {}  # ('channel', channel_id) / ('user', guild_id, user_id) -> TokenBucket
+        self.suppressed = {}  # channel_id -> {label: hits held back since the last summary}
+        self.summary_task = None
+        self.stats = {'sent': 0, 'suppressed': 0, 'summaries': 0}
+
+    async def cog_load(self):
+        """Called when the cog is loaded"""
+        self.summary_task = asyncio.create_task(self.summary_loop())
+
+    def cog_unload(self):
+        """Clean up when cog is unloaded"""
+        if self.summary_task:
+            self.summary_task.cancel()
+
+    def load_settings(self):
+        """Load throttle settings from JSON file"""
+        if not os.path.exists('data'):
+            os.makedirs('data')
+
+        if os.path.exists(self.data_file):
+            try:
+                with open(self.data_file, 'r') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError):
+                return {}
+        return {}
+
+    def save_settings(self):
+        """Save throttle settings to JSON file"""
+        with open(self.data_file, 'w') as f:
+            json.dump(self.settings, f, indent=2)
+
+    def get_guild_rates(self, guild_id):
+        """Responses per minute allowed per channel and per user in a guild"""
+        settings = self.settings.get(str(guild_id), {})
+        return (
+            settings.get('channel_rate', AUTO_RESPONSE_CHANNEL_RATE),
+            settings.get('user_rate', AUTO_RESPONSE_USER_RATE)
+        )
+
+    def get_bucket(self, key, rate, now):
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = TokenBucket(rate)
+        else:
+            bucket.refill(rate, now)
+        return bucket
+
+    def allow(self, message, label):
+        """Take a token for an automatic response to `message`.
+
+        Returns False when the channel or the author is out of tokens; the hit
+        is then counted under `label` (e.g. "triggers") for the next summary.
+        """
+        channel_rate, user_rate = self.get_guild_rates(message.guild.id)
+        now = time.monotonic()
+        channel_bucket = self.get_bucket(('channel', message.channel.id), channel_rate, now)
+        user_bucket = self.get_bucket(('user', message.guild.id, message.author.id), user_rate, now)
+
+        if channel_bucket.tokens < 1 or user_bucket.tokens < 1:
+            held = self.suppressed.setdefault(message.channel.id, {})
+            held[label] = held.get(label, 0) + 1
+            self.stats['suppressed'] += 1
+            return False
+
+        channel_bucket.tokens -= 1
+        user_bucket.tokens -= 1
+        self.stats['sent'] += 1
+        return True
+
+    async def summary_loop(self):
+        """Every AUTO_RESPONSE_SUMMARY_INTERVAL seconds, post one summary per channel that had responses held back"""
+        await self.bot.wait_until_ready()
+
+        while True:
+            try:
+                await asyncio.sleep(AUTO_RESPONSE_SUMMARY_INTERVAL)
+                suppressed, self.suppressed = self.suppressed, {}
+
+                for channel_id, held in suppressed.items():
+                    channel = self.bot.get_channel(channel_id)
+                    if channel is None:
+                        continue
+                    parts = [f"+{count} more {label}" for label, count in held.items()]
+                    try:
+                        await channel.send(f"🤫 {' and '.join(parts)} (held back to keep the channel readable)", delete_after=30)
+                        self.stats['summaries'] += 1
+                    except discord.HTTPException:
+                        pass
+
+                # Forget buckets that have refilled completely; they'd start full anyway
+                now = time.monotonic()
+                for key, bucket in list(self.buckets.items()):
+                    if now - bucket.updated > 60:
+                        del self.buckets[key]
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error in response throttle summary: {e}")
+
+    @commands.command(name='autolimit')
+    @commands.has_permissions(manage_guild=True)
+    async def auto_limit(self, ctx, channel_rate: int = None, user_rate: int = None):
+        """Set how many automatic responses per minute are sent per channel and per user (Admin only)
+        Usage: !autolimit [per_channel] [per_user]"""
+        if channel_rate is not None:
+            if channel_rate < 1 or (user_rate is not None and user_rate < 1):
+                await ctx.send("❌ Limits must be at least 1 per minute!", delete_after=10)
+                return
+            settings = self.settings.setdefault(str(ctx.guild.id), {})
+            settings['channel_rate'] = channel_rate
+            if user_rate is not None:
+                settings['user_rate'] = user_rate
+            self.save_settings()
+
+        channel_rate, user_rate = self.get_guild_rates(ctx.guild.id)
+        embed = discord.Embed(
+            title="🚦 Automatic Response Limits",
+            description="Insult triggers and phrase detections beyond these limits are folded into one summary message.",
+            color=COLORS['info']
+        )
+        embed.add_field(name="📺 Per Channel", value=f"{channel_rate} per minute", inline=True)
+        embed.add_field(name="👤 Per User", value=f"{user_rate} per minute", inline=True)
+        embed.add_field(
+            name="📊 Since Startup",
+            value=f"**Sent:** {self.stats['sent']}\n**Held back:** {self.stats['suppressed']}\n**Summaries:** {self.stats['summaries']}\n**Sends saved:** {self.stats['suppressed'] - self.stats['summaries']}",
+            inline=False
+        )
+        await ctx.send(embed=embed)
+
+    @auto_limit.error
+    async def auto_limit_error(self, ctx, error):
+        if isinstance(error, commands.MissingPermissions):
+            await ctx.send("❌ You need 'Manage Server' permission to use this command!")
+        elif isinstance(error, commands.BadArgument):
+            await ctx.send("❌ Usage: `!autolimit [per_channel] [per_user]`", delete_after=10)
+
+async def setup(bot):
+    await bot.add_cog(ResponseThrottle(bot))
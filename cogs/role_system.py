@@ -2,11 +2,15 @@ import discord
 from discord.ext import commands
 import json
 import os
-from datetime import datetime
-from config import COLORS
+import asyncio
+import heapq
+import re
+import time
+from datetime import datetime, timezone
+from config import COLORS, ROLE_QUEUE_DEBOUNCE
 
 class RoleButton(discord.ui.Button):
-    def __init__(self, role_id: int, label: str, emoji: str, style: discord.ButtonStyle, custom_id: str):
+    def __init__(self, role_id: int, label: str, emoji: str, style: discord.ButtonStyle, custom_id: str, duration: int = None):
         super().__init__(
             label=label,
             emoji=emoji,
@@ -14,6 +18,7 @@ class RoleButton(discord.ui.Button):
             custom_id=custom_id
         )
         self.role_id = role_id
+        self.duration = duration  # Seconds until a panel-granted role expires, None for permanent
 
     async def callback(self, interaction: discord.Interaction):
         # Get the role
@@ -22,35 +27,31 @@ class RoleButton(discord.ui.Button):
             await interaction.response.send_message("❌ This role no longer exists!", ephemeral=True, delete_after=10)
             return
 
-        # Check if user already has the role
-        if role in interaction.user.roles:
-            try:
-                await interaction.user.remove_roles(role)
-                embed = discord.Embed(
-                    title="✅ Role Removed!",
-                    description=f"**{role.name}** has been removed from you.",
-                    color=COLORS['warning']
-                )
-                embed.set_footer(text="Auto-deletes in 10s")
-                await interaction.response.send_message(embed=embed, ephemeral=True, delete_after=10)
-            except discord.Forbidden:
-                await interaction.response.send_message("❌ I don't have permission to remove roles!", ephemeral=True, delete_after=10)
-            except discord.HTTPException:
-                await interaction.response.send_message("❌ Failed to remove role. Please try again.", ephemeral=True, delete_after=10)
+        cog = interaction.client.get_cog('RoleSystem')
+
+        # Toggle against the state the member will have once pending clicks land
+        if cog.will_have_role(interaction.user, role):
+            cog.queue_role_change(interaction, role, add=False)
+            cog.cancel_temp_role(interaction.guild.id, interaction.user.id, role.id)
+            embed = discord.Embed(
+                title="✅ Role Removed!",
+                description=f"**{role.name}** has been removed from you.",
+                color=COLORS['warning']
+            )
         else:
-            try:
-                await interaction.user.add_roles(role)
-                embed = discord.Embed(
-                    title="✅ Role Added!",
-                    description=f"**{role.name}** has been added to you.",
-                    color=COLORS['success']
-                )
-                embed.set_footer(text="Auto-deletes in 10s")
-                await interaction.response.send_message(embed=embed, ephemeral=True, delete_after=10)
-            except discord.Forbidden:
-                await interaction.response.send_message("❌ I don't have permission to assign roles!", ephemeral=True, delete_after=10)
-            except discord.HTTPException:
-                await interaction.response.send_message("❌ Failed to assign role. Please try again.", ephemeral=True, delete_after=10)
+            cog.queue_role_change(interaction, role, add=True)
+            embed = discord.Embed(
+                title="✅ Role Added!",
+                description=f"**{role.name}** has been added to you.",
+                color=COLORS['success']
+            )
+            if self.duration:
+                cog.schedule_temp_role(interaction.guild.id, interaction.user.id, role.id, self.duration)
+                embed.description += f"\nIt will expire in **{cog.format_duration(self.duration)}**."
+
+        # Acknowledge right away, the actual role update is batched
+        embed.set_footer(text="Auto-deletes in 10s")
+        await interaction.response.send_message(embed=embed, ephemeral=True, delete_after=10)
 
 class RolePanelView(discord.ui.View):
     def __init__(self, cog, panel_id: str):
@@ -89,7 +90,8 @@ class RolePanelView(discord.ui.View):
                             label=role_data['label'],
                             emoji=role_data.get('emoji', ''),
                             style=discord.ButtonStyle.primary,
-                            custom_id=f"role_{self.panel_id}_{role_data['role_id']}"
+                            custom_id=f"role_{self.panel_id}_{role_data['role_id']}",
+                            duration=role_data.get('duration')
                         )
                         self.add_item(button)
         except Exception as e:
@@ -337,11 +339,25 @@ class AddRoleModal(discord.ui.Modal, title="Add Role to Panel"):
         max_length=10
     )
 
+    duration = discord.ui.TextInput(
+        label="Expires After (optional)",
+        placeholder="Leave empty for permanent, or e.g. 30m, 12h, 7d",
+        required=False,
+        max_length=20
+    )
+
     async def on_submit(self, interaction: discord.Interaction):
         try:
             role_name = self.role_name.value
             button_label = self.button_label.value
             emoji = self.emoji.value or ""
+
+            duration = None
+            if self.duration.value:
+                duration = self.cog.parse_duration(self.duration.value)
+                if not duration:
+                    await interaction.response.send_message("❌ Invalid duration! Use something like 30m, 12h or 7d.", ephemeral=True, delete_after=15)
+                    return
             
             # Find role by name
             role = discord.utils.get(interaction.guild.roles, name=role_name)
@@ -350,7 +366,7 @@ class AddRoleModal(discord.ui.Modal, title="Add Role to Panel"):
                 return
 
             # Add role to panel
-            success = await self.cog.add_role_to_panel(interaction.guild.id, self.panel_id, role.id, button_label, emoji)
+            success = await self.cog.add_role_to_panel(interaction.guild.id, self.panel_id, role.id, button_label, emoji, duration)
             
             if success:
                 embed = discord.Embed(
@@ -361,6 +377,8 @@ class AddRoleModal(discord.ui.Modal, title="Add Role to Panel"):
                 embed.add_field(name="Button Label", value=button_label, inline=True)
                 if emoji:
                     embed.add_field(name="Emoji", value=emoji, inline=True)
+                if duration:
+                    embed.add_field(name="Expires After", value=self.cog.format_duration(duration), inline=True)
                 embed.set_footer(text="Auto-deletes in 15s")
                 
                 await interaction.response.send_message(embed=embed, ephemeral=True, delete_after=15)
@@ -499,12 +517,450 @@ class RemoveRoleModal(discord.ui.Modal, title="Remove Role from Panel"):
                 except:
                     print(f"Failed to send error message to user: {e}")
 
+class BulkRoleLimiter:
+    """Adaptive concurrency limit for bulk role jobs.
+
+    Wave sizes follow the X-RateLimit-Remaining header Discord last sent for
+    this guild's member routes (recorded by the trace in bot.py), grow by one
+    after each clean wave and halve when a wave gets rate limited or stalls.
+    """
+
+    def __init__(self, bot, guild_id, start=2, maximum=10, slow_wave=2.0):
+        self.bot = bot
+        self.guild_id = guild_id
+        self.limit = start
+        self.maximum = maximum
+        self.slow_wave = slow_wave
+
+    async def next_wave_size(self):
+        """How many role updates to send concurrently next, waiting out an empty bucket first"""
+        info = getattr(self.bot, 'rate_limits', {}).get(('members', self.guild_id))
+        if not info:
+            return self.limit
+
+        age = time.monotonic() - info['seen_at']
+        if age >= info['reset_after']:
+            return self.limit  # Bucket has reset since we last heard
+
+        if info['remaining'] <= 0:
+            await asyncio.sleep(info['reset_after'] - age)
+            return self.limit
+
+        return max(1, min(self.limit, info['remaining']))
+
+    def record_wave(self, elapsed, rate_limited):
+        if rate_limited or elapsed > self.slow_wave:
+            self.limit = max(1, self.limit // 2)
+        else:
+            self.limit = min(self.maximum, self.limit + 1)
+
 class RoleSystem(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.data_file = 'data/role_system.json'
+        self.panel_messages_file = 'data/role_panel_messages.json'
         self.role_panels = self.load_role_panels()
-        self.panel_messages = {}  # Store panel message IDs for each guild
+        self.panel_messages = self.load_panel_messages()  # guild -> panel -> {channel_id, message_id}
+
+        # Pending role clicks per member, flushed as a single member.edit()
+        self.role_queue = {}  # (guild_id, member_id) -> {'add', 'remove', 'clicks', 'interaction', 'task'}
+        self.role_queue_stats = {'clicks': 0, 'edits': 0, 'failed': 0}
+
+        # Bulk role jobs, checkpointed so they resume after a restart
+        self.role_jobs_file = 'data/role_jobs.json'
+        self.role_jobs = self.load_role_jobs()
+        self.running_jobs = {}  # job_id -> asyncio.Task
+        self.resume_jobs_task = None
+        self.job_message_edits = {}  # job_id -> monotonic time of last progress edit
+
+        # Temporary roles: "guild:member:role" -> expiry timestamp, plus a min-heap over
+        # (expiry, key) so a single sleeper task only ever looks at the soonest one.
+        # Heap entries whose expiry no longer matches the dict are stale and skipped.
+        self.temp_roles_file = 'data/temp_roles.json'
+        self.temp_role_expiries = self.load_temp_roles()
+        self.temp_role_heap = [(expires_at, key) for key, expires_at in self.temp_role_expiries.items()]
+        heapq.heapify(self.temp_role_heap)
+        self.temp_role_wakeup = asyncio.Event()
+        self.temp_role_task = None
+        self.temp_role_save_task = None
+
+        # Members per role, kept current from member events so callers
+        # don't have to scan the member cache through role.members
+        self.role_member_counts = {}  # guild_id -> {role_id: count}
+
+    async def cog_load(self):
+        """Called when the cog is loaded"""
+        # Resume unfinished bulk role jobs once the bot is ready
+        self.resume_jobs_task = asyncio.create_task(self.resume_role_jobs())
+
+        # One sleeper for every pending temporary role
+        self.temp_role_task = asyncio.create_task(self.temp_role_sleeper())
+
+    def cog_unload(self):
+        """Clean up when cog is unloaded"""
+        if self.temp_role_task:
+            self.temp_role_task.cancel()
+        if self.resume_jobs_task:
+            self.resume_jobs_task.cancel()
+        # Checkpoint running bulk role jobs, then stop them; the next load resumes them
+        self.save_role_jobs()
+        for task in self.running_jobs.values():
+            task.cancel()
+        self.running_jobs.clear()
+        self.save_temp_roles()
+
+    def load_panel_messages(self):
+        """Load the persisted panel message index from JSON file"""
+        if not os.path.exists('data'):
+            os.makedirs('data')
+
+        if os.path.exists(self.panel_messages_file):
+            try:
+                with open(self.panel_messages_file, 'r') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError):
+                return {}
+        return {}
+
+    def save_panel_messages(self):
+        """Save the panel message index to JSON file"""
+        with open(self.panel_messages_file, 'w') as f:
+            json.dump(self.panel_messages, f, indent=2)
+
+    def get_panel_location(self, guild_id, panel_id):
+        """Get the indexed {channel_id, message_id} for a displayed panel, or None"""
+        location = self.panel_messages.get(str(guild_id), {}).get(panel_id)
+        if isinstance(location, dict) and 'channel_id' in location and 'message_id' in location:
+            return location
+        return None
+
+    def set_panel_location(self, guild_id, panel_id, channel_id, message_id):
+        """Record where a panel is displayed and persist the index"""
+        guild_key = str(guild_id)
+        if guild_key not in self.panel_messages:
+            self.panel_messages[guild_key] = {}
+        self.panel_messages[guild_key][panel_id] = {
+            'channel_id': channel_id,
+            'message_id': message_id
+        }
+        self.save_panel_messages()
+
+    def clear_panel_location(self, guild_id, panel_id):
+        """Forget where a panel is displayed and persist the index"""
+        guild_key = str(guild_id)
+        if guild_key in self.panel_messages and panel_id in self.panel_messages[guild_key]:
+            del self.panel_messages[guild_key][panel_id]
+            if not self.panel_messages[guild_key]:
+                del self.panel_messages[guild_key]
+            self.save_panel_messages()
+
+    async def fetch_panel_message(self, guild, panel_id):
+        """Fetch a displayed panel message using the index (at most one API call).
+
+        Stale entries (channel or message gone) are dropped from the index.
+        Returns None if the panel isn't displayed or couldn't be fetched.
+        """
+        location = self.get_panel_location(guild.id, panel_id)
+        if not location:
+            return None
+
+        channel = guild.get_channel(location['channel_id'])
+        if not channel:
+            self.clear_panel_location(guild.id, panel_id)
+            return None
+
+        try:
+            return await channel.fetch_message(location['message_id'])
+        except discord.NotFound:
+            self.clear_panel_location(guild.id, panel_id)
+            return None
+        except discord.HTTPException:
+            # Forbidden or transient error - keep the entry for next time
+            return None
+
+    def will_have_role(self, member, role):
+        """Whether the member will have the role once queued changes are applied"""
+        pending = self.role_queue.get((member.guild.id, member.id))
+        if pending:
+            if role.id in pending['add']:
+                return True
+            if role.id in pending['remove']:
+                return False
+        return role in member.roles
+
+    def queue_role_change(self, interaction, role, add):
+        """Queue a role add/remove for the clicking member and (re)start its debounce timer"""
+        member = interaction.user
+        key = (member.guild.id, member.id)
+        pending = self.role_queue.get(key)
+
+        if not pending:
+            pending = {'add': set(), 'remove': set(), 'clicks': 0, 'interaction': None, 'task': None}
+            self.role_queue[key] = pending
+
+        # A later click on the same role cancels out the earlier one
+        if add:
+            pending['remove'].discard(role.id)
+            if role not in member.roles:
+                pending['add'].add(role.id)
+        else:
+            pending['add'].discard(role.id)
+            if role in member.roles:
+                pending['remove'].add(role.id)
+
+        pending['clicks'] += 1
+        pending['interaction'] = interaction
+        self.role_queue_stats['clicks'] += 1
+
+        if pending['task']:
+            pending['task'].cancel()
+        pending['task'] = asyncio.create_task(self.flush_role_queue(key))
+
+    async def flush_role_queue(self, key):
+        """Wait out the debounce window, then apply all queued changes in one request"""
+        try:
+            await asyncio.sleep(ROLE_QUEUE_DEBOUNCE)
+        except asyncio.CancelledError:
+            return  # Another click restarted the timer
+
+        pending = self.role_queue.pop(key, None)
+        if not pending or (not pending['add'] and not pending['remove']):
+            return
+
+        guild_id, member_id = key
+        guild = self.bot.get_guild(guild_id)
+        member = guild.get_member(member_id) if guild else None
+        if not member:
+            return
+
+        # Build the final role list from the freshest cached state
+        roles = {role.id: role for role in member.roles if not role.is_default()}
+        for role_id in pending['remove']:
+            roles.pop(role_id, None)
+        for role_id in pending['add']:
+            role = guild.get_role(role_id)
+            if role:
+                roles[role_id] = role
+
+        try:
+            await member.edit(roles=list(roles.values()), reason="Role panel selection")
+            self.role_queue_stats['edits'] += 1
+        except discord.HTTPException as e:
+            self.role_queue_stats['failed'] += 1
+            message = "❌ I don't have permission to update your roles!" if isinstance(e, discord.Forbidden) else "❌ Failed to update your roles. Please try again."
+            try:
+                await pending['interaction'].followup.send(message, ephemeral=True)
+            except discord.HTTPException:
+                pass
+
+    def get_role_queue_metrics(self):
+        """Queue depth and how many clicks each role update absorbed"""
+        depth = sum(len(p['add']) + len(p['remove']) for p in self.role_queue.values())
+        edits = self.role_queue_stats['edits'] + self.role_queue_stats['failed']
+        ratio = self.role_queue_stats['clicks'] / edits if edits else 0.0
+        return {
+            'members_waiting': len(self.role_queue),
+            'queue_depth': depth,
+            'clicks': self.role_queue_stats['clicks'],
+            'edits': self.role_queue_stats['edits'],
+            'failed': self.role_queue_stats['failed'],
+            'coalescing_ratio': ratio
+        }
+
+    def parse_duration(self, text: str):
+        """Parse '90m', '12h', '1d12h' or '2w' into seconds. Returns None if invalid"""
+        parts = re.findall(r'(\d+)\s*([smhdw])', text.lower())
+        if not parts or re.sub(r'[\dsmhdw\s]', '', text.lower()):
+            return None
+
+        units = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+        seconds = sum(int(amount) * units[unit] for amount, unit in parts)
+        if seconds < 60 or seconds > 365 * 86400:
+            return None  # Between a minute and a year
+        return seconds
+
+    def format_duration(self, seconds: int) -> str:
+        """Format seconds as e.g. '1d 12h' or '30m'"""
+        parts = []
+        for unit, size in [('d', 86400), ('h', 3600), ('m', 60)]:
+            if seconds >= size:
+                parts.append(f"{int(seconds // size)}{unit}")
+                seconds %= size
+        return " ".join(parts) or "<1m"
+
+    def format_panel_duration(self, role_data) -> str:
+        """Suffix shown next to temporary roles on a panel"""
+        duration = role_data.get('duration')
+        return f" (⏳ {self.format_duration(duration)})" if duration else ""
+
+    def load_temp_roles(self):
+        """Load pending temporary role expiries from JSON file"""
+        if not os.path.exists('data'):
+            os.makedirs('data')
+
+        if os.path.exists(self.temp_roles_file):
+            try:
+                with open(self.temp_roles_file, 'r') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError):
+                return {}
+        return {}
+
+    def save_temp_roles(self):
+        """Save pending temporary role expiries to JSON file"""
+        with open(self.temp_roles_file, 'w') as f:
+            json.dump(self.temp_role_expiries, f)
+
+    def queue_temp_roles_save(self):
+        """Coalesce saves so a burst of grants is a single file write"""
+        if self.temp_role_save_task and not self.temp_role_save_task.done():
+            return
+
+        async def save_later():
+            await asyncio.sleep(5)
+            self.save_temp_roles()
+
+        self.temp_role_save_task = asyncio.create_task(save_later())
+
+    def schedule_temp_role(self, guild_id, member_id, role_id, duration):
+        """Make a role expire `duration` seconds from now (replaces any earlier expiry)"""
+        key = f"{guild_id}:{member_id}:{role_id}"
+        expires_at = time.time() + duration
+
+        self.temp_role_expiries[key] = expires_at
+        heapq.heappush(self.temp_role_heap, (expires_at, key))
+        self.queue_temp_roles_save()
+
+        # Only wake the sleeper if this is now the soonest expiry
+        if self.temp_role_heap[0][1] == key:
+            self.temp_role_wakeup.set()
+        return expires_at
+
+    def cancel_temp_role(self, guild_id, member_id, role_id):
+        """Forget a pending expiry (its heap entry becomes stale)"""
+        if self.temp_role_expiries.pop(f"{guild_id}:{member_id}:{role_id}", None) is not None:
+            self.queue_temp_roles_save()
+
+    def pop_due_temp_roles(self, now):
+        """Pop every expiry that is due, skipping stale heap entries"""
+        due = []
+        while self.temp_role_heap and self.temp_role_heap[0][0] <= now:
+            expires_at, key = heapq.heappop(self.temp_role_heap)
+            if self.temp_role_expiries.get(key) == expires_at:
+                del self.temp_role_expiries[key]
+                due.append(key)
+
+        # Rebuild if cancelled/replaced entries have piled up
+        if len(self.temp_role_heap) > 2 * len(self.temp_role_expiries) + 1000:
+            self.temp_role_heap = [(expires_at, key) for key, expires_at in self.temp_role_expiries.items()]
+            heapq.heapify(self.temp_role_heap)
+
+        return due
+
+    async def expire_temp_roles(self, keys):
+        """Remove a batch of expired roles, one request per member"""
+        by_member = {}
+        for key in keys:
+            guild_id, member_id, role_id = (int(part) for part in key.split(':'))
+            by_member.setdefault((guild_id, member_id), []).append(role_id)
+
+        for (guild_id, member_id), role_ids in by_member.items():
+            guild = self.bot.get_guild(guild_id)
+            member = guild.get_member(member_id) if guild else None
+            if not member:
+                continue
+
+            roles = [role for role in member.roles if role.id in role_ids]
+            if not roles:
+                continue
+
+            try:
+                await member.remove_roles(*roles, reason="Temporary role expired", atomic=False)
+            except discord.HTTPException as e:
+                print(f"Failed to expire temporary roles for {member} in {guild.name}: {e}")
+
+    async def temp_role_sleeper(self):
+        """Single task that sleeps until the next expiry and removes whatever is due.
+
+        The first pass after startup catches up on everything that expired
+        while the bot was offline in one batch.
+        """
+        await self.bot.wait_until_ready()
+
+        while True:
+            try:
+                self.temp_role_wakeup.clear()
+                due = self.pop_due_temp_roles(time.time())
+
+                if due:
+                    print(f"⏳ Expiring {len(due)} temporary role(s)")
+                    await self.expire_temp_roles(due)
+                    self.queue_temp_roles_save()
+                    continue
+
+                timeout = self.temp_role_heap[0][0] - time.time() if self.temp_role_heap else None
+                try:
+                    await asyncio.wait_for(self.temp_role_wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error in temporary role sleeper: {e}")
+                await asyncio.sleep(60)
+
+    def build_role_member_counts(self, guild):
+        """Count members per role with one pass over the guild's member cache"""
+        counts = {}
+        for member in guild.members:
+            for role in member.roles:
+                if not role.is_default():
+                    counts[role.id] = counts.get(role.id, 0) + 1
+        self.role_member_counts[guild.id] = counts
+
+    def get_role_member_count(self, role):
+        """How many members have a role, without touching role.members"""
+        counts = self.role_member_counts.get(role.guild.id)
+        if counts is None:
+            return len(role.members)  # Index not built yet for this guild
+        return counts.get(role.id, 0)
+
+    def adjust_role_member_counts(self, guild_id, role_ids, delta):
+        counts = self.role_member_counts.get(guild_id)
+        if counts is None:
+            return
+        for role_id in role_ids:
+            counts[role_id] = max(0, counts.get(role_id, 0) + delta)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before, after):
+        """Keep role member counts current when a member's roles change"""
+        if before.roles == after.roles:
+            return
+        before_ids = {role.id for role in before.roles}
+        after_ids = {role.id for role in after.roles}
+        self.adjust_role_member_counts(after.guild.id, after_ids - before_ids, 1)
+        self.adjust_role_member_counts(after.guild.id, before_ids - after_ids, -1)
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member):
+        self.adjust_role_member_counts(member.guild.id, [role.id for role in member.roles if not role.is_default()], 1)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member):
+        self.adjust_role_member_counts(member.guild.id, [role.id for role in member.roles if not role.is_default()], -1)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role):
+        self.role_member_counts.get(role.guild.id, {}).pop(role.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild):
+        self.build_role_member_counts(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild):
+        self.role_member_counts.pop(guild.id, None)
 
     def load_role_panels(self):
         """Load role panel data from JSON file"""
@@ -598,9 +1054,20 @@ class RoleSystem(commands.Cog):
         
         del self.role_panels[guild_key][panel_id]
         self.save_role_panels()
+
+        # Take down the displayed panel too, it has nothing left to show
+        guild = self.bot.get_guild(guild_id)
+        if guild:
+            message = await self.fetch_panel_message(guild, panel_id)
+            if message:
+                try:
+                    await message.delete()
+                except discord.HTTPException:
+                    pass
+        self.clear_panel_location(guild_id, panel_id)
         return True
 
-    async def add_role_to_panel(self, guild_id: int, panel_id: str, role_id: int, label: str, emoji: str) -> bool:
+    async def add_role_to_panel(self, guild_id: int, panel_id: str, role_id: int, label: str, emoji: str, duration: int = None) -> bool:
         """Add a role to a specific panel"""
         guild_key = str(guild_id)
         
@@ -613,12 +1080,15 @@ class RoleSystem(commands.Cog):
                 return False
         
         # Add new role
-        self.role_panels[guild_key][panel_id]['roles'].append({
+        role_entry = {
             'role_id': role_id,
             'label': label,
             'emoji': emoji,
             'added_at': datetime.now().isoformat()
-        })
+        }
+        if duration:
+            role_entry['duration'] = duration
+        self.role_panels[guild_key][panel_id]['roles'].append(role_entry)
         
         self.save_role_panels()
         return True
@@ -681,7 +1151,7 @@ class RoleSystem(commands.Cog):
             embed = discord.Embed(
                 title=f"🎭 {panel_name}",
                 description="Click the buttons below to get or remove roles:\n\n" + 
-                           "\n".join([f"• {role['emoji']} **{role['label']}**" for role in roles]),
+                           "\n".join([f"• {role['emoji']} **{role['label']}**{self.format_panel_duration(role)}" for role in roles]),
                 color=COLORS['primary']
             )
             embed.set_footer(text="Click a button to toggle the role")
@@ -689,35 +1159,21 @@ class RoleSystem(commands.Cog):
         view = RolePanelView(self, panel_id)
         message = await channel.send(embed=embed, view=view)
         
-        # Store the message ID
-        if guild_key not in self.panel_messages:
-            self.panel_messages[guild_key] = {}
-        self.panel_messages[guild_key][panel_id] = message.id
-        
+        # Store where the panel lives so restarts can find it directly
+        self.set_panel_location(guild_id, panel_id, channel.id, message.id)
+
         return message
 
     async def refresh_role_panel(self, guild_id: int, panel_id: str):
         """Refresh a specific role panel with updated buttons"""
         guild_key = str(guild_id)
-        
-        if guild_key not in self.panel_messages or panel_id not in self.panel_messages[guild_key]:
-            return
-        
-        message_id = self.panel_messages[guild_key][panel_id]
         guild = self.bot.get_guild(guild_id)
-        
+
         if not guild:
             return
-        
-        # Find the message in any channel
-        message = None
-        for channel in guild.text_channels:
-            try:
-                message = await channel.fetch_message(message_id)
-                break
-            except:
-                continue
-        
+
+        message = await self.fetch_panel_message(guild, panel_id)
+
         if message:
             # Update the embed and view
             panel = self.role_panels.get(guild_key, {}).get(panel_id, {})
@@ -735,7 +1191,7 @@ class RoleSystem(commands.Cog):
                 embed = discord.Embed(
                     title=f"🎭 {panel_name}",
                     description="Click the buttons below to get or remove roles:\n\n" + 
-                               "\n".join([f"• {role['emoji']} **{role['label']}**" for role in roles]),
+                               "\n".join([f"• {role['emoji']} **{role['label']}**{self.format_panel_duration(role)}" for role in roles]),
                     color=COLORS['primary']
                 )
                 embed.set_footer(text="Click a button to toggle the role")
@@ -784,22 +1240,12 @@ class RoleSystem(commands.Cog):
             await ctx.send(f"❌ Panel '{panel_id}' doesn't exist! Create it first with `!createrolepanel {panel_id}`", delete_after=15)
             return
         
-        # Check if panel is already displayed in this channel
-        if guild_key in self.panel_messages and panel_id in self.panel_messages[guild_key]:
+        # Check if panel is already displayed somewhere
+        if self.get_panel_location(ctx.guild.id, panel_id):
             try:
-                old_message_id = self.panel_messages[guild_key][panel_id]
-                old_channel = None
-                
-                # Find the old message
-                for ch in ctx.guild.text_channels:
-                    try:
-                        old_message = await ch.fetch_message(old_message_id)
-                        if old_message:
-                            old_channel = ch
-                            break
-                    except:
-                        continue
-                
+                old_message = await self.fetch_panel_message(ctx.guild, panel_id)
+                old_channel = old_message.channel if old_message else None
+
                 if old_channel and old_channel.id != channel.id:
                     # Ask if user wants to move the panel
                     embed = discord.Embed(
@@ -848,20 +1294,15 @@ class RoleSystem(commands.Cog):
             return
         
         # Remove old panel message
-        if guild_key in self.panel_messages and panel_id in self.panel_messages[guild_key]:
-            old_message_id = self.panel_messages[guild_key][panel_id]
-            
-            # Try to delete the old message
-            for ch in ctx.guild.text_channels:
-                try:
-                    old_message = await ch.fetch_message(old_message_id)
-                    if old_message:
-                        await old_message.delete()
-                        break
-                except:
-                    continue
-        
-        # Create panel in new channel
+        old_message = await self.fetch_panel_message(ctx.guild, panel_id)
+        if old_message:
+            try:
+                await old_message.delete()
+            except discord.HTTPException:
+                pass
+        self.clear_panel_location(ctx.guild.id, panel_id)
+
+        # Create panel in new channel (this re-indexes the panel)
         message = await self.create_role_panel(ctx.guild.id, new_channel.id, panel_id)
         
         if message:
@@ -878,29 +1319,27 @@ class RoleSystem(commands.Cog):
     @commands.has_permissions(administrator=True)
     async def remove_panel_display_command(self, ctx, panel_id: str):
         """Remove a role panel display (but keep the panel data)"""
-        guild_key = str(ctx.guild.id)
-        if guild_key not in self.panel_messages or panel_id not in self.panel_messages[guild_key]:
+        if not self.get_panel_location(ctx.guild.id, panel_id):
             await ctx.send(f"❌ Panel '{panel_id}' is not currently displayed anywhere!", delete_after=15)
             return
-        
-        message_id = self.panel_messages[guild_key][panel_id]
+
+        message = await self.fetch_panel_message(ctx.guild, panel_id)
         message_deleted = False
-        
-        # Try to delete the message
-        for channel in ctx.guild.text_channels:
+
+        if message:
             try:
-                message = await channel.fetch_message(message_id)
-                if message:
-                    await message.delete()
-                    message_deleted = True
-                    break
-            except:
-                continue
-        
+                await message.delete()
+                message_deleted = True
+            except discord.HTTPException:
+                pass
+        elif not self.get_panel_location(ctx.guild.id, panel_id):
+            # The message was already gone and the stale entry has been dropped
+            message_deleted = True
+
         if message_deleted:
-            # Remove from panel_messages
-            del self.panel_messages[guild_key][panel_id]
-            
+            # Remove from the panel index
+            self.clear_panel_location(ctx.guild.id, panel_id)
+
             embed = discord.Embed(
                 title="✅ Panel Display Removed!",
                 description=f"Role panel '{panel_id}' is no longer displayed, but the panel data is preserved.",
@@ -921,8 +1360,7 @@ class RoleSystem(commands.Cog):
         """List all role panels and where they're displayed"""
         guild_key = str(ctx.guild.id)
         panels = self.role_panels.get(guild_key, {})
-        panel_messages = self.panel_messages.get(guild_key, {})
-        
+
         if not panels:
             embed = discord.Embed(
                 title="📋 Role Panels",
@@ -941,20 +1379,10 @@ class RoleSystem(commands.Cog):
                 panel_name = panel_data.get('name', panel_id.title())
                 
                 # Check if panel is displayed
-                if panel_id in panel_messages:
-                    message_id = panel_messages[panel_id]
-                    channel_info = "Unknown channel"
-                    
-                    # Find which channel it's in
-                    for channel in ctx.guild.text_channels:
-                        try:
-                            message = await channel.fetch_message(message_id)
-                            if message:
-                                channel_info = channel.mention
-                                break
-                        except:
-                            continue
-                    
+                location = self.get_panel_location(ctx.guild.id, panel_id)
+                if location:
+                    channel = ctx.guild.get_channel(location['channel_id'])
+                    channel_info = channel.mention if channel else "Unknown channel"
                     status = f"✅ Displayed in {channel_info}"
                 else:
                     status = "❌ Not displayed"
@@ -976,6 +1404,108 @@ class RoleSystem(commands.Cog):
         embed.set_footer(text="Use !displaypanel <id> [channel] to show panels")
         await ctx.send(embed=embed, delete_after=60)
 
+    @commands.command(name='repairpanels')
+    @commands.has_permissions(administrator=True)
+    async def repair_panels_command(self, ctx):
+        """Rebuild the panel index by scanning channels (slow, use only if panels went missing)"""
+        guild_key = str(ctx.guild.id)
+        panels = self.role_panels.get(guild_key, {})
+
+        if not isinstance(panels, dict) or not panels:
+            await ctx.send("❌ No role panels exist in this server!", delete_after=15)
+            return
+
+        status_message = await ctx.send("🔧 Scanning channels for role panels, this may take a while...")
+
+        repaired = []
+        missing = []
+
+        for panel_id, panel_data in panels.items():
+            if not isinstance(panel_data, dict):
+                continue
+
+            # Fast path - the index is still correct
+            if await self.fetch_panel_message(ctx.guild, panel_id):
+                continue
+
+            panel_name = panel_data.get('name', panel_id.title())
+            found = await self.scan_for_panel_message(ctx.guild, panel_id, panel_name)
+
+            if found:
+                self.set_panel_location(ctx.guild.id, panel_id, found.channel.id, found.id)
+                await found.edit(view=RolePanelView(self, panel_id))
+                repaired.append(f"• `{panel_id}` → {found.channel.mention}")
+            else:
+                missing.append(f"• `{panel_id}`")
+
+        embed = discord.Embed(
+            title="🔧 Panel Repair Complete",
+            color=COLORS['success'] if not missing else COLORS['warning']
+        )
+        embed.add_field(
+            name="✅ Re-indexed",
+            value="\n".join(repaired) if repaired else "Nothing needed repairing",
+            inline=False
+        )
+        if missing:
+            embed.add_field(
+                name="❌ Not Found",
+                value="\n".join(missing) + "\n\nUse `!displaypanel <id> [channel]` to post these again",
+                inline=False
+            )
+
+        await status_message.edit(content=None, embed=embed, delete_after=60)
+
+    @commands.command(name='rolequeuestats')
+    @commands.has_permissions(administrator=True)
+    async def role_queue_stats_command(self, ctx):
+        """Show how well role panel clicks are being batched"""
+        metrics = self.get_role_queue_metrics()
+
+        embed = discord.Embed(
+            title="📊 Role Queue Stats",
+            color=COLORS['info']
+        )
+        embed.add_field(name="⏳ Queue Depth", value=f"{metrics['queue_depth']} change(s) for {metrics['members_waiting']} member(s)", inline=False)
+        embed.add_field(name="🖱️ Clicks", value=str(metrics['clicks']), inline=True)
+        embed.add_field(name="📨 Role Updates", value=str(metrics['edits']), inline=True)
+        embed.add_field(name="❌ Failed", value=str(metrics['failed']), inline=True)
+        embed.add_field(name="🔀 Coalescing Ratio", value=f"{metrics['coalescing_ratio']:.2f} clicks per update", inline=False)
+        embed.set_footer(text=f"Clicks are batched for {ROLE_QUEUE_DEBOUNCE}s per member")
+
+        await ctx.send(embed=embed, delete_after=60)
+
+    async def scan_for_panel_message(self, guild, panel_id, panel_name, history_limit=100):
+        """Look through every readable text channel for a panel message.
+
+        Only used by !repairpanels - normal lookups go through the index.
+        """
+        panel_prefix = f"role_{panel_id}_"
+        panel_title = f"🎭 {panel_name}"
+
+        for channel in guild.text_channels:
+            permissions = channel.permissions_for(guild.me)
+            if not permissions.read_message_history:
+                continue
+
+            try:
+                async for message in channel.history(limit=history_limit):
+                    if message.author.id != self.bot.user.id or not message.embeds:
+                        continue
+                    if message.embeds[0].title != panel_title:
+                        continue
+                    custom_ids = [
+                        getattr(child, 'custom_id', None) or ''
+                        for row in message.components
+                        for child in getattr(row, 'children', [])
+                    ]
+                    if not custom_ids or any(cid.startswith(panel_prefix) for cid in custom_ids):
+                        return message
+            except discord.HTTPException:
+                continue
+
+        return None
+
     @commands.command(name='adminrolepanel')
     @commands.has_permissions(administrator=True)
     async def admin_role_panel_command(self, ctx):
@@ -1051,7 +1581,14 @@ class RoleSystem(commands.Cog):
                         panel_name = panel_data.get('name', panel_id.title())
                         
                         if roles and isinstance(roles, list):
-                            role_list = "\n".join([f"• {role.get('emoji', '')} {role.get('label', 'Unknown')}" for role in roles if isinstance(role, dict)])
+                            lines = []
+                            for role in roles:
+                                if not isinstance(role, dict):
+                                    continue
+                                guild_role = interaction.guild.get_role(role.get('role_id'))
+                                member_count = self.get_role_member_count(guild_role) if guild_role else 0
+                                lines.append(f"• {role.get('emoji', '')} {role.get('label', 'Unknown')} ({member_count} members)")
+                            role_list = "\n".join(lines)
                             embed.add_field(
                                 name=f"📋 {panel_name}",
                                 value=f"ID: `{panel_id}`\nRoles ({len(roles)}):\n{role_list}",
@@ -1076,9 +1613,341 @@ class RoleSystem(commands.Cog):
             embed.set_footer(text="Auto-deletes in 45s")
             await interaction.response.send_message(embed=embed, ephemeral=True, delete_after=45)
 
+    def load_role_jobs(self):
+        """Load bulk role jobs from JSON file"""
+        if not os.path.exists('data'):
+            os.makedirs('data')
+
+        if os.path.exists(self.role_jobs_file):
+            try:
+                with open(self.role_jobs_file, 'r') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError):
+                return {}
+        return {}
+
+    def save_role_jobs(self):
+        """Save bulk role jobs (and their checkpoints) to JSON file"""
+        with open(self.role_jobs_file, 'w') as f:
+            json.dump(self.role_jobs, f, indent=2)
+
+    def parse_job_criterion(self, guild, criterion: str):
+        """Turn '<type> <value>' into a stored criterion dict, or None if it's invalid"""
+        kind, _, value = criterion.strip().partition(' ')
+        kind = kind.lower()
+        value = value.strip()
+
+        if kind == 'everyone':
+            return {'type': 'everyone', 'label': 'everyone'}
+
+        if kind == 'hasrole' and value:
+            role_id = int(value.strip('<@&>')) if value.strip('<@&>').isdigit() else None
+            role = guild.get_role(role_id) if role_id else discord.utils.get(guild.roles, name=value)
+            if role:
+                return {'type': 'has_role', 'role_id': role.id, 'label': f"has {role.name}"}
+
+        if kind == 'game' and value:
+            group_finder = self.bot.get_cog('GroupFinder')
+            games = group_finder.game_roles.get(str(guild.id), {}).get('games', {}) if group_finder else {}
+            value_lower = value.lower()
+            for stored_name, game_data in games.items():
+                if value_lower in stored_name or stored_name in value_lower:
+                    return {'type': 'has_role', 'role_id': game_data['role_id'], 'label': f"plays {game_data['name']}"}
+
+        if kind == 'joinedafter' and value:
+            try:
+                joined_after = datetime.strptime(value, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+            except ValueError:
+                return None
+            return {'type': 'joined_after', 'date': joined_after.isoformat(), 'label': f"joined after {value}"}
+
+        return None
+
+    def member_matches(self, member, criterion):
+        """Check a member against a job criterion"""
+        if criterion['type'] == 'everyone':
+            return True
+        if criterion['type'] == 'has_role':
+            return member.get_role(criterion['role_id']) is not None
+        if criterion['type'] == 'joined_after':
+            return member.joined_at is not None and member.joined_at > datetime.fromisoformat(criterion['date'])
+        return False
+
+    def build_job_embed(self, job):
+        """Progress embed for a bulk role job"""
+        colors = {'running': COLORS['info'], 'done': COLORS['success'], 'cancelled': COLORS['warning'], 'failed': COLORS['error']}
+        embed = discord.Embed(
+            title=f"⚙️ Bulk Role Job #{job['id']}",
+            description=f"**{job['action'].title()}** <@&{job['role_id']}> for members who {job['criterion']['label']}",
+            color=colors.get(job['status'], COLORS['info'])
+        )
+        embed.add_field(name="📋 Status", value=job['status'].title(), inline=True)
+        embed.add_field(name="👥 Scanned", value=str(job['scanned']), inline=True)
+        embed.add_field(name="✅ Changed", value=str(job['changed']), inline=True)
+        embed.add_field(name="❌ Failed", value=str(job['failed']), inline=True)
+        if job['status'] == 'running':
+            embed.add_field(name="⚡ Concurrency", value=str(job.get('concurrency', 1)), inline=True)
+        embed.set_footer(text=f"Started by {job['started_by_name']} • Resumes automatically after restarts")
+        return embed
+
+    async def update_job_message(self, job, force=False):
+        """Edit the live progress message, at most every few seconds unless forced"""
+        now = time.monotonic()
+        if not force and now - self.job_message_edits.get(job['id'], 0) < 3:
+            return
+        self.job_message_edits[job['id']] = now
+
+        channel = self.bot.get_channel(job['channel_id'])
+        if not channel or not job.get('message_id'):
+            return
+        try:
+            await channel.get_partial_message(job['message_id']).edit(embed=self.build_job_embed(job))
+        except discord.HTTPException:
+            pass
+
+    async def apply_job_change(self, member, role, action):
+        """Grant or revoke a role for one member. Returns (ok, rate_limited)"""
+        try:
+            if action == 'grant':
+                await member.add_roles(role, reason="Bulk role job")
+            else:
+                await member.remove_roles(role, reason="Bulk role job")
+            return True, False
+        except discord.HTTPException as e:
+            return False, e.status == 429
+
+    async def process_job_chunk(self, job, guild, role, members, limiter):
+        """Apply a chunk of members under the adaptive concurrency limit"""
+        targets = []
+        for member in members:
+            if not self.member_matches(member, job['criterion']):
+                continue
+            has_role = member.get_role(role.id) is not None
+            if (job['action'] == 'grant') != has_role:
+                targets.append(member)
+
+        while targets:
+            size = await limiter.next_wave_size()
+            wave, targets = targets[:size], targets[size:]
+
+            started = time.monotonic()
+            results = await asyncio.gather(*(self.apply_job_change(m, role, job['action']) for m in wave))
+            limiter.record_wave(time.monotonic() - started, any(limited for _, limited in results))
+
+            job['changed'] += sum(1 for ok, _ in results if ok)
+            job['failed'] += sum(1 for ok, _ in results if not ok)
+            job['concurrency'] = limiter.limit
+            await self.update_job_message(job)
+
+    async def run_role_job(self, job_id, chunk_size=100):
+        """Stream the guild's members in ID order and apply the job, checkpointing after each chunk"""
+        job = self.role_jobs[job_id]
+        try:
+            guild = self.bot.get_guild(job['guild_id'])
+            role = guild.get_role(job['role_id']) if guild else None
+            if not role:
+                raise ValueError("guild or role no longer exists")
+
+            limiter = BulkRoleLimiter(self.bot, guild.id)
+            after = discord.Object(id=job['after']) if job['after'] else None
+            chunk = []
+
+            async for member in guild.fetch_members(limit=None, after=after):
+                chunk.append(member)
+                if len(chunk) < chunk_size:
+                    continue
+                await self.process_job_chunk(job, guild, role, chunk, limiter)
+                job['scanned'] += len(chunk)
+                job['after'] = chunk[-1].id
+                chunk = []
+                self.save_role_jobs()
+
+            if chunk:
+                await self.process_job_chunk(job, guild, role, chunk, limiter)
+                job['scanned'] += len(chunk)
+                job['after'] = chunk[-1].id
+
+            job['status'] = 'done'
+        except asyncio.CancelledError:
+            # Shutdown also cancels us - only !canceljob ends the job for good
+            if job.get('cancel_requested'):
+                job['status'] = 'cancelled'
+            else:
+                self.running_jobs.pop(job_id, None)
+                self.save_role_jobs()
+                raise
+        except Exception as e:
+            print(f"Error running bulk role job {job_id}: {e}")
+            job['status'] = 'failed'
+
+        job['finished_at'] = datetime.now().isoformat()
+        self.job_message_edits.pop(job_id, None)
+        self.running_jobs.pop(job_id, None)
+        self.save_role_jobs()
+        await self.update_job_message(job, force=True)
+
+    def start_role_job(self, job_id):
+        self.running_jobs[job_id] = asyncio.create_task(self.run_role_job(job_id))
+
+    async def resume_role_jobs(self):
+        """Pick unfinished bulk role jobs back up from their last checkpoint"""
+        await self.bot.wait_until_ready()
+
+        try:
+            for job_id, job in self.role_jobs.items():
+                if job['status'] == 'running' and job_id not in self.running_jobs:
+                    print(f"🔄 Resuming bulk role job #{job_id} after member {job['after']}")
+                    self.start_role_job(job_id)
+        except Exception as e:
+            print(f"Error resuming bulk role jobs: {e}")
+
+    @commands.command(name='temprole')
+    @commands.has_permissions(manage_roles=True)
+    async def temp_role_command(self, ctx, member: discord.Member, role: discord.Role, duration: str):
+        """Give a member a role for a limited time (Manage Roles permission required)
+        Usage: !temprole @user @role 12h"""
+        seconds = self.parse_duration(duration)
+        if not seconds:
+            await ctx.send("❌ Invalid duration! Use something like 30m, 12h, 7d or 1d12h (max 1 year).", delete_after=15)
+            return
+
+        if role >= ctx.guild.me.top_role or role.managed:
+            await ctx.send(f"❌ I can't manage **{role.name}** - it's above my highest role or managed by an integration.", delete_after=15)
+            return
+
+        if role not in member.roles:
+            try:
+                await member.add_roles(role, reason=f"Temporary role from {ctx.author}")
+            except discord.Forbidden:
+                await ctx.send("❌ I don't have permission to assign roles!", delete_after=15)
+                return
+
+        expires_at = self.schedule_temp_role(ctx.guild.id, member.id, role.id, seconds)
+
+        embed = discord.Embed(
+            title="⏳ Temporary Role Granted",
+            description=f"{member.mention} has **{role.name}** for {self.format_duration(seconds)}",
+            color=COLORS['success']
+        )
+        embed.add_field(name="Expires", value=f"<t:{int(expires_at)}:R>", inline=True)
+        await ctx.send(embed=embed, delete_after=30)
+
+    @commands.command(name='temproles')
+    @commands.has_permissions(manage_roles=True)
+    async def temp_roles_command(self, ctx):
+        """Show pending temporary roles in this server (Manage Roles permission required)"""
+        prefix = f"{ctx.guild.id}:"
+        pending = [(expires_at, key) for key, expires_at in self.temp_role_expiries.items() if key.startswith(prefix)]
+
+        embed = discord.Embed(
+            title="⏳ Temporary Roles",
+            color=COLORS['info']
+        )
+
+        if not pending:
+            embed.description = "No temporary roles are pending."
+        else:
+            lines = []
+            for expires_at, key in heapq.nsmallest(15, pending):
+                _, member_id, role_id = key.split(':')
+                lines.append(f"<@{member_id}> • <@&{role_id}> • <t:{int(expires_at)}:R>")
+            embed.description = f"{len(pending)} pending, soonest first:\n\n" + "\n".join(lines)
+
+        await ctx.send(embed=embed, delete_after=60)
+
+    @commands.command(name='bulkrole')
+    @commands.has_permissions(administrator=True)
+    async def bulk_role_command(self, ctx, action: str, role: discord.Role, *, criterion: str):
+        """Grant or revoke a role for everyone matching a criterion (Admin only)
+        Usage: !bulkrole <grant|revoke> @role <everyone | hasrole @role | game <name> | joinedafter YYYY-MM-DD>"""
+        action = action.lower()
+        if action not in ['grant', 'revoke']:
+            await ctx.send("❌ Invalid action! Use: grant or revoke", delete_after=15)
+            return
+
+        parsed = self.parse_job_criterion(ctx.guild, criterion)
+        if not parsed:
+            await ctx.send("❌ Invalid criterion! Use: `everyone`, `hasrole @role`, `game <name>` or `joinedafter YYYY-MM-DD`", delete_after=20)
+            return
+
+        if role >= ctx.guild.me.top_role or role.managed:
+            await ctx.send(f"❌ I can't manage **{role.name}** - it's above my highest role or managed by an integration.", delete_after=15)
+            return
+
+        job_id = str(max((int(existing) for existing in self.role_jobs), default=0) + 1)
+        job = {
+            'id': job_id,
+            'guild_id': ctx.guild.id,
+            'role_id': role.id,
+            'action': action,
+            'criterion': parsed,
+            'status': 'running',
+            'after': None,  # Checkpoint: last member ID fully processed
+            'scanned': 0,
+            'changed': 0,
+            'failed': 0,
+            'channel_id': ctx.channel.id,
+            'message_id': None,
+            'started_by': ctx.author.id,
+            'started_by_name': ctx.author.display_name,
+            'created_at': datetime.now().isoformat()
+        }
+        self.role_jobs[job_id] = job
+
+        message = await ctx.send(embed=self.build_job_embed(job))
+        job['message_id'] = message.id
+        self.save_role_jobs()
+
+        self.start_role_job(job_id)
+
+    @commands.command(name='bulkjobs')
+    @commands.has_permissions(administrator=True)
+    async def bulk_jobs_command(self, ctx):
+        """List recent bulk role jobs for this server (Admin only)"""
+        jobs = [job for job in self.role_jobs.values() if job['guild_id'] == ctx.guild.id]
+
+        embed = discord.Embed(
+            title="⚙️ Bulk Role Jobs",
+            color=COLORS['info']
+        )
+
+        if not jobs:
+            embed.description = "No bulk role jobs have been run yet."
+        else:
+            for job in jobs[-10:]:
+                embed.add_field(
+                    name=f"#{job['id']} • {job['status'].title()}",
+                    value=f"{job['action'].title()} <@&{job['role_id']}> ({job['criterion']['label']})\nScanned {job['scanned']} • Changed {job['changed']} • Failed {job['failed']}",
+                    inline=False
+                )
+
+        embed.set_footer(text="Use !canceljob <id> to stop a running job")
+        await ctx.send(embed=embed, delete_after=60)
+
+    @commands.command(name='canceljob')
+    @commands.has_permissions(administrator=True)
+    async def cancel_job_command(self, ctx, job_id: str):
+        """Cancel a running bulk role job (Admin only)"""
+        job = self.role_jobs.get(job_id)
+        if not job or job['guild_id'] != ctx.guild.id:
+            await ctx.send(f"❌ No job #{job_id} found!", delete_after=15)
+            return
+
+        task = self.running_jobs.get(job_id)
+        if not task:
+            await ctx.send(f"❌ Job #{job_id} is not running (status: {job['status']})", delete_after=15)
+            return
+
+        job['cancel_requested'] = True
+        task.cancel()
+        await ctx.send(f"🛑 Job #{job_id} cancelled after {job['scanned']} members.", delete_after=15)
+
     @commands.Cog.listener()
     async def on_ready(self):
-        """Recreate role panels when bot restarts"""
+        """Reattach views to displayed role panels when bot restarts"""
+        for guild in self.bot.guilds:
+            self.build_role_member_counts(guild)
+
         for guild in self.bot.guilds:
             try:
                 guild_key = str(guild.id)
@@ -1097,32 +1966,18 @@ class RoleSystem(commands.Cog):
                                 print(f"Warning: Invalid panel data for {panel_id} in guild {guild.name}, skipping...")
                                 continue
                             
-                            # Try to find existing panel message
-                            panel_found = False
-                            
-                            # Check if we have a stored message ID
-                            if guild_key in self.panel_messages and panel_id in self.panel_messages[guild_key]:
-                                message_id = self.panel_messages[guild_key][panel_id]
-                                
-                                # Try to find the message
-                                for channel in guild.text_channels:
-                                    try:
-                                        message = await channel.fetch_message(message_id)
-                                        if message:
-                                            # Update the view to make it functional again
-                                            view = RolePanelView(self, panel_id)
-                                            await message.edit(view=view)
-                                            panel_found = True
-                                            break
-                                    except:
-                                        continue
-                            
-                            # If no panel found, create a new one in the first available channel
-                            if not panel_found:
-                                for channel in guild.text_channels:
-                                    if channel.permissions_for(guild.me).send_messages:
-                                        await self.create_role_panel(guild.id, channel.id, panel_id)
-                                        break
+                            # Panels that were never displayed (or were removed) stay hidden
+                            if not self.get_panel_location(guild.id, panel_id):
+                                continue
+
+                            # One fetch per panel using the persisted index
+                            message = await self.fetch_panel_message(guild, panel_id)
+                            if message:
+                                # Update the view to make it functional again
+                                view = RolePanelView(self, panel_id)
+                                await message.edit(view=view)
+                            elif not self.get_panel_location(guild.id, panel_id):
+                                print(f"Panel {panel_id} in guild {guild.name} is gone - use !repairpanels or !displaypanel to restore it")
                         except Exception as e:
                             print(f"Error processing panel {panel_id} in guild {guild.name}: {e}")
                             continue
@@ -7,6 +7,7 @@ load_dotenv()
 BOT_TOKEN = os.getenv('DISCORD_BOT_TOKEN')
 COMMAND_PREFIX = '!'
 BOT_DESCRIPTION = 'A fun Discord bot with games and group finder!'
+SYNC_COMMANDS = os.getenv('SYNC_COMMANDS', '').lower() in ('1', 'true', 'yes')  # Push slash commands to Discord on startup
 
 # Colors for embeds
 COLORS = {
@@ -20,11 +21,60 @@ COLORS = {
 # Game settings
 GAME_TIMEOUT = 60  # seconds
 MAX_GROUP_SIZE = 10
+LFG_DEFAULT_GROUP_SIZE = 4  # players per group when !lfg doesn't give a size
+LFG_QUEUE_TIMEOUT = 30 * 60  # seconds a player stays queued
+LFG_VOICE_GRACE = 5 * 60  # seconds a new group voice channel may stay empty
+
+# Game search settings
+GAME_SEARCH_CACHE_TTL = 6 * 60 * 60  # seconds a RAWG search result stays fresh
+GAME_SEARCH_NEGATIVE_TTL = 5 * 60  # seconds empty or failed lookups are cached
+GAME_SEARCH_CACHE_SIZE = 256  # searches kept in memory
+GAME_SEARCH_DISK_CACHE_SIZE = 2000  # searches kept in data/game_search_cache.json
+
+# Role system settings
+ROLE_QUEUE_DEBOUNCE = 1.5  # seconds to batch role panel clicks per member
+
+# Meme settings
+MEME_BUFFER_SIZE = 10  # memes kept prefetched
+MEME_BUFFER_LOW_WATER = 3  # refill in the background below this many
+
+# Poll settings
+POLL_DEFAULT_DURATION = 24 * 60 * 60  # seconds a poll stays open unless given a duration
+POLL_EDIT_INTERVAL = 3  # seconds between live result edits on a poll message
+
+# Hit counter settings
+HIT_FLUSH_INTERVAL = 60  # seconds between writes of buffered trigger/phrase hit counts
+
+# Phrase backfill settings
+BACKFILL_DEFAULT_DAYS = 30  # history scanned by !trackphrase --backfill without a day count
+BACKFILL_MAX_DAYS = 365
+BACKFILL_CONCURRENCY = 3  # channels read at once
+BACKFILL_BATCH_SIZE = 500  # messages scanned between count updates and checkpoints
+BACKFILL_RETRIES = 3  # attempts per channel after a Discord error, with doubling delays
+
+# Automatic response throttling (insult triggers, phrase detections)
+AUTO_RESPONSE_CHANNEL_RATE = 6  # responses per minute per channel, unless set with !autolimit
+AUTO_RESPONSE_USER_RATE = 3  # responses per minute per user
+AUTO_RESPONSE_SUMMARY_INTERVAL = 30  # seconds between "+N more" summaries
+
+# Insult settings
+INSULT_API_BUFFER = 5  # API insults kept ready per tier that has no local insults
+
+# Audit log delivery
+AUDIT_FLUSH_INTERVAL = 2  # seconds an audit channel's queue gathers events before sending
+AUDIT_QUEUE_LIMIT = 250  # queued events per audit channel before new ones are dropped
 
 # Economy settings
 CURRENCY_NAME = "coins"
 STARTING_BALANCE = 1000
 DAILY_REWARD = 500
 
+# Shared HTTP client settings
+HTTP_TIMEOUT = 10  # default seconds per external API request
+HTTP_LIMIT = 50  # open connections across all hosts
+HTTP_LIMIT_PER_HOST = 4  # open connections to any one API host
+
 # API Keys
-RAWG_API_KEY = os.getenv('RAWG_API_KEY')
\ No newline at end of file
+RAWG_API_KEY = os.getenv('RAWG_API_KEY')
+RAWG_API_URL = os.getenv('RAWG_API_URL', 'https://api.rawg.io/api')  # Override to point at a local stub
+MEME_API_URL = os.getenv('MEME_API_URL', 'https://meme-api.com')  # Override to point at a local fixture server
\ No newline at end of file
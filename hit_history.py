@@ -0,0 +1,146 @@
+import io
+import json
+import os
+import time
+from array import array
+from PIL import Image, ImageDraw
+
+# Resolution -> number of buckets kept. Every hit goes into all four rings,
+# so coarse history outlives the fine-grained buckets it was rolled up from.
+RESOLUTIONS = {
+    'hour': 48,
+    'day': 60,
+    'week': 52,
+    'month': 24
+}
+
+SPARK_BLOCKS = '▁▂▃▄▅▆▇█'
+
+
+def bucket_of(resolution, timestamp):
+    """Absolute bucket number of a UTC timestamp at a resolution"""
+    if resolution == 'hour':
+        return int(timestamp // 3600)
+    if resolution == 'day':
+        return int(timestamp // 86400)
+    if resolution == 'week':
+        return (int(timestamp // 86400) + 3) // 7  # Weeks start on Monday; the epoch was a Thursday
+    moment = time.gmtime(timestamp)
+    return moment.tm_year * 12 + moment.tm_mon - 1
+
+
+class HitSeries:
+    """Hit counts for one phrase or trigger, as fixed-size ring buffers per resolution"""
+
+    __slots__ = ('newest', 'rings')
+
+    def __init__(self):
+        self.newest = {resolution: 0 for resolution in RESOLUTIONS}  # bucket number of the newest slot
+        self.rings = {resolution: array('L', bytes(array('L').itemsize * size)) for resolution, size in RESOLUTIONS.items()}
+
+    def add(self, count=1, timestamp=None):
+        """Add hits at a time (default now); O(1) per resolution"""
+        timestamp = time.time() if timestamp is None else timestamp
+        for resolution, size in RESOLUTIONS.items():
+            bucket = bucket_of(resolution, timestamp)
+            ring = self.rings[resolution]
+            newest = self.newest[resolution]
+            if bucket > newest:
+                # Buckets the ring rolls past are reused, which is what drops old fine-grained history
+                for stale in range(newest + 1, newest + 1 + min(bucket - newest, size)):
+                    ring[stale % size] = 0
+                self.newest[resolution] = bucket
+            elif bucket <= newest - size:
+                continue  # Older than this ring reaches back
+            ring[bucket % size] += count
+
+    def recent(self, resolution, timestamp=None):
+        """Counts for every bucket this ring keeps, oldest first, ending at the bucket holding timestamp"""
+        timestamp = time.time() if timestamp is None else timestamp
+        size = RESOLUTIONS[resolution]
+        ring = self.rings[resolution]
+        newest = self.newest[resolution]
+        current = bucket_of(resolution, timestamp)
+        return [
+            ring[bucket % size] if newest - size < bucket <= newest else 0
+            for bucket in range(current - size + 1, current + 1)
+        ]
+
+    def to_json(self):
+        return {'newest': self.newest, 'rings': {resolution: ring.tolist() for resolution, ring in self.rings.items()}}
+
+    @classmethod
+    def from_json(cls, data):
+        series = cls()
+        for resolution, size in RESOLUTIONS.items():
+            counts = data['rings'].get(resolution, [])
+            if len(counts) == size:
+                series.newest[resolution] = data['newest'][resolution]
+                series.rings[resolution] = array('L', counts)
+        return series
+
+
+class HitHistory:
+    """Time-bucketed hit counts keyed by tuples, persisted to one JSON file"""
+
+    def __init__(self, data_file):
+        self.data_file = data_file
+        self.series = self.load()
+
+    def load(self):
+        if not os.path.exists('data'):
+            os.makedirs('data')
+
+        if os.path.exists(self.data_file):
+            try:
+                with open(self.data_file, 'r') as f:
+                    return {tuple(key): HitSeries.from_json(data) for key, data in json.load(f)}
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                pass
+        return {}
+
+    def save(self):
+        with open(self.data_file, 'w') as f:
+            json.dump([[list(key), series.to_json()] for key, series in self.series.items()], f)
+
+    def record(self, key, count=1, timestamp=None):
+        series = self.series.get(key)
+        if series is None:
+            series = self.series[key] = HitSeries()
+        series.add(count, timestamp)
+
+    def get(self, key):
+        return self.series.get(key)
+
+    def drop(self, key):
+        self.series.pop(key, None)
+
+
+def text_sparkline(counts):
+    """Render counts as a row of block characters"""
+    peak = max(counts)
+    if not peak:
+        return SPARK_BLOCKS[0] * len(counts)
+    top = len(SPARK_BLOCKS) - 1
+    # Any activity shows above the baseline, and the peak always reaches the top block
+    return ''.join(SPARK_BLOCKS[max(1, round(count / peak * top)) if count else 0] for count in counts)
+
+
+def render_sparkline(counts, width=480, height=120):
+    """Draw counts as a PNG line chart. CPU-bound: call it through asyncio.to_thread"""
+    image = Image.new('RGB', (width, height), (47, 49, 54))
+    draw = ImageDraw.Draw(image)
+    peak = max(counts) or 1
+    margin = 8
+    step = (width - 2 * margin) / max(1, len(counts) - 1)
+    points = [
+        (margin + i * step, height - margin - count / peak * (height - 2 * margin))
+        for i, count in enumerate(counts)
+    ]
+    draw.polygon(points + [(points[-1][0], height - margin), (margin, height - margin)], fill=(64, 78, 140))
+    draw.line(points, fill=(114, 137, 218), width=3)
+
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    buffer.seek(0)
+    return buffer
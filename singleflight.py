@@ -0,0 +1,23 @@
+import asyncio
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one in-flight call"""
+
+    def __init__(self):
+        self.inflight = {}
+        self.stats = {'calls': 0, 'deduplicated': 0}
+
+    async def do(self, key, func, *args):
+        """Run func(*args) once per key; callers that arrive meanwhile share its result"""
+        self.stats['calls'] += 1
+        future = self.inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func(*args))
+            self.inflight[key] = future
+            future.add_done_callback(lambda _: self.inflight.pop(key, None))
+        else:
+            self.stats['deduplicated'] += 1
+
+        # Shield so one caller giving up doesn't cancel the lookup for the others
+        return await asyncio.shield(future)
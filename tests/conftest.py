@@ -0,0 +1,13 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Run a test from an empty directory so cogs create their data/ files there"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
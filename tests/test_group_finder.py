@@ -0,0 +1,36 @@
+import pytest
+
+from cogs.group_finder import GroupFinder
+
+
+@pytest.fixture
+def finder(data_dir):
+    finder = GroupFinder(bot=None)
+    finder.game_roles = {'1': {'games': {name: {'name': name.title(), 'role_id': i} for i, name in enumerate([
+        'valorant', 'overwatch 2', 'counter-strike 2', 'dota 2', 'destiny 2', 'fifa 23'
+    ])}}}
+    return finder
+
+
+@pytest.mark.parametrize('typed, expected', [
+    ('valorant 5', ('valorant', 5)),
+    ('Valorant', ('Valorant', None)),
+    ('Overwatch 2', ('Overwatch 2', None)),
+    ('Counter-Strike 2', ('Counter-Strike 2', None)),
+    ('Dota 2', ('Dota 2', None)),
+    ('Destiny 2', ('Destiny 2', None)),
+    ('FIFA 23', ('FIFA 23', None)),
+    ('Overwatch 2 5', ('Overwatch 2', 5)),
+    ('fifa 23 4', ('fifa 23', 4)),
+])
+def test_names_ending_in_a_digit(finder, typed, expected):
+    assert finder.split_group_size('1', typed) == expected
+
+
+def test_number_that_cannot_be_a_size_stays_in_the_name(finder):
+    assert finder.split_group_size('1', 'Battlefield 2042') == ('Battlefield 2042', None)
+
+
+def test_out_of_range_size_for_a_known_game_is_still_a_size(finder):
+    # Reported back to the player as an invalid size rather than an unknown game
+    assert finder.split_group_size('1', 'valorant 40') == ('valorant', 40)
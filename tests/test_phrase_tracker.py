@@ -0,0 +1,34 @@
+from cogs.phrase_tracker import PhraseTracker
+
+
+def make_tracker(phrases):
+    tracker = PhraseTracker(bot=None)
+    tracker.tracked_phrases = {'1': {'2': {'phrases': {
+        phrase: {'count': 0, **options} for phrase, options in phrases.items()
+    }}}}
+    return tracker
+
+
+def test_nested_phrases_are_each_counted(data_dir):
+    tracker = make_tracker({'gg': {'mode': 'word'}, 'gg wp': {'mode': 'word'}})
+    assert tracker.find_phrases('1', '2', 'gg wp everyone') == {'gg': 1, 'gg wp': 1}
+
+
+def test_overlapping_substring_phrases(data_dir):
+    tracker = make_tracker({'lol': {}, 'lolol': {}})
+    assert tracker.find_phrases('1', '2', 'lolol') == {'lol': 1, 'lolol': 1}
+
+
+def test_count_all_counts_every_occurrence(data_dir):
+    tracker = make_tracker({'gg': {'mode': 'word', 'count_all': True}, 'gg wp': {'mode': 'word'}})
+    assert tracker.find_phrases('1', '2', 'gg wp, gg again') == {'gg': 2, 'gg wp': 1}
+
+
+def test_whole_word_mode_skips_partial_words(data_dir):
+    tracker = make_tracker({'gg': {'mode': 'word'}})
+    assert tracker.find_phrases('1', '2', 'eggs') == {}
+
+
+def test_phrases_without_mode_match_substrings(data_dir):
+    tracker = make_tracker({'gg': {}})
+    assert tracker.find_phrases('1', '2', 'eggs') == {'gg': 1}
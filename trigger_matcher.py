@@ -0,0 +1,102 @@
+from collections import deque
+
+
+class TriggerMatcher:
+    """Aho-Corasick automaton that finds every pattern in a text with one scan.
+
+    Below AUTOMATON_THRESHOLD patterns, str's C substring search beats a
+    Python-level automaton walk, so small sets are checked pattern by pattern.
+    """
+
+    AUTOMATON_THRESHOLD = 64
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        self.use_automaton = len(self.patterns) > self.AUTOMATON_THRESHOLD
+        self.goto = [{}]  # state -> {char: next state}
+        self.fail = [0]
+        self.output = [()]  # state -> indexes of patterns ending here
+        if self.use_automaton:
+            self.build()
+
+    def build(self):
+        """Build the trie, then the fail links"""
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                state = next_state
+            self.output[state] += (index,)
+
+        # Breadth-first so every fail link points at an already finished state
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.output[next_state] += self.output[self.fail[next_state]]
+
+    def find(self, text):
+        """Return the indexes of every pattern that occurs in text"""
+        if not self.use_automaton:
+            return {index for index, pattern in enumerate(self.patterns) if pattern and pattern in text}
+
+        goto = self.goto
+        fail = self.fail
+        output = self.output
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+
+if __name__ == '__main__':
+    # Benchmark: one automaton scan against the per-trigger loop InsultSystem used to run
+    import random
+    import string
+    import timeit
+
+    random.seed(42)
+    words = [''.join(random.choices(string.ascii_lowercase, k=random.randint(3, 9))) for _ in range(5000)]
+    messages = [' '.join(random.choices(words, k=random.randint(5, 40))).capitalize() for _ in range(1000)]
+
+    for count in (10, 100, 1000):
+        triggers = random.sample(words, count)
+
+        def naive():
+            for content in messages:
+                for trigger in triggers:
+                    if trigger.lower() in content.lower():
+                        break
+
+        matcher = TriggerMatcher(triggers)
+        automaton = TriggerMatcher(triggers)
+        if not automaton.use_automaton:
+            automaton.use_automaton = True
+            automaton.build()
+
+        def timed(func):
+            return min(timeit.repeat(func, number=1, repeat=5)) / len(messages) * 1e6
+
+        naive_time = timed(naive)
+        matcher_time = timed(lambda: [matcher.find(content.lower()) for content in messages])
+        automaton_time = timed(lambda: [automaton.find(content.lower()) for content in messages])
+        print(f"{count:>5} triggers: loop {naive_time:7.1f} us/msg | "
+              f"matcher {matcher_time:7.1f} us/msg | automaton only {automaton_time:7.1f} us/msg")